@@ -0,0 +1,97 @@
+"""
+Benchmarks for loading and serializing bibliographic items.
+
+They run offline against the fixture corpus in ``relaton/tests/static/data``
+(one subdirectory per relaton-data source).
+Each benchmark module can be run directly, e.g.::
+
+    python -m relaton.benchmarks.bulk
+"""
+
+import gc
+import os
+import time
+import tracemalloc
+from itertools import cycle, islice
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+import yaml
+
+from ..io import load_items, iter_documents
+from ..models.bibdata import BibliographicItem
+
+__all__ = (
+    'FIXTURES_DIR',
+    'SCHEMA_PATH',
+    'fixture_data',
+    'fixture_items',
+    'fixture_yaml',
+    'best_of',
+    'retained_memory',
+)
+
+
+T = TypeVar('T')
+
+
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    'tests', 'static', 'data')
+"""Fixture corpus used by benchmarks."""
+
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    'tests', 'static', 'schemas', 'v3.xsd')
+"""xml2rfc v3 schema used by tests, which serializations are validated
+against."""
+
+
+def fixture_data(count: int) -> List[Dict[str, Any]]:
+    """Returns ``count`` raw item dictionaries,
+    cycling through the fixture corpus."""
+    documents = [data for _, _, data in iter_documents(FIXTURES_DIR)]
+    return list(islice(cycle(documents), count))
+
+
+def fixture_items(count: int) -> List[BibliographicItem]:
+    """Returns ``count`` validated items,
+    cycling through the fixture corpus."""
+    return list(islice(cycle(list(load_items(FIXTURES_DIR))), count))
+
+
+def fixture_yaml(count: int) -> str:
+    """Returns a YAML stream of ``count`` documents,
+    cycling through the fixture corpus.
+
+    Loading it parses every document anew, so that unlike
+    with :func:`.fixture_data()`, no strings are shared between items
+    (as when loading a real corpus).
+    """
+    return yaml.safe_dump_all(fixture_data(count), allow_unicode=True)
+
+
+def best_of(func: Callable[[], Any], repeat: int = 3) -> float:
+    """Calls ``func`` ``repeat`` times and returns
+    the fastest wall-clock duration in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def retained_memory(func: Callable[[], T]) -> Tuple[T, int]:
+    """Calls ``func`` and returns its result
+    and the number of bytes allocated during the call
+    that are still held afterwards (i.e., retained by the result)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, retained
@@ -0,0 +1,80 @@
+"""
+Measures memory retained per loaded item with abstracts kept inline,
+and in an :class:`relaton.io.abstracts.AbstractStore` in memory
+(whose compressed blobs are counted as retained) and in a file::
+
+    python -m relaton.benchmarks.abstracts --items 2000 --paragraphs 4
+
+Few fixture items have abstracts, and those are short,
+so every document is given a synthetic HTML abstract of given
+number of paragraphs, made of words from the fixture corpus.
+"""
+
+import argparse
+import io
+import os
+import random
+import re
+import tempfile
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+from ..io import AbstractStore, load_items
+from . import fixture_data, retained_memory
+
+
+def synthetic_abstract(
+    words: List[str],
+    paragraphs: int,
+    rng: random.Random,
+) -> Dict[str, Any]:
+    """Returns a raw HTML abstract of given number of paragraphs
+    of about 80 words each."""
+    content = ''.join(
+        f"<p>{' '.join(rng.choices(words, k=rng.randint(60, 100)))}.</p>"
+        for _ in range(paragraphs))
+    return {'content': content, 'format': 'text/html', 'language': 'en'}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--paragraphs', type=int, default=4)
+    args = parser.parse_args(argv)
+
+    documents = fixture_data(args.items)
+    words = sorted(set(re.findall(r'[a-z]{2,}', str(documents[:20]))))
+    rng = random.Random(0)
+    stream = yaml.safe_dump_all([
+        {**data, 'abstract': synthetic_abstract(words, args.paragraphs, rng)}
+        for data in documents
+    ], allow_unicode=True)
+
+    def load(store: Optional[AbstractStore]) -> Callable[[], Any]:
+        return lambda: (
+            list(load_items(io.StringIO(stream), abstracts=store)),
+            store)
+
+    print(f"{args.items} items, {args.paragraphs}-paragraph abstracts")
+    baseline = None
+    with tempfile.TemporaryDirectory() as tmpdir, \
+            AbstractStore() as store, \
+            AbstractStore(os.path.join(tmpdir, 'abstracts')) as file_store:
+        for label, func in (
+            ('inline', load(None)),
+            ('AbstractStore()', load(store)),
+            ('AbstractStore(path)', load(file_store)),
+        ):
+            (items, _), retained = retained_memory(func)
+            per_item = retained / len(items)
+            baseline = baseline or per_item
+            print(f"{label:<24} {per_item:>8.0f} B/item "
+                  f"{per_item / baseline:>6.0%}")
+        print(f"{len(store)} abstracts stored, "
+              f"{store.original_bytes / 2 ** 20:.2f} MiB "
+              f"compressed to {store.compressed_bytes / 2 ** 20:.2f} MiB")
+
+
+if __name__ == '__main__':
+    main()
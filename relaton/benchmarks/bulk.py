@@ -0,0 +1,65 @@
+"""
+Measures how :func:`relaton.serializers.bibxml.serialize_many()`
+scales with the number of worker processes::
+
+    python -m relaton.benchmarks.bulk --items 20000 --workers 1 2 4 8
+
+Speedup is relative to serializing with one worker, i.e. in process,
+which is always measured.
+"""
+
+import argparse
+import os
+from collections import deque
+from typing import List, Optional
+
+from ..serializers.bibxml.bulk import serialize_many, shutdown_pool
+from . import best_of, fixture_items
+
+
+def main(argv: Optional[List[str]] = None):
+    cpus = os.cpu_count() or 1
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--chunksize', type=int, default=32)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--workers', type=int, nargs='+',
+        default=sorted(set([1, 2, 4, 8, 16, 32, cpus]) & set(range(1, cpus + 1))),
+        help="Worker counts to try (default: powers of two up to CPU count)")
+    args = parser.parse_args(argv)
+
+    items = fixture_items(args.items)
+
+    print(f"{args.items} items, chunksize {args.chunksize}, {cpus} CPUs")
+    print(f"{'workers':>8} {'seconds':>9} {'items/s':>9} "
+          f"{'speedup':>8} {'efficiency':>10}")
+
+    # Speedups are relative to a real single-worker run
+    worker_counts = [1] + [w for w in args.workers if w != 1]
+
+    baseline: Optional[float] = None
+    for workers in worker_counts:
+        def run():
+            deque(serialize_many(
+                items,
+                workers=workers,
+                chunksize=args.chunksize,
+            ), maxlen=0)
+
+        # Start up and warm the pool outside of measurements
+        run()
+        seconds = best_of(run, args.repeat)
+
+        if baseline is None:
+            baseline = seconds
+        speedup = baseline / seconds
+        print(f"{workers:>8} {seconds:>9.3f} {args.items / seconds:>9.0f} "
+              f"{speedup:>8.2f} {speedup / workers:>10.0%}")
+
+        shutdown_pool()
+
+
+if __name__ == '__main__':
+    main()
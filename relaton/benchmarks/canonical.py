@@ -0,0 +1,61 @@
+"""
+Compares loading and serializing bibliographic items
+as given, and with single-or-list properties canonicalized to lists
+(:func:`relaton.models.canonical.canonicalize()`)::
+
+    python -m relaton.benchmarks.canonical --items 5000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..models.bibdata import BibliographicItem
+from ..models.canonical import load_canonical
+from ..serializers.bibxml import serialize
+from . import fixture_data
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    documents = fixture_data(args.items)
+
+    modes: Tuple[Tuple[str, Callable[[Dict[str, Any]], Any]], ...] = (
+        ('as given', lambda data: BibliographicItem(**data)),
+        ('canonicalized', load_canonical),
+    )
+
+    print(f"{args.items} items")
+    print(f"{'':<16} {'load, s':>8} {'serialize, s':>12} "
+          f"{'total, s':>8} {'items/s':>9}")
+    for label, load in modes:
+        load_time, serialize_time = _best_timings(
+            documents, load, args.repeat)
+        total = load_time + serialize_time
+        print(f"{label:<16} {load_time:>8.3f} {serialize_time:>12.3f} "
+              f"{total:>8.3f} {args.items / total:>9.0f}")
+
+
+def _best_timings(
+    documents: List[Dict[str, Any]],
+    load: Callable[[Dict[str, Any]], Any],
+    repeat: int,
+) -> Tuple[float, float]:
+    load_timings, serialize_timings = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        items = [load(data) for data in documents]
+        loaded = time.perf_counter()
+        for item in items:
+            serialize(item)
+        load_timings.append(loaded - start)
+        serialize_timings.append(time.perf_counter() - loaded)
+    return min(load_timings), min(serialize_timings)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Measures memory retained per loaded item
+with and without :func:`relaton.models.compact.compact()`
+(and with a :class:`relaton.io.interning.StringTable` on top)::
+
+    python -m relaton.benchmarks.compact --items 2000
+"""
+
+import argparse
+import io
+from typing import Any, Callable, List, Optional
+
+from ..io import StringTable, load_items
+from ..models.compact import load_compact
+from . import fixture_yaml, retained_memory
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    stream = fixture_yaml(args.items)
+
+    def load(**kwargs: Any) -> Callable[[], List[Any]]:
+        return lambda: list(load_items(io.StringIO(stream), **kwargs))
+
+    print(f"{args.items} items")
+    baseline = None
+    for label, func in (
+        ('regular', load()),
+        ('compact', load(factory=load_compact)),
+        ('compact + StringTable', load(
+            factory=load_compact,
+            strings=StringTable())),
+    ):
+        items, retained = retained_memory(func)
+        per_item = retained / len(items)
+        baseline = baseline or per_item
+        print(f"{label:<24} {per_item:>8.0f} B/item "
+              f"{per_item / baseline:>6.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Compares validating construction of bibliographic items
+with :func:`relaton.models.trusted.construct_trusted()`
+on pre-validated data (as stored with ``BibliographicItem.json()``)::
+
+    python -m relaton.benchmarks.construct --items 5000
+"""
+
+import argparse
+import json
+from typing import List, Optional
+
+from ..models.bibdata import BibliographicItem
+from ..models.trusted import construct_trusted
+from . import best_of, fixture_items
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    stored = [json.loads(item.json()) for item in fixture_items(args.items)]
+
+    validated = best_of(
+        lambda: [BibliographicItem(**data) for data in stored],
+        args.repeat)
+    trusted = best_of(
+        lambda: [construct_trusted(data) for data in stored],
+        args.repeat)
+
+    print(f"{args.items} items")
+    for label, seconds in (
+        ('BibliographicItem(**data)', validated),
+        ('construct_trusted(data)', trusted),
+    ):
+        print(f"{label:<28} {seconds:>8.3f} s "
+              f"{args.items / seconds:>9.0f} items/s "
+              f"{seconds / args.items * 1e6:>8.1f} µs/item")
+    print(f"speedup: {validated / trusted:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,784 @@
+"""
+Seeded synthetic corpora shaped like relaton-data sources,
+for measuring loading and serialization at realistic volume
+(hundreds of thousands of items) without network access::
+
+    for data in generate_documents(100000, seed=1, skew=2):
+        item = BibliographicItem(**data)
+
+or, writing a directory laid out like the fixture corpus
+(one subdirectory per source)::
+
+    python -m relaton.benchmarks.corpus --items 200000 --output /tmp/corpus
+
+Each source has a generator mimicking the shape of its items:
+
+- ``rfcs``: IETF and DOI docids, publisher, series and stream contributors,
+  relations to obsoleted and updated RFCs, stream, STD and RFC series.
+- ``ids``: versioned Internet-Draft docids, authors with initials
+  and affiliations, and a relation to each earlier version
+  (long histories).
+- ``ieee``: docids in the formats IEEE uses (standards, amendments,
+  drafts, ANSI and AIEE documents), trademark-scoped and DOI docids,
+  publisher contact addresses and copyright.
+- ``3gpp``: TR and TS docids with release and version, versions.
+- ``iana``: registry docids, and ``iana.org`` links
+  (which serializers treat specially).
+- ``w3c``: shortname and dated docids, editors, editions as relations.
+- ``nist``: NIST and NBS docids with DOIs, authors with forename lists,
+  places, and JATS abstracts.
+- ``rfcsubseries``: BCP, STD and FYI items including whole RFC items.
+
+Abstracts (HTML, JATS or plain text), author lists, I-D histories
+and subseries sizes are long-tailed; ``skew`` sets how long the tails are.
+The mix of sources is set with ``weights``
+(see :data:`.SOURCE_WEIGHTS` for the default).
+
+Item number ``i`` depends only on the seed, weights, skew and ``i``,
+so corpora of different sizes generated with the same parameters
+share their first items, and scaling curves can be measured
+on prefixes of one corpus.
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+__all__ = (
+    'SOURCE_WEIGHTS',
+    'GENERATORS',
+    'generate_documents',
+    'generate_document',
+    'write_corpus',
+    'main',
+)
+
+
+Document = Dict[str, Any]
+Generator = Callable[[random.Random, int, float], Document]
+
+
+SOURCE_WEIGHTS: Dict[str, float] = {
+    'ids': 0.40,
+    '3gpp': 0.20,
+    'rfcs': 0.12,
+    'nist': 0.10,
+    'ieee': 0.08,
+    'iana': 0.04,
+    'w3c': 0.04,
+    'rfcsubseries': 0.02,
+}
+"""Default mix of sources, roughly as in relaton-data."""
+
+
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+WORDS = (
+    'access', 'address', 'algorithm', 'architecture', 'authentication',
+    'bandwidth', 'binding', 'block', 'cache', 'capability', 'channel',
+    'client', 'congestion', 'connection', 'control', 'data', 'datagram',
+    'delivery', 'discovery', 'domain', 'encoding', 'encryption',
+    'extension', 'flow', 'format', 'frame', 'framework', 'gateway',
+    'header', 'identifier', 'interface', 'key', 'layer', 'link',
+    'management', 'media', 'message', 'metadata', 'mobile', 'model',
+    'multicast', 'name', 'network', 'node', 'option', 'packet',
+    'parameter', 'path', 'payload', 'policy', 'port', 'profile',
+    'protocol', 'provider', 'query', 'radio', 'record', 'registry',
+    'request', 'resource', 'response', 'route', 'routing', 'security',
+    'server', 'service', 'session', 'signal', 'stream', 'subscriber',
+    'system', 'terminal', 'time', 'traffic', 'transport', 'tunnel',
+    'usage', 'user', 'version', 'wireless',
+)
+
+GIVEN_NAMES = (
+    'Alice', 'Bruno', 'Chen', 'Dmitri', 'Elena', 'Fatima', 'Gustavo',
+    'Hiroshi', 'Ingrid', 'Jana', 'Kwame', 'Lucia', 'Martin', 'Nadia',
+    'Olivier', 'Priya', 'Qiang', 'Rosa', 'Sven', 'Tomoko', 'Uma',
+    'Viktor', 'Wei', 'Ximena', 'Yusuf', 'Zofia',
+)
+
+SURNAMES = (
+    'Abadi', 'Bormann', 'Carpenter', 'Deering', 'Eastlake', 'Farrell',
+    'Gont', 'Housley', 'Iyengar', 'Jennings', 'Kent', 'Li', 'Mankin',
+    'Nottingham', 'Ott', 'Perkins', 'Rescorla', 'Schinazi', 'Thomson',
+    'Urien', 'Vasseur', 'Wood', 'Xu', 'Yegin', 'Zhang',
+)
+
+AFFILIATIONS = (
+    'Akamai', 'Apple', 'Cisco', 'Cloudflare', 'Ericsson', 'Fastly',
+    'Google', 'Huawei', 'Juniper', 'Meta', 'Microsoft', 'Mozilla',
+    'Nokia', 'Orange', 'Siemens', 'Tsinghua University',
+)
+
+WORKING_GROUPS = (
+    'core', 'dnsop', 'httpbis', 'idr', 'ippm', 'lamps', 'lsr', 'mls',
+    'netconf', 'opsawg', 'quic', 'rtgwg', 'sidrops', 'spring', 'tls',
+)
+
+
+def generate_documents(
+    count: int,
+    seed: int = 0,
+    weights: Optional[Dict[str, float]] = None,
+    skew: float = 1.0,
+) -> Iterator[Document]:
+    """Lazily yields ``count`` raw item documents.
+
+    :param weights: relative frequencies of sources
+                    (keys of :data:`.GENERATORS`),
+                    by default :data:`.SOURCE_WEIGHTS`.
+    :param skew: length of tails of long-tailed sizes.
+                 ``0`` makes every item as large as is typical
+                 for its source, higher values make large items
+                 larger and more frequent.
+    :raises KeyError: if a source is unknown.
+    """
+    for _, data in _generate(count, seed, weights, skew):
+        yield data
+
+
+def generate_document(
+    index: int,
+    seed: int = 0,
+    weights: Optional[Dict[str, float]] = None,
+    skew: float = 1.0,
+) -> Tuple[str, Document]:
+    """Returns source name and raw document of item number ``index``
+    of the corpus :func:`.generate_documents()` yields."""
+    sources, cumulative = _mix(weights)
+    return _generate_one(index, seed, sources, cumulative, skew)
+
+
+def write_corpus(
+    directory: str,
+    count: int,
+    seed: int = 0,
+    weights: Optional[Dict[str, float]] = None,
+    skew: float = 1.0,
+    per_file: bool = True,
+) -> Dict[str, int]:
+    """Writes a generated corpus to given directory
+    (created if needed), with a subdirectory per source,
+    and returns item counts by source.
+
+    :param per_file: write each item to its own file, named after its ID,
+                     as relaton-data repositories do.
+                     Otherwise, items of each source are written
+                     as one multi-document YAML stream,
+                     which is faster to write and to read.
+    """
+    counts: Dict[str, int] = {}
+    streams: Dict[str, Any] = {}
+    try:
+        for source, data in _generate(count, seed, weights, skew):
+            if source not in counts:
+                counts[source] = 0
+                os.makedirs(os.path.join(directory, source), exist_ok=True)
+            counts[source] += 1
+            if per_file:
+                path = os.path.join(directory, source, f"{data['id']}.yaml")
+                with open(path, 'w', encoding='utf-8') as f:
+                    _dump(data, f)
+            else:
+                if source not in streams:
+                    streams[source] = open(
+                        os.path.join(directory, source, 'items.yaml'),
+                        'w', encoding='utf-8')
+                _dump(data, streams[source])
+    finally:
+        for stream in streams.values():
+            stream.close()
+    return counts
+
+
+def _dump(data: Document, stream: Any):
+    stream.write('---\n')
+    yaml.dump(
+        data, stream,
+        Dumper=YAML_DUMPER,
+        allow_unicode=True,
+        sort_keys=False)
+
+
+def _generate(
+    count: int,
+    seed: int,
+    weights: Optional[Dict[str, float]],
+    skew: float,
+) -> Iterator[Tuple[str, Document]]:
+    sources, cumulative = _mix(weights)
+    for index in range(count):
+        yield _generate_one(index, seed, sources, cumulative, skew)
+
+
+def _mix(
+    weights: Optional[Dict[str, float]],
+) -> Tuple[List[str], List[float]]:
+    weights = weights or SOURCE_WEIGHTS
+    for source in weights:
+        if source not in GENERATORS:
+            raise KeyError(f"Unknown source: {source}")
+    sources = [source for source, weight in weights.items() if weight > 0]
+    if not sources:
+        raise ValueError("No source has a positive weight")
+    total = 0.0
+    cumulative = []
+    for source in sources:
+        total += weights[source]
+        cumulative.append(total)
+    return sources, cumulative
+
+
+def _generate_one(
+    index: int,
+    seed: int,
+    sources: List[str],
+    cumulative: List[float],
+    skew: float,
+) -> Tuple[str, Document]:
+    # Seeded per item, so that items don’t depend on count
+    rng = random.Random(f'{seed}:{index}')
+    (source, ) = rng.choices(sources, cum_weights=cumulative)
+    return source, GENERATORS[source](rng, index, skew)
+
+
+# Building blocks
+
+def _tail(rng: random.Random, typical: int, limit: int, skew: float) -> int:
+    """Returns a long-tailed size: ``typical`` or more, up to ``limit``."""
+    if skew <= 0:
+        return typical
+    return min(limit, int(typical * rng.paretovariate(2 / skew)))
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(count))
+
+
+def _title(rng: random.Random, language: bool = True) -> Document:
+    title: Document = {
+        'content': _words(rng, rng.randint(3, 10)).capitalize(),
+        'format': 'text/plain',
+    }
+    if language:
+        title.update(language=['en'], script=['Latn'])
+    else:
+        title['type'] = 'main'
+    return title
+
+
+def _paragraphs(rng: random.Random, skew: float) -> List[str]:
+    return [
+        '. '.join(
+            _words(rng, rng.randint(8, 20)).capitalize()
+            for _ in range(rng.randint(2, 6))
+        ) + '.'
+        for _ in range(_tail(rng, 2, 60, skew))
+    ]
+
+
+def _abstract(rng: random.Random, format: str, skew: float) -> Document:
+    paragraphs = _paragraphs(rng, skew)
+    if format == 'text/html':
+        content = ''.join(f'<p>{p}</p>' for p in paragraphs)
+    elif format == 'application/x-jats+xml':
+        content = ''.join(f'<jats:p>{p}</jats:p>' for p in paragraphs)
+    else:
+        content = '\n\n'.join(paragraphs)
+    return {
+        'content': content,
+        'language': ['en'],
+        'script': ['Latn'],
+        'format': format,
+    }
+
+
+def _date(
+    rng: random.Random,
+    type: str,
+    start: int,
+    end: int,
+    day: bool = True,
+) -> Document:
+    year, month = rng.randint(start, end), rng.randint(1, 12)
+    value = f'{year}-{month:02}'
+    if day:
+        value = f'{value}-{rng.randint(1, 28):02}'
+    return {'type': type, 'value': value}
+
+
+def _org(
+    name: str,
+    abbreviation: Optional[str] = None,
+    **extra: Any,
+) -> Document:
+    org: Document = {'name': [{'content': name}]}
+    if abbreviation:
+        org['abbreviation'] = {'content': abbreviation}
+    org.update(extra)
+    return org
+
+
+def _contributor(role: str, description: Optional[str] = None, **kwargs):
+    spec: Document = {'type': role}
+    if description:
+        spec['description'] = [{'content': description}]
+    return {**kwargs, 'role': [spec]}
+
+
+def _completename(rng: random.Random) -> Document:
+    return {'name': {'completename': {
+        'content': f'{rng.choice(GIVEN_NAMES)[0]}. {rng.choice(SURNAMES)}',
+        'language': ['en'],
+        'script': ['Latn'],
+    }}}
+
+
+def _full_person(rng: random.Random) -> Document:
+    given, surname = rng.choice(GIVEN_NAMES), rng.choice(SURNAMES)
+    return {
+        'name': {
+            'completename': {'content': f'{given} {surname}', 'language': ['en']},
+            'given': {'formatted_initials': {
+                'content': f'{given[0]}.',
+                'language': ['en'],
+            }},
+            'surname': {'content': surname, 'language': ['en']},
+        },
+        'affiliation': [{
+            'organization': {'name': [{
+                'content': rng.choice(AFFILIATIONS),
+            }]},
+        }],
+    }
+
+
+def _reference(docid: str, type: str, relation: str) -> Document:
+    return {
+        'type': relation,
+        'bibitem': {
+            'formattedref': {'content': docid, 'format': 'text/plain'},
+            'docid': [{'id': docid, 'type': type, 'primary': True}],
+        },
+    }
+
+
+def _series(title: str, number: Optional[str] = None, **extra: Any):
+    series: Document = {
+        **extra,
+        'title': {'content': title, 'format': 'text/plain'},
+    }
+    if number is not None:
+        series['number'] = number
+    return series
+
+
+def _base(id: str, title: Document, link: Document) -> Document:
+    return {
+        'schema-version': 'v1.2.3',
+        'id': id,
+        'title': [title],
+        'link': [link],
+        'type': 'standard',
+    }
+
+
+# Sources
+
+def _rfc(rng: random.Random, index: int, skew: float) -> Document:
+    number = index + 1
+    data = _base(
+        f'RFC{number:04}',
+        _title(rng),
+        {'content': f'https://www.rfc-editor.org/info/rfc{number}',
+         'type': 'src'})
+    data.update({
+        'docid': [
+            {'id': f'RFC {number}', 'type': 'IETF', 'primary': True},
+            {'id': f'10.17487/RFC{number:04}', 'type': 'DOI'},
+        ],
+        'docnumber': f'RFC{number:04}',
+        'date': [_date(rng, 'published', 1969, 2023, day=False)],
+        'contributor': [
+            *(_contributor('author', person=_completename(rng))
+              for _ in range(_tail(rng, 2, 40, skew))),
+            _contributor('publisher', organization=_org('RFC Publisher')),
+            _contributor('authorizer', organization=_org('RFC Series')),
+            _contributor(
+                'authorizer', 'Stream',
+                organization=_org(
+                    'Internet Engineering Task Force', 'IETF')),
+        ],
+        'language': ['en'],
+        'script': ['Latn'],
+        'abstract': [_abstract(rng, 'text/html', skew)],
+        'relation': [
+            _reference(
+                f'RFC{rng.randint(1, max(1, number)):04}', 'IETF',
+                rng.choice(('obsoletes', 'updates', 'updatedBy')))
+            for _ in range(_tail(rng, 1, 30, skew) - 1)
+        ],
+        'series': [
+            _series('IETF', type='stream'),
+            _series('RFC', str(number)),
+        ],
+        'keyword': [
+            {'content': _words(rng, rng.randint(1, 3))}
+            for _ in range(rng.randint(0, 5))
+        ],
+        'doctype': {'type': 'RFC'},
+    })
+    if rng.random() < 0.1:
+        data['series'].insert(1, _series('STD', str(rng.randint(1, 100))))
+    return data
+
+
+def _id(rng: random.Random, index: int, skew: float) -> Document:
+    name = (f'draft-ietf-{rng.choice(WORKING_GROUPS)}-'
+            f'{rng.choice(WORDS)}-{rng.choice(WORDS)}-{index}')
+    history = _tail(rng, 2, 100, skew)
+    version = f'{history - 1:02}'
+    data = _base(
+        f'{name}-{version}',
+        _title(rng),
+        {'content': f'https://datatracker.ietf.org/doc/html/{name}-{version}',
+         'type': 'src'})
+    data['link'].append({
+        'content': f'https://www.ietf.org/archive/id/{name}-{version}.txt',
+        'type': 'TXT',
+    })
+    data.update({
+        'docid': [{
+            'id': f'{name}-{version}',
+            'type': 'Internet-Draft',
+            'primary': True,
+        }],
+        'docnumber': f'I-D.{name[6:]}',
+        'date': [_date(rng, 'published', 1995, 2023)],
+        'contributor': [
+            _contributor(rng.choice(('author', 'editor')),
+                         person=_full_person(rng))
+            for _ in range(_tail(rng, 2, 30, skew))
+        ],
+        'language': ['en'],
+        'script': ['Latn'],
+        'abstract': [_abstract(rng, 'text/html', skew)],
+        'relation': [
+            _reference(f'{name}-{earlier:02}', 'Internet-Draft', 'updates')
+            for earlier in reversed(range(history - 1))
+        ],
+        'series': [_series(
+            'Internet-Draft', f'{name}-{version}', type='main')],
+        'version': [{'draft': version}],
+        'doctype': {'type': 'internet-draft'},
+    })
+    return data
+
+
+def _ieee_number(rng: random.Random, index: int) -> Tuple[str, str]:
+    """Returns a docid and the year it ends with."""
+    year = str(rng.randint(1950, 2023))
+    number = f'{rng.randint(1, 3000)}'
+    if rng.random() < 0.3:
+        number = f'{rng.choice(("802", "1003", "1394"))}.{rng.randint(1, 22)}'
+    shape = rng.random()
+    if shape < 0.55:
+        return f'IEEE {number}-{year}', year
+    if shape < 0.7:
+        return f'IEEE Std {number}{rng.choice("abcde")}-{year}', year
+    if shape < 0.8:
+        return f'ANSI/IEEE {number}-{year}', year
+    if shape < 0.9:
+        return f'AIEE {rng.randint(1, 99)}-{min(year, "1963")}', year
+    return f'IEEE P{number}/D{rng.randint(1, 12)}.{rng.randint(0, 9)}', year
+
+
+def _ieee(rng: random.Random, index: int, skew: float) -> Document:
+    docid, year = _ieee_number(rng, index)
+    article = 9000000 + index
+    data = _base(
+        f'IEEE{index}',
+        _title(rng, language=False),
+        {'content': f'https://ieeexplore.ieee.org/document/{article}',
+         'type': 'src'})
+    trademark = docid.replace(f'-{year}', f'™-{year}', 1)
+    data.update({
+        'docid': [
+            {'id': docid, 'type': 'IEEE', 'primary': True},
+            {'id': trademark, 'type': 'IEEE',
+             'scope': 'trademark', 'primary': True},
+            {'id': f'10.1109/IEEESTD.{year}.{article}', 'type': 'DOI'},
+        ],
+        'docnumber': docid,
+        'date': [
+            _date(rng, 'published', int(year), int(year) + 1),
+            _date(rng, 'issued', int(year), int(year)),
+        ],
+        'contributor': [_contributor('publisher', organization=_org(
+            'Institute of Electrical and Electronics Engineers', 'IEEE',
+            url='http://www.ieee.org',
+            contact=[{'address': {'city': 'New York', 'country': 'USA'}}],
+        ))],
+        'language': ['en'],
+        'script': ['Latn'],
+        'abstract': [_abstract(rng, 'text/plain', skew)],
+        'relation': [
+            _reference(_ieee_number(rng, index)[0], 'IEEE', 'obsoletes')
+            for _ in range(rng.randint(0, 2))
+        ],
+        'keyword': [
+            {'content': _words(rng, rng.randint(1, 3))}
+            for _ in range(rng.randint(0, 8))
+        ],
+        'copyright': [{
+            'owner': [{'name': [{'content': 'IEEE'}]}],
+            'from': int(year),
+        }],
+        'doctype': {'type': 'standard'},
+    })
+    return data
+
+
+def _3gpp(rng: random.Random, index: int, skew: float) -> Document:
+    kind = rng.choice(('TR', 'TS'))
+    release = rng.randint(3, 18)
+    version = f'{release}.{rng.randint(0, 9)}.{rng.randint(0, 9)}'
+    number = f'{rng.randint(21, 55)}.{rng.randint(100, 999)}'
+    docnumber = f'{kind} {number}:Rel-{release}/{version}'
+    data = _base(
+        f'3GPP{kind}{number}-{index}',
+        _title(rng, language=False),
+        {'content': (
+            f'http://www.3gpp.org/ftp/Specs/archive/'
+            f'{number[:2]}_series/{number}/{index}.zip'),
+         'type': 'src'})
+    data.update({
+        'docid': [{'id': f'3GPP {docnumber}', 'type': '3GPP', 'primary': True}],
+        'docnumber': docnumber,
+        'date': [_date(rng, 'published', 1998, 2023, day=False)],
+        'contributor': [_contributor('author', organization=_org(
+            '3rd Generation Partnership Project', '3GPP',
+            contact=[{'address': {
+                'city': 'Sophia Antipolis Cedex',
+                'country': 'France',
+            }}],
+        ))],
+        'language': ['en'],
+        'script': ['Latn'],
+        'version': [{'draft': version}],
+        'doctype': {'type': kind},
+    })
+    return data
+
+
+def _iana(rng: random.Random, index: int, skew: float) -> Document:
+    name = f'{rng.choice(WORDS)}-{rng.choice(WORDS)}-parameters-{index}'
+    data = _base(
+        f'IANA{name}',
+        _title(rng, language=False),
+        {'content': f'http://www.iana.org/assignments/{name}', 'type': 'src'})
+    data.update({
+        'docid': [{'id': f'IANA {name}', 'type': 'IANA', 'primary': True}],
+        'docnumber': name,
+        'date': [_date(rng, 'updated', 2000, 2023)],
+        'contributor': [_contributor('publisher', organization=_org(
+            'Internet Assigned Numbers Authority', 'IANA'))],
+        'language': ['en'],
+        'script': ['Latn'],
+        'doctype': {'type': 'registry'},
+    })
+    return data
+
+
+def _w3c(rng: random.Random, index: int, skew: float) -> Document:
+    shortname = f'{rng.choice(WORDS)}-{rng.choice(WORDS)}-{index}'
+    data = _base(
+        f'W3C{shortname}',
+        _title(rng, language=False),
+        {'content': f'https://www.w3.org/TR/{shortname}/', 'type': 'src'})
+    editions = rng.randint(0, _tail(rng, 2, 20, skew))
+    data.update({
+        'docid': [{'id': f'W3C {shortname}', 'type': 'W3C', 'primary': True}],
+        'docnumber': shortname,
+        'date': [_date(rng, 'published', 1996, 2023)],
+        'contributor': [
+            *(_contributor('editor', person={'name': {'completename': {
+                'content': (
+                    f'{rng.choice(GIVEN_NAMES)} {rng.choice(SURNAMES)}'),
+            }}}) for _ in range(_tail(rng, 2, 20, skew))),
+            _contributor('publisher', organization=_org(
+                'World Wide Web Consortium', 'W3C',
+                url='https://www.w3.org')),
+        ],
+        'language': ['en'],
+        'script': ['Latn'],
+        'relation': [
+            _reference(
+                f'W3C {rng.choice(("WD", "CR", "REC"))}-{shortname}-'
+                f'{rng.randint(1996, 2023)}{rng.randint(1, 12):02}'
+                f'{rng.randint(1, 28):02}',
+                'W3C', 'hasEdition')
+            for _ in range(editions)
+        ],
+        'series': [_series(
+            f'W3C {rng.choice(("WD", "CR", "REC", "NOTE"))}', type='main')],
+        'doctype': {'type': rng.choice(('recommendation', 'technicalReport'))},
+    })
+    return data
+
+
+def _nist(rng: random.Random, index: int, skew: float) -> Document:
+    if rng.random() < 0.2:
+        publisher, abbreviation, series = (
+            'National Bureau of Standards', 'NBS', 'BH')
+        year_range = (1901, 1988)
+    else:
+        publisher, abbreviation, series = (
+            'National Institute of Standards and Technology', 'NIST',
+            rng.choice(('SP', 'IR', 'TN', 'FIPS')))
+        year_range = (1988, 2023)
+    number = f'{rng.randint(1, 1999)}-{index}'
+    doi = f'10.6028/{abbreviation}.{series}.{number}'
+    data = _base(
+        f'{abbreviation}{series}{number}',
+        _title(rng),
+        {'content': f'https://doi.org/{doi}', 'type': 'doi'})
+    data['link'].append({
+        'content': (
+            f'https://nvlpubs.nist.gov/nistpubs/{series}/'
+            f'{abbreviation}.{series}.{number}.pdf'),
+        'type': 'pdf',
+    })
+    data.update({
+        'docid': [
+            {'id': f'{abbreviation} {series} {number}', 'type': 'NIST',
+             'primary': True},
+            {'id': doi, 'type': 'DOI'},
+        ],
+        'docnumber': f'{abbreviation}.{series}.{number}',
+        'date': [_date(rng, 'published', *year_range, day=False)],
+        'contributor': [
+            _contributor('publisher', organization=_org(
+                publisher, abbreviation)),
+            *(_contributor('author', person={
+                'name': {
+                    'given': {'forename': [
+                        {'content': rng.choice(GIVEN_NAMES),
+                         'language': ['en']}
+                        for _ in range(rng.randint(1, 2))
+                    ]},
+                    'surname': {
+                        'content': rng.choice(SURNAMES),
+                        'language': ['en'],
+                    },
+                },
+                'affiliation': [{'organization': _org(publisher)}],
+            }) for _ in range(_tail(rng, 2, 60, skew))),
+        ],
+        'language': ['en'],
+        'script': ['Latn'],
+        'abstract': [_abstract(rng, 'application/x-jats+xml', skew)],
+        'place': ['Gaithersburg, MD'],
+        'series': [_series(
+            f'{abbreviation} {series}',
+            str(rng.randint(1, 2000)),
+            abbrev=series)],
+        'doctype': {'type': 'standard'},
+    })
+    return data
+
+
+def _rfc_subseries(rng: random.Random, index: int, skew: float) -> Document:
+    series = rng.choice(('BCP', 'STD', 'FYI'))
+    number = index + 1
+    data = _base(
+        f'{series}{number:04}',
+        _title(rng, language=False),
+        {'content': f'https://www.rfc-editor.org/info/{series.lower()}{number}',
+         'type': 'src'})
+    constituents = []
+    # Distinct, since constituents’ anchors must be unique
+    for rfc_number in rng.sample(range(1, 10000), _tail(rng, 1, 40, skew)):
+        rfc = _rfc(rng, rfc_number - 1, skew)
+        # As in relaton-data, without some of RFC item’s properties
+        for key in ('schema-version', 'abstract', 'relation', 'series'):
+            rfc.pop(key)
+        constituents.append({'type': 'includes', 'bibitem': rfc})
+    data.update({
+        'docid': [{'id': f'{series} {number}', 'type': 'IETF', 'primary': True}],
+        'docnumber': f'{series}{number:04}',
+        'language': ['en'],
+        'script': ['Latn'],
+        'relation': constituents,
+        'doctype': {'type': series},
+    })
+    return data
+
+
+GENERATORS: Dict[str, Generator] = {
+    'rfcs': _rfc,
+    'rfcsubseries': _rfc_subseries,
+    'ids': _id,
+    'ieee': _ieee,
+    'w3c': _w3c,
+    '3gpp': _3gpp,
+    'iana': _iana,
+    'nist': _nist,
+}
+"""Item generators keyed by source, named after fixture
+(and relaton-data) directories. Each takes a seeded random generator,
+item number and skew, and returns a raw item document."""
+
+
+def _weights(specs: List[str]) -> Dict[str, float]:
+    weights = {}
+    for spec in specs:
+        source, _, weight = spec.partition('=')
+        weights[source] = float(weight or 1)
+    return weights
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skew', type=float, default=1.0)
+    parser.add_argument(
+        '--weights', nargs='+', metavar='SOURCE=WEIGHT',
+        help="Mix of sources (default: "
+             + ' '.join(f'{s}={w}' for s, w in SOURCE_WEIGHTS.items())
+             + ")")
+    parser.add_argument(
+        '--output', '-o', default='-',
+        help="Directory to write the corpus to, "
+             "or - for a YAML stream on standard output (default)")
+    parser.add_argument(
+        '--streams', action='store_true',
+        help="Write one YAML stream per source instead of a file per item")
+    args = parser.parse_args(argv)
+
+    weights = _weights(args.weights) if args.weights else None
+
+    if args.output == '-':
+        for data in generate_documents(
+            args.items, args.seed, weights, args.skew,
+        ):
+            _dump(data, sys.stdout)
+        return
+
+    counts = write_corpus(
+        args.output, args.items, args.seed, weights, args.skew,
+        per_file=not args.streams)
+    for source, count in sorted(counts.items()):
+        print(f"{source:<14} {count:>9} items", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Compares relaxed date validation strategies
+on a realistic mix of date strings::
+
+    python -m relaton.benchmarks.dates --values 100000
+
+The mix is drawn (with a fixed seed) from the shapes found in relaton-data:
+mostly full dates and ``YYYY-MM``, then ``Month YYYY``, ``YYYY``,
+and a few strings that fail to parse.
+
+If NumPy is installed, batch parsing
+with :func:`relaton.models.datearrays.parse_relaxed_dates()`
+is measured as well.
+"""
+
+import argparse
+import random
+from typing import Callable, List, Optional, Tuple
+
+from ..models import dates
+from ..models.datearrays import parse_relaxed_dates
+from . import best_of
+
+MONTHS = (
+    'January', 'February', 'March', 'April', 'May', 'June', 'July',
+    'August', 'September', 'October', 'November', 'December',
+)
+
+SHAPES: Tuple[Tuple[float, Callable[[random.Random], str]], ...] = (
+    (0.40, lambda r: (
+        f'{r.randint(1960, 2023)}-{r.randint(1, 12):02}'
+        f'-{r.randint(1, 28):02}')),
+    (0.30, lambda r: f'{r.randint(1960, 2023)}-{r.randint(1, 12):02}'),
+    (0.17, lambda r: f'{r.choice(MONTHS)} {r.randint(1960, 2023)}'),
+    (0.10, lambda r: f'{r.randint(1900, 2023)}'),
+    (0.03, lambda r: r.choice(('n.d.', 'unknown', '2000/01/02'))),
+)
+
+
+def date_strings(count: int, seed: int = 0) -> List[str]:
+    """Returns ``count`` date strings in a realistic mix."""
+    rng = random.Random(seed)
+    weights = [weight for weight, _ in SHAPES]
+    return [
+        shape(rng)
+        for _, shape in rng.choices(SHAPES, weights=weights, k=count)
+    ]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--values', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    values = date_strings(args.values)
+
+    def run(validate):
+        return lambda: [validate(v) for v in values]
+
+    def cached(v):
+        try:
+            return dates.validate_relaxed_date(v)
+        except ValueError:
+            return None
+
+    strptime = best_of(
+        run(dates._validate_relaxed_date_strptime), args.repeat)
+    single_pass = best_of(
+        run(dates._validate_relaxed_date), args.repeat)
+    dates.clear_relaxed_date_cache()
+    with_cache = best_of(run(cached), args.repeat)
+
+    results = [
+        ('parse_date() + strptime()', strptime),
+        ('single pass', single_pass),
+        ('single pass, cached', with_cache),
+    ]
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        results.append(('batch (NumPy)', best_of(
+            lambda: parse_relaxed_dates(values, full_dates=True),
+            args.repeat)))
+
+    print(f"{args.values} values, "
+          f"{len(set(values))} distinct")
+    for label, seconds in results:
+        print(f"{label:<28} {seconds:>8.3f} s "
+              f"{seconds / args.values * 1e9:>8.0f} ns/value "
+              f"{strptime / seconds:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
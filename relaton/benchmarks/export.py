@@ -0,0 +1,48 @@
+"""
+Compares exporting items with Pydantic’s ``.dict()`` and ``.json()``
+and with :mod:`relaton.models.export`::
+
+    python -m relaton.benchmarks.export --items 5000
+"""
+
+import argparse
+import importlib.util
+import json
+from typing import Any, Callable, List, Optional, Tuple
+
+from ..models.export import _dumps, to_dict, to_json_bytes
+from . import best_of, fixture_items
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    items = fixture_items(args.items)
+
+    cases: List[Tuple[str, Callable[[], Any]]] = [
+        ('item.dict()', lambda: [item.dict() for item in items]),
+        ('to_dict(item)', lambda: [to_dict(item) for item in items]),
+        ('item.json()', lambda: [item.json() for item in items]),
+        ('json.loads(item.json())', lambda: [
+            json.loads(item.json()) for item in items]),
+        ('to_json_bytes(item)', lambda: [
+            to_json_bytes(item) for item in items]),
+        ('  without orjson', lambda: [
+            _dumps(to_dict(item)) for item in items]),
+    ]
+
+    orjson_available = importlib.util.find_spec('orjson') is not None
+    print(f"{args.items} items"
+          f"{'' if orjson_available else ' (orjson is not installed)'}")
+    for label, func in cases:
+        seconds = best_of(func, args.repeat)
+        print(f"{label:<28} {seconds:>8.3f} s "
+              f"{args.items / seconds:>9.0f} items/s "
+              f"{seconds / args.items * 1e6:>8.1f} µs/item")
+
+
+if __name__ == '__main__':
+    main()
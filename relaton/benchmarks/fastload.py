@@ -0,0 +1,46 @@
+"""
+Compares validating construction of bibliographic items through Pydantic
+with generated loaders (:func:`relaton.models.fastload.load_fast()`)
+on raw fixture data::
+
+    python -m relaton.benchmarks.fastload --items 5000
+"""
+
+import argparse
+from typing import List, Optional
+
+from ..models.bibdata import BibliographicItem
+from ..models.fastload import load_fast
+from . import best_of, fixture_data
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    documents = fixture_data(args.items)
+    # Generate loaders before timing
+    load_fast(documents[0])
+
+    pydantic = best_of(
+        lambda: [BibliographicItem(**data) for data in documents],
+        args.repeat)
+    generated = best_of(
+        lambda: [load_fast(data) for data in documents],
+        args.repeat)
+
+    print(f"{args.items} items")
+    for label, seconds in (
+        ('BibliographicItem(**data)', pydantic),
+        ('load_fast(data)', generated),
+    ):
+        print(f"{label:<28} {seconds:>8.3f} s "
+              f"{args.items / seconds:>9.0f} items/s "
+              f"{seconds / args.items * 1e6:>8.1f} µs/item")
+    print(f"speedup: {pydantic / generated:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Compares fingerprinting items with :mod:`relaton.models.fingerprint`
+against hashing sorted JSON dumps of ``.dict()``::
+
+    python -m relaton.benchmarks.fingerprint --items 5000
+"""
+
+import argparse
+import hashlib
+import json
+from typing import Any, Callable, List, Optional, Tuple
+
+from ..models.fingerprint import field_fingerprints, fingerprint
+from ..models.frozen import freeze
+from . import best_of, fixture_items
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    items = fixture_items(args.items)
+    frozen = [freeze(item) for item in items]
+    for item in frozen:
+        fingerprint(item)
+
+    cases: List[Tuple[str, Callable[[], Any]]] = [
+        ('sha256 of sorted JSON', lambda: [
+            hashlib.sha256(json.dumps(
+                item.dict(),
+                sort_keys=True,
+                default=str,  # Dataclass members, dates
+            ).encode('utf-8')).hexdigest()
+            for item in items
+        ]),
+        ('fingerprint(item)', lambda: [fingerprint(item) for item in items]),
+        ('field_fingerprints(item)', lambda: [
+            field_fingerprints(item) for item in items]),
+        ('fingerprint(frozen), cached', lambda: [
+            fingerprint(item) for item in frozen]),
+    ]
+
+    print(f"{args.items} items")
+    for label, func in cases:
+        seconds = best_of(func, args.repeat)
+        print(f"{label:<28} {seconds:>8.3f} s "
+              f"{seconds / args.items * 1e6:>8.1f} µs/item")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Measures validation time and memory retained per item
+with and without a :class:`relaton.io.flyweights.FlyweightRegistry`,
+on a synthetic corpus (see :mod:`relaton.benchmarks.corpus`)::
+
+    python -m relaton.benchmarks.flyweights --items 3000
+
+Documents are parsed anew before each run, outside of timings,
+so that only sharing and validation are timed, and no run
+sees descriptions already replaced by an earlier one.
+(The fixture corpus is not used, since cycling through it
+would make every item a duplicate.)
+"""
+
+import argparse
+import io
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from ..io import FlyweightRegistry, YAML_LOADER
+from ..models.bibdata import BibliographicItem
+from . import retained_memory
+from .corpus import generate_documents
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=3000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    stream = yaml.safe_dump_all(
+        generate_documents(args.items, seed=args.seed),
+        allow_unicode=True)
+
+    def parse() -> List[Dict[str, Any]]:
+        return list(yaml.load_all(io.StringIO(stream), Loader=YAML_LOADER))
+
+    def validate(
+        documents: List[Dict[str, Any]],
+        registry: Optional[FlyweightRegistry],
+    ) -> List[BibliographicItem]:
+        if registry is None:
+            return [BibliographicItem(**data) for data in documents]
+        return [
+            BibliographicItem(**registry.share_document(data))
+            for data in documents
+        ]
+
+    cases: Tuple[Tuple[str, Optional[Dict[str, bool]]], ...] = (
+        ('regular', None),
+        ('organizations', {}),
+        ('organizations, persons', {'persons': True}),
+    )
+    timings: Dict[str, List[float]] = {label: [] for label, _ in cases}
+    registries: Dict[str, Optional[FlyweightRegistry]] = {}
+    # Cases are interleaved, so that noise affects them alike
+    for _ in range(args.repeat):
+        for label, options in cases:
+            documents = parse()
+            registry = (
+                FlyweightRegistry(**options)
+                if options is not None
+                else None)
+            start = time.perf_counter()
+            validate(documents, registry)
+            timings[label].append(time.perf_counter() - start)
+            registries[label] = registry
+
+    print(f"{args.items} items")
+    print(f"{'':<24} {'validate, s':>11} {'B/item':>8} {'collapsed':>10} "
+          f"{'change':>7}")
+    baseline = min(timings['regular'])
+    for label, options in cases:
+        seconds = min(timings[label])
+        documents = parse()
+        items, retained = retained_memory(lambda: validate(
+            documents,
+            FlyweightRegistry(**options) if options is not None else None))
+        registry = registries[label]
+        collapsed = registry.collapsed if registry is not None else 0
+        print(f"{label:<24} {seconds:>11.3f} "
+              f"{retained / len(items):>8.0f} {collapsed:>10} "
+              f"{(seconds / baseline - 1) * 100:>+6.1f}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Measures freezing items with :func:`relaton.models.frozen.freeze()`
+and hashing frozen items, against deep-copying items
+(as code sharing mutable items has to)
+and keying items by their JSON::
+
+    python -m relaton.benchmarks.frozen --items 5000
+"""
+
+import argparse
+import copy
+from typing import Any, Callable, List, Optional, Tuple
+
+from ..models.frozen import freeze
+from . import best_of, fixture_items
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    items = fixture_items(args.items)
+    frozen = [freeze(item) for item in items]
+
+    def first_hash():
+        # Frozen anew, so that no hashes are cached
+        for item in [freeze(item) for item in items]:
+            hash(item)
+
+    cases: List[Tuple[str, Callable[[], Any]]] = [
+        ('copy.deepcopy(item)', lambda: [
+            copy.deepcopy(item) for item in items]),
+        ('freeze(item)', lambda: [freeze(item) for item in items]),
+        ('freeze(item) + hash', first_hash),
+        ('hash(frozen), cached', lambda: [hash(item) for item in frozen]),
+        ('set of item.json()', lambda: {item.json() for item in items}),
+        ('set of frozen, cached', lambda: set(frozen)),
+    ]
+
+    print(f"{args.items} items, {len(set(frozen))} distinct")
+    for label, func in cases:
+        seconds = best_of(func, args.repeat)
+        print(f"{label:<24} {seconds:>8.3f} s "
+              f"{seconds / args.items * 1e6:>8.1f} µs/item")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Measures memory retained by loaded items
+with and without a :class:`relaton.io.interning.StringTable`::
+
+    python -m relaton.benchmarks.interning --items 2000
+
+Every document is parsed from YAML anew, as it would be
+when loading a corpus, so that strings aren’t shared by accident.
+"""
+
+import argparse
+import io
+from typing import List, Optional, Tuple
+
+from ..io import StringTable, load_items
+from . import fixture_yaml, retained_memory
+
+
+def _measure(
+    stream: str,
+    strings: Optional[StringTable],
+) -> Tuple[int, int]:
+    """Loads items from given YAML stream and returns their count
+    and memory retained by them, in bytes."""
+    items, retained = retained_memory(
+        lambda: list(load_items(io.StringIO(stream), strings=strings)))
+    return len(items), retained
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    stream = fixture_yaml(args.items)
+
+    count, plain = _measure(stream, None)
+    strings = StringTable()
+    _, interned = _measure(stream, strings)
+
+    print(f"{count} items")
+    for label, retained in (
+        ('without interning', plain),
+        ('with StringTable', interned),
+    ):
+        print(f"{label:<20} {retained / 2 ** 20:>8.2f} MiB "
+              f"{retained / count:>8.0f} B/item")
+    print(f"{len(strings)} distinct strings, "
+          f"{strings.hits} replaced, "
+          f"{strings.saved_bytes / 2 ** 20:.2f} MiB reported saved")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares building an index of items by docid, title and date
+from fully validated items and from
+:class:`relaton.models.lazy.LazyBibliographicItem`\\ s::
+
+    python -m relaton.benchmarks.lazy --items 5000
+"""
+
+import argparse
+from typing import Any, Callable, Dict, List, Optional
+
+from ..models.bibdata import BibliographicItem
+from ..models.lazy import load_lazy
+from . import best_of, fixture_data
+
+
+def _index(
+    documents: List[Dict[str, Any]],
+    factory: Callable[[Dict[str, Any]], BibliographicItem],
+) -> Dict[str, Any]:
+    index = {}
+    for data in documents:
+        item = factory(data)
+        index[item.docid[0].id] = (item.title, item.date)
+    return index
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    documents = fixture_data(args.items)
+
+    validated = best_of(
+        lambda: _index(documents, lambda data: BibliographicItem(**data)),
+        args.repeat)
+    lazy = best_of(
+        lambda: _index(documents, load_lazy),
+        args.repeat)
+
+    print(f"{args.items} items, reading docid, title and date")
+    for label, seconds in (
+        ('BibliographicItem(**data)', validated),
+        ('load_lazy(data)', lazy),
+    ):
+        print(f"{label:<28} {seconds:>8.3f} s "
+              f"{args.items / seconds:>9.0f} items/s "
+              f"{seconds / args.items * 1e6:>8.1f} µs/item")
+    print(f"speedup: {validated / lazy:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
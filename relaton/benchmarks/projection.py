@@ -0,0 +1,46 @@
+"""
+Compares loading whole items from YAML with loading
+a projection onto the properties an index needs
+(``fields`` in :func:`relaton.io.load_items()`)::
+
+    python -m relaton.benchmarks.projection --items 2000 --fields docid title date
+"""
+
+import argparse
+import io
+from typing import List, Optional
+
+from ..io import load_items
+from . import best_of, fixture_yaml
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--fields', nargs='+', default=['docid', 'title', 'date'])
+    args = parser.parse_args(argv)
+
+    stream = fixture_yaml(args.items)
+
+    full = best_of(
+        lambda: list(load_items(io.StringIO(stream))),
+        args.repeat)
+    projected = best_of(
+        lambda: list(load_items(io.StringIO(stream), fields=args.fields)),
+        args.repeat)
+
+    print(f"{args.items} items, projecting onto {', '.join(args.fields)}")
+    for label, seconds in (
+        ('whole items', full),
+        ('projection', projected),
+    ):
+        print(f"{label:<28} {seconds:>8.3f} s "
+              f"{args.items / seconds:>9.0f} items/s "
+              f"{seconds / args.items * 1e6:>8.1f} µs/item")
+    print(f"speedup: {full / projected:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,327 @@
+"""
+Performance regression checks: fixed workloads over the fixture corpus
+compared with a committed baseline::
+
+    python -m relaton.benchmarks.regression           # Check
+    python -m relaton.benchmarks.regression --update  # Refresh baseline
+
+The unittest suite runs the same check
+when ``RELATON_PERF_TESTS`` is set::
+
+    RELATON_PERF_TESTS=1 python -m unittest relaton.tests.test_performance
+
+To be robust to noise and comparable across machines,
+each workload (see :data:`.WORKLOADS`) is timed against
+a pure-Python reference loop. Each sample times as many calls
+as needed to last at least :data:`.SAMPLE_SECONDS`, and is paired with
+a sample of the reference loop lasting about as long, taken right before it,
+so that frequency scaling and other load affect both alike.
+A workload’s ratio is the median of ratios of its samples to their pairs.
+The baseline stores the median ratio of several such measurements.
+
+A workload regresses if its ratio exceeds the baseline’s
+by more than the tolerance (:data:`.TOLERANCE` by default,
+or ``RELATON_PERF_TOLERANCE``) in every one of several measurements
+(see :func:`.find_regressions()`). Ratios still shift somewhat
+between Python versions and CPUs, so the baseline should be refreshed
+where checks are run, and whenever a change is meant to affect speed.
+"""
+
+import argparse
+import io
+import json
+import os
+import math
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .. import __version__
+from ..io import load_items
+from ..models.bibdata import BibliographicItem
+from ..serializers.bibxml import serialize
+from . import FIXTURES_DIR, fixture_data, fixture_yaml
+
+__all__ = (
+    'BASELINE_PATH',
+    'TOLERANCE',
+    'WORKLOAD_ITEMS',
+    'WORKLOADS',
+    'SAMPLE_SECONDS',
+    'measure',
+    'measure_baseline',
+    'compare',
+    'find_regressions',
+    'load_baseline',
+    'save_baseline',
+    'get_tolerance',
+    'main',
+)
+
+
+Workload = Callable[[], Callable[[], Any]]
+
+Regression = Tuple[float, float]
+"""Baseline ratio and measured ratio."""
+
+
+BASELINE_PATH = os.path.join(
+    os.path.dirname(FIXTURES_DIR), 'perf_baseline.json')
+"""Committed baseline, relative to fixtures."""
+
+TOLERANCE = 0.25
+"""Default allowed slowdown relative to baseline (25%)."""
+
+WORKLOAD_ITEMS = 200
+"""Number of items each workload processes per run,
+cycling through the fixture corpus."""
+
+SAMPLE_SECONDS = 0.1
+"""Minimum duration of each timed sample."""
+
+REPEAT = 11
+"""Default number of samples of each workload per measurement."""
+
+BASELINE_ROUNDS = 5
+"""Number of measurements whose median is stored as baseline."""
+
+RETRIES = 2
+"""Number of times regressed workloads are re-measured
+before being reported."""
+
+REFERENCE_ITERATIONS = 2000
+
+
+def _load_items() -> Callable[[], Any]:
+    stream = fixture_yaml(WORKLOAD_ITEMS)
+    return lambda: list(load_items(io.StringIO(stream)))
+
+
+def _construct() -> Callable[[], Any]:
+    documents = fixture_data(WORKLOAD_ITEMS)
+    return lambda: [BibliographicItem(**data) for data in documents]
+
+
+def _serialize() -> Callable[[], Any]:
+    items = [BibliographicItem(**data) for data in fixture_data(WORKLOAD_ITEMS)]
+    return lambda: [serialize(item) for item in items]
+
+
+WORKLOADS: Dict[str, Workload] = {
+    'load_items': _load_items,
+    'construct': _construct,
+    'serialize': _serialize,
+}
+"""Functions preparing a workload to time, keyed by name.
+
+- ``load_items``: loading items from a YAML stream.
+- ``construct``: validating raw items as ``BibliographicItem``\\ s.
+- ``serialize``: serializing items to BibXML.
+"""
+
+
+def _reference_loop():
+    """Pure-Python work of the same nature as the workloads’
+    (dictionaries, strings and lists), which is not
+    affected by changes to this package."""
+    total = 0
+    for i in range(REFERENCE_ITERATIONS):
+        data: Dict[str, Any] = {
+            'id': str(i),
+            'type': 'IETF',
+            'parts': [i, i + 1],
+        }
+        total += len(' '.join((data['type'], data['id']))) + len(data['parts'])
+    return total
+
+
+def _time(func: Callable[[], Any], number: int) -> float:
+    """Returns wall-clock duration of ``number`` calls of ``func``."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def _calls_for(func: Callable[[], Any], seconds: float) -> int:
+    """Returns the number of calls of ``func`` lasting at least ``seconds``
+    (and at least one)."""
+    number = 1
+    while (elapsed := _time(func, number)) < seconds:
+        number = max(
+            number * 2,
+            math.ceil(number * seconds / max(elapsed, 1e-9)))
+    return number
+
+
+def measure(
+    workloads: Optional[Sequence[str]] = None,
+    repeat: int = REPEAT,
+) -> Dict[str, float]:
+    """Times ``repeat`` samples of given workloads (by default, all),
+    and returns medians of ratios of each sample to a paired sample
+    of the reference loop, keyed by workload name.
+
+    :raises KeyError: if a workload is unknown.
+    """
+    names = list(workloads or WORKLOADS)
+    funcs = {name: WORKLOADS[name]() for name in names}
+
+    # Warm up caches and imports
+    for func in [_reference_loop, *funcs.values()]:
+        func()
+
+    # Number of calls of the workload and of the reference loop
+    # per sample, such that both last about as long
+    calls: Dict[str, Tuple[int, int]] = {}
+    for name, func in funcs.items():
+        number = _calls_for(func, SAMPLE_SECONDS)
+        duration = _time(func, number)
+        calls[name] = (number, _calls_for(_reference_loop, duration))
+
+    ratios: Dict[str, List[float]] = {name: [] for name in names}
+    for _ in range(repeat):
+        for name, func in funcs.items():
+            number, reference_number = calls[name]
+            reference = _time(_reference_loop, reference_number)
+            ratios[name].append(
+                (_time(func, number) / number)
+                / (reference / reference_number))
+
+    return {
+        name: round(statistics.median(samples), 3)
+        for name, samples in ratios.items()
+    }
+
+
+def measure_baseline(
+    workloads: Optional[Sequence[str]] = None,
+    repeat: int = REPEAT,
+    rounds: int = BASELINE_ROUNDS,
+) -> Dict[str, float]:
+    """Returns median ratios of ``rounds`` calls to :func:`.measure()`,
+    keyed by workload name."""
+    measurements = [measure(workloads, repeat) for _ in range(rounds)]
+    return {
+        name: round(statistics.median(m[name] for m in measurements), 3)
+        for name in measurements[0]
+    }
+
+
+def compare(
+    measured: Dict[str, float],
+    baseline: Dict[str, float],
+    tolerance: float = TOLERANCE,
+) -> Dict[str, Regression]:
+    """Returns workloads whose measured ratio exceeds the baseline’s
+    by more than ``tolerance`` (a fraction), with both ratios.
+
+    Workloads missing from the baseline are ignored.
+    """
+    return {
+        name: (baseline[name], ratio)
+        for name, ratio in measured.items()
+        if name in baseline and ratio > baseline[name] * (1 + tolerance)
+    }
+
+
+def find_regressions(
+    baseline: Dict[str, float],
+    workloads: Optional[Sequence[str]] = None,
+    tolerance: float = TOLERANCE,
+    repeat: int = REPEAT,
+    retries: int = RETRIES,
+) -> Tuple[Dict[str, float], Dict[str, Regression]]:
+    """Measures given workloads (by default, all) and compares them
+    with ``baseline``. Regressed workloads are re-measured up to ``retries``
+    times, keeping their lowest ratio, so that they are only reported
+    if they regressed in every measurement.
+
+    Returns measured ratios and regressions, as :func:`.compare()` does.
+    """
+    measured = measure(workloads, repeat)
+    regressions = compare(measured, baseline, tolerance)
+    for _ in range(retries):
+        if not regressions:
+            break
+        for name, ratio in measure(list(regressions), repeat).items():
+            measured[name] = min(measured[name], ratio)
+        regressions = compare(measured, baseline, tolerance)
+    return measured, regressions
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Any]:
+    """Returns baseline data with ``ratios`` keyed by workload name,
+    and the ``python`` version and ``platform`` they were measured on."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(
+    ratios: Dict[str, float],
+    path: str = BASELINE_PATH,
+):
+    with open(path, 'w') as f:
+        json.dump({
+            'version': __version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'ratios': ratios,
+        }, f, indent=2)
+        f.write('\n')
+
+
+def get_tolerance() -> float:
+    """Returns tolerance from ``RELATON_PERF_TOLERANCE``,
+    or :data:`.TOLERANCE`."""
+    return float(os.environ.get('RELATON_PERF_TOLERANCE', TOLERANCE))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m relaton.benchmarks.regression',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--workloads', nargs='+', choices=list(WORKLOADS),
+        help="Workloads to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument(
+        '--rounds', type=int, default=BASELINE_ROUNDS,
+        help="Measurements whose median is stored by --update")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=get_tolerance())
+    parser.add_argument(
+        '--update', action='store_true',
+        help="Write measured ratios to baseline instead of comparing")
+    args = parser.parse_args(argv)
+
+    if args.update:
+        measured = measure_baseline(
+            args.workloads, repeat=args.repeat, rounds=args.rounds)
+        if args.workloads and os.path.exists(args.baseline):
+            # Keep ratios of workloads that weren’t run
+            measured = {**load_baseline(args.baseline)['ratios'], **measured}
+        save_baseline(measured, args.baseline)
+        print(f"Updated {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)['ratios']
+    measured, regressions = find_regressions(
+        baseline, args.workloads,
+        tolerance=args.tolerance, repeat=args.repeat)
+    for name, ratio in measured.items():
+        expected = baseline.get(name)
+        change = (
+            f"{(ratio / expected - 1) * 100:+6.1f}%"
+            if expected else "    new")
+        status = "REGRESSED" if name in regressions else ""
+        print(f"{name:<12} {ratio:>9.3f} (baseline {expected}) "
+              f"{change} {status}".rstrip())
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
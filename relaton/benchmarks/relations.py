@@ -0,0 +1,57 @@
+"""
+Compares loading a subseries-like item, which includes
+a number of full items, with and without
+:func:`relaton.models.lazy.defer_relations()`::
+
+    python -m relaton.benchmarks.relations --constituents 10 100 1000
+"""
+
+import argparse
+from typing import Any, Callable, Dict, List, Optional
+
+from ..models.bibdata import BibliographicItem
+from ..models.lazy import defer_relations
+from . import best_of, fixture_data
+
+
+def subseries(constituents: int) -> Dict[str, Any]:
+    """Returns raw data of an item that includes
+    given number of fixture items."""
+    return {
+        'docid': [{'id': 'BCP 0', 'type': 'IETF', 'primary': True}],
+        'title': [{'content': 'Subseries', 'type': 'main'}],
+        'relation': [
+            {'type': 'includes', 'bibitem': data}
+            for data in fixture_data(constituents)
+        ],
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--constituents', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    cases: List[Any] = [
+        ('eager', lambda data: data),
+        ('defer_relations()', lambda data: defer_relations(data)),
+        ('defer_relations(stub)', lambda data: defer_relations(
+            data, stub=True)),
+    ]
+    print(f"{'constituents':<24}" + ''.join(
+        f"{count:>12}" for count in args.constituents))
+    for label, preprocess in cases:
+        timings = []
+        for count in args.constituents:
+            data = subseries(count)
+            load: Callable[[], Any] = (
+                lambda: BibliographicItem(**preprocess(dict(data))))
+            timings.append(best_of(load, args.repeat))
+        print(f"{label:<24}" + ''.join(
+            f"{seconds * 1e3:>10.1f}ms" for seconds in timings))
+
+
+if __name__ == '__main__':
+    main()
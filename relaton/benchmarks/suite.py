@@ -0,0 +1,369 @@
+"""
+A benchmark suite covering item construction and BibXML serialization,
+broken down by fixture source, with results as JSON::
+
+    python -m relaton.benchmarks > results.json
+    python -m relaton.benchmarks --cases serialize xsd_validation --samples 1000
+
+Each case (see :data:`.CASES`) times one operation on one fixture item
+at a time, such as creating ``<author>`` elements for all of an item’s
+authors. Samples cycle through items of each source
+(see :data:`.SOURCES`), skipping items a case doesn’t apply to
+(such as items without abstracts for ``create_abstract``).
+Relaxed date caches are cleared before each sample,
+so that results don’t depend on the order of samples.
+
+To measure on a larger corpus, generate one
+with :mod:`relaton.benchmarks.corpus` and pass its directory::
+
+    python -m relaton.benchmarks.corpus --items 50000 --streams -o corpus
+    python -m relaton.benchmarks --corpus corpus --samples 5000
+
+Results have the following shape::
+
+    {
+        "version": "0.2.33",     # Of this package
+        "python": "3.10.13",
+        "platform": "Linux-...",
+        "samples": 200,
+        "results": {
+            "serialize": {
+                "RFC": {
+                    "items": 2,             # Distinct items sampled
+                    "samples": 200,
+                    "items_per_second": 4312.5,
+                    "latency_us": {"min": ..., "p50": ..., "p90": ...,
+                                   "p99": ..., "max": ...}
+                },
+                ...,
+                "all": {...}        # All sources together
+            },
+            ...
+        }
+    }
+"""
+
+import argparse
+import functools
+import json
+import os
+import platform
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from lxml import etree
+
+from .. import __version__
+from ..io import iter_documents
+from ..models.bibdata import BibliographicItem
+from ..models.dates import clear_relaxed_date_cache, validate_relaxed_date
+from ..serializers.bibxml import serialize
+from ..serializers.bibxml.abstracts import create_abstract
+from ..serializers.bibxml.anchor import get_suitable_anchor
+from ..serializers.bibxml.authors import create_author, filter_contributors
+from ..serializers.bibxml.reference import create_reference
+from ..serializers.bibxml.series import DOCID_SERIES_EXTRACTORS
+from ..util import as_list
+from . import FIXTURES_DIR, SCHEMA_PATH
+
+__all__ = (
+    'CASES',
+    'SOURCES',
+    'SCHEMA_PATH',
+    'run_suite',
+    'latency_stats',
+    'main',
+)
+
+
+Operation = Callable[[], Any]
+Case = Callable[[Dict[str, Any]], Optional[Operation]]
+
+
+SOURCES: Dict[str, str] = {
+    'rfcs': 'RFC',
+    'rfcsubseries': 'RFC subseries',
+    'ids': 'I-D',
+    'ieee': 'IEEE',
+    'w3c': 'W3C',
+    '3gpp': '3GPP',
+    'iana': 'IANA',
+    'nist': 'NIST',
+    'misc': 'misc',
+}
+"""Source labels used in results, keyed by fixture directory."""
+
+
+PERCENTILES = (50, 90, 99)
+
+
+@functools.lru_cache(maxsize=None)
+def _schema() -> etree.XMLSchema:
+    return etree.XMLSchema(file=SCHEMA_PATH)
+
+
+def _construct(data: Dict[str, Any]) -> Optional[Operation]:
+    return lambda: BibliographicItem(**data)
+
+
+def _validate_relaxed_date(data: Dict[str, Any]) -> Optional[Operation]:
+    values = [
+        date['value']
+        for date in as_list(data.get('date'))
+        if isinstance(date, dict) and 'value' in date
+    ]
+    if not values:
+        return None
+    return lambda: [validate_relaxed_date(value) for value in values]
+
+
+def _create_reference(data: Dict[str, Any]) -> Optional[Operation]:
+    item = BibliographicItem(**data)
+    return lambda: create_reference(item)
+
+
+def _create_author(data: Dict[str, Any]) -> Optional[Operation]:
+    item = BibliographicItem(**data)
+    contributors = filter_contributors(as_list(item.contributor or []))
+    if not contributors:
+        return None
+    return lambda: [create_author(contributor) for contributor in contributors]
+
+
+def _create_abstract(data: Dict[str, Any]) -> Optional[Operation]:
+    item = BibliographicItem(**data)
+    abstracts = as_list(item.abstract or [])
+    if not abstracts:
+        return None
+    return lambda: create_abstract(abstracts)
+
+
+def _get_suitable_anchor(data: Dict[str, Any]) -> Optional[Operation]:
+    item = BibliographicItem(**data)
+    return lambda: get_suitable_anchor(item)
+
+
+def _docid_series(data: Dict[str, Any]) -> Optional[Operation]:
+    docids = BibliographicItem(**data).docid
+    return lambda: [
+        extract(docid)
+        for docid in docids
+        for extract in DOCID_SERIES_EXTRACTORS
+    ]
+
+
+def _serialize(data: Dict[str, Any]) -> Optional[Operation]:
+    item = BibliographicItem(**data)
+    return lambda: serialize(item)
+
+
+def _xsd_validation(data: Dict[str, Any]) -> Optional[Operation]:
+    element = serialize(BibliographicItem(**data))
+    schema = _schema()
+    return lambda: schema.validate(element)
+
+
+CASES: Dict[str, Case] = {
+    'construct': _construct,
+    'validate_relaxed_date': _validate_relaxed_date,
+    'create_reference': _create_reference,
+    'create_author': _create_author,
+    'create_abstract': _create_abstract,
+    'get_suitable_anchor': _get_suitable_anchor,
+    'docid_series': _docid_series,
+    'serialize': _serialize,
+    'xsd_validation': _xsd_validation,
+}
+"""Functions preparing an operation to time for given raw item,
+or returning ``None`` if the case doesn’t apply to it, keyed by case name.
+
+- ``construct``: validating the item as a ``BibliographicItem``.
+- ``validate_relaxed_date``: validating values of all its dates.
+- ``create_reference``, ``create_abstract``, ``get_suitable_anchor``:
+  calling these serializer functions for the item (or its abstracts).
+- ``create_author``: calling it for each of its authors.
+- ``docid_series``: calling each of ``DOCID_SERIES_EXTRACTORS``
+  on each docid.
+- ``serialize``: serializing the item end to end.
+- ``xsd_validation``: validating its serialization against
+  :data:`relaton.benchmarks.SCHEMA_PATH`.
+"""
+
+
+def run_suite(
+    cases: Optional[Sequence[str]] = None,
+    sources: Optional[Sequence[str]] = None,
+    samples: int = 200,
+    warmup: int = 20,
+    corpus: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Runs given cases (by default, all) on items of given sources
+    (fixture directories, by default all) and returns results
+    as described in module documentation.
+
+    :param samples: timed operations per case and source.
+    :param warmup: untimed operations per case and source
+                   run before timed ones.
+    :param corpus: directory with a subdirectory per source
+                   to sample instead of the fixture corpus,
+                   such as one written by
+                   :func:`relaton.benchmarks.corpus.write_corpus()`.
+                   Sources without a subdirectory are skipped.
+    :raises KeyError: if a case or source is unknown.
+    """
+    case_names = list(cases or CASES)
+    source_names = list(sources or SOURCES)
+    documents = _documents(source_names, corpus or FIXTURES_DIR)
+
+    results: Dict[str, Any] = {}
+    for case_name in case_names:
+        case = CASES[case_name]
+        case_results: Dict[str, Any] = {}
+        everything: List[int] = []
+        for source in source_names:
+            operations = _operations(case, documents[source])
+            if not operations:
+                continue
+            latencies = _sample(operations, samples, warmup)
+            everything.extend(latencies)
+            case_results[SOURCES[source]] = latency_stats(
+                latencies,
+                items=len(operations))
+        if everything:
+            case_results['all'] = latency_stats(
+                everything,
+                items=sum(i['items'] for i in case_results.values()))
+        results[case_name] = case_results
+
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'samples': samples,
+        'results': results,
+    }
+
+
+def latency_stats(latencies: Sequence[int], items: int) -> Dict[str, Any]:
+    """Summarizes given operation latencies in nanoseconds."""
+    ordered = sorted(latencies)
+    count = len(ordered)
+
+    def at(percentile: float) -> float:
+        # Nearest rank
+        index = max(0, min(count - 1, -(-count * percentile // 100) - 1))
+        return round(ordered[int(index)] / 1000, 2)
+
+    return {
+        'items': items,
+        'samples': count,
+        'items_per_second': round(count / (sum(ordered) / 1e9), 1),
+        'latency_us': {
+            'min': at(0),
+            **{f'p{percentile}': at(percentile) for percentile in PERCENTILES},
+            'max': at(100),
+        },
+    }
+
+
+def _documents(
+    sources: Sequence[str],
+    directory: str,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Returns raw items of given sources from given corpus directory."""
+    for source in sources:
+        if source not in SOURCES:
+            raise KeyError(f"Unknown source: {source}")
+    documents: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for source in sources:
+        path = os.path.join(directory, source)
+        if not os.path.isdir(path):
+            continue
+        for _, _, data in iter_documents(path):
+            documents[source].append(data)
+    return documents
+
+
+def _operations(
+    case: Case,
+    documents: List[Dict[str, Any]],
+) -> List[Operation]:
+    """Prepares operations for given documents,
+    leaving out documents the case doesn’t apply to or fails on."""
+    operations = []
+    for data in documents:
+        try:
+            operation = case(data)
+            if operation is not None:
+                operation()
+        except ValueError:
+            # Includes validation errors
+            continue
+        if operation is not None:
+            operations.append(operation)
+    return operations
+
+
+def _sample(
+    operations: List[Operation],
+    samples: int,
+    warmup: int,
+) -> List[int]:
+    """Runs given operations in turn and returns latencies
+    of ``samples`` runs in nanoseconds."""
+    clock = time.perf_counter_ns
+    for i in range(warmup):
+        operations[i % len(operations)]()
+
+    latencies = []
+    for i in range(samples):
+        operation = operations[i % len(operations)]
+        clear_relaxed_date_cache()
+        start = clock()
+        operation()
+        latencies.append(clock() - start)
+    return latencies
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog='python -m relaton.benchmarks',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--cases', nargs='+', choices=list(CASES),
+        help="Cases to run (default: all)")
+    parser.add_argument(
+        '--sources', nargs='+', choices=list(SOURCES),
+        help="Fixture directories to sample (default: all)")
+    parser.add_argument(
+        '--corpus', metavar='DIR',
+        help="Corpus to sample instead of fixtures, "
+             "with a subdirectory per source")
+    parser.add_argument('--samples', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument(
+        '--output', '-o',
+        help="File to write results to (default: standard output)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        cases=args.cases,
+        sources=args.sources,
+        samples=args.samples,
+        warmup=args.warmup,
+        corpus=args.corpus)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Compares payload size and encoding and decoding time
+of chunks of items for transport between processes:
+plain pickle, and JSON (:func:`relaton.models.export.to_json_bytes()`
+decoded with :func:`relaton.models.trusted.construct_trusted()`)::
+
+    python -m relaton.benchmarks.wire --items 2000 --chunk 50
+
+Pickling and unpickling items runs entirely in C
+(Pydantic models are compiled, and neither runs validators),
+so plain pickle is what :func:`relaton.serializers.bibxml.serialize_many()`
+and other process pools should use.
+"""
+
+import argparse
+import io
+import json
+import pickle
+from typing import Any, Callable, List, Optional, Tuple
+
+from ..io import load_items
+from ..models.export import to_json_bytes
+from ..models.trusted import construct_trusted
+from . import best_of, fixture_yaml
+
+
+def _json_dumps(chunk: List[Any]) -> bytes:
+    return b'[' + b','.join(to_json_bytes(item) for item in chunk) + b']'
+
+
+def _json_loads(data: bytes) -> List[Any]:
+    return [construct_trusted(item) for item in json.loads(data)]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--chunk', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # Parsed anew, so that chunks share no strings by accident
+    items = list(load_items(io.StringIO(fixture_yaml(args.items))))
+    chunks = [
+        items[i:i + args.chunk]
+        for i in range(0, len(items), args.chunk)
+    ]
+
+    cases: List[Tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]] = [
+        ('pickle', lambda c: pickle.dumps(c, pickle.HIGHEST_PROTOCOL),
+         pickle.loads),
+        ('JSON', _json_dumps, _json_loads),
+    ]
+
+    print(f"{len(items)} items in chunks of {args.chunk}")
+    print(f"{'':<10} {'B/item':>8} {'dumps':>12} {'loads':>12}")
+    for label, dumps, loads in cases:
+        payloads = [dumps(chunk) for chunk in chunks]
+        size = sum(len(p) for p in payloads) / len(items)
+        dumps_time = best_of(
+            lambda: [dumps(chunk) for chunk in chunks], args.repeat)
+        loads_time = best_of(
+            lambda: [loads(p) for p in payloads], args.repeat)
+        print(f"{label:<10} {size:>8.0f} "
+              f"{dumps_time / len(items) * 1e6:>7.1f} µs/i "
+              f"{loads_time / len(items) * 1e6:>7.1f} µs/i")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""
+Loading Relaton bibliographic items in bulk,
+e.g. from a local checkout of one of the ``relaton-data-*`` repositories.
+
+Primary API is :func:`.load_items()`.
+"""
+
+from .loader import *
+from .archives import *
+from .interning import *
+from .flyweights import *
+from .abstracts import *
+
+__all__ = (
+  'load_items',
+  'iter_documents',
+  'iter_yaml_files',
+  'LoadError',
+  'YAML_LOADER',
+  'YAML_EXTENSIONS',
+  'ArchiveReader',
+  'MemberLocation',
+  'is_archive',
+  'iter_archive_members',
+  'iter_archive_documents',
+  'ARCHIVE_TYPES',
+  'StringTable',
+  'FlyweightRegistry',
+  'AbstractStore',
+  'StoredAbstract',
+)
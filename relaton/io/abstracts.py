@@ -0,0 +1,221 @@
+"""
+Keeping abstracts of loaded items compressed, out of line.
+
+Abstracts (HTML or JATS markup) are by far the largest strings
+in most items, yet they are only read to render full references.
+An :class:`.AbstractStore` passed to :func:`relaton.io.load_items()`
+compresses each abstract’s content into the store before the item
+is validated, and leaves a :class:`.StoredAbstract` in its place,
+which decompresses the content whenever it is read::
+
+    with AbstractStore() as abstracts:
+        items = list(load_items(path, abstracts=abstracts))
+        print(f"{abstracts.saved_bytes} bytes saved")
+
+Compressed abstracts are kept in memory, or, if the store is given
+a file path, appended to that file and read back by offset.
+Either way, they are available as long as the store is open.
+"""
+
+import os
+import zlib
+from array import array
+from typing import Any, Dict, List, Optional, Union
+
+from ..models.strings import GenericStringValue
+
+__all__ = (
+    'AbstractStore',
+    'StoredAbstract',
+)
+
+
+class StoredAbstract(GenericStringValue):
+    """A :class:`~relaton.models.strings.GenericStringValue`
+    whose content is kept compressed in an :class:`.AbstractStore`.
+
+    Reading :attr:`content` decompresses it anew each time.
+    Instances compare equal to regular values with the same content,
+    and are copied and pickled as regular values.
+    """
+
+    def __init__(
+        self,
+        store: 'AbstractStore',
+        key: int,
+        format: Optional[str] = None,
+        script: Optional[Union[str, List[str]]] = None,
+        language: Optional[Union[str, List[str]]] = None,
+    ):
+        self.__dict__.update(
+            _store=store,
+            _key=key,
+            format=format,
+            script=script,
+            language=language,
+        )
+
+    @property
+    def content(self) -> str:  # type: ignore[override]
+        return self.__dict__['_store'].get(self.__dict__['_key'])
+
+    def __eq__(self, other):
+        if not isinstance(other, GenericStringValue):
+            return NotImplemented
+        return (
+            self.format == other.format
+            and self.script == other.script
+            and self.language == other.language
+            and self.content == other.content)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self):
+        return (GenericStringValue, (
+            self.content,
+            self.format,
+            self.script,
+            self.language,
+        ))
+
+
+class AbstractStore:
+    """Keeps abstracts’ content compressed with zlib,
+    in memory or in a file.
+
+    Not thread-safe; use one store per loading thread.
+
+    :param path: a file to keep compressed abstracts in.
+                 It is created or truncated, and removed on :meth:`close()`.
+                 By default, abstracts are kept in memory.
+    :param min_size: abstracts shorter than this many characters
+                     are left as they are.
+    :param level: zlib compression level.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        min_size: int = 256,
+        level: int = 6,
+    ):
+        self.path = path
+        self.min_size = min_size
+        self.level = level
+
+        self._blobs: List[bytes] = []
+        self._offsets = array('q')
+        self._file = open(path, 'w+b') if path is not None else None
+
+        self.original_bytes = 0
+        """Total size of stored abstracts, UTF-8 encoded."""
+
+        self.compressed_bytes = 0
+        """Total size of stored abstracts after compression."""
+
+    @property
+    def saved_bytes(self) -> int:
+        """Difference between original and compressed sizes."""
+        return self.original_bytes - self.compressed_bytes
+
+    def __len__(self) -> int:
+        if self._file is not None:
+            return len(self._offsets) - 1 if self._offsets else 0
+        return len(self._blobs)
+
+    def __enter__(self) -> 'AbstractStore':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Drops stored abstracts, removing the file if there is one.
+        Stored abstracts can’t be read afterwards."""
+        self._blobs = []
+        self._offsets = array('q')
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            if self.path is not None:
+                os.remove(self.path)
+
+    def put(self, content: str) -> int:
+        """Compresses given content into the store
+        and returns its key."""
+        data = content.encode('utf-8')
+        blob = zlib.compress(data, self.level)
+        self.original_bytes += len(data)
+        self.compressed_bytes += len(blob)
+
+        if self._file is None:
+            self._blobs.append(blob)
+            return len(self._blobs) - 1
+
+        if not self._offsets:
+            self._offsets.append(0)
+        self._file.seek(self._offsets[-1])
+        self._file.write(blob)
+        self._offsets.append(self._offsets[-1] + len(blob))
+        return len(self._offsets) - 2
+
+    def get(self, key: int) -> str:
+        """Returns decompressed content stored under given key."""
+        if self._file is None:
+            blob = self._blobs[key]
+        else:
+            start, end = self._offsets[key], self._offsets[key + 1]
+            self._file.seek(start)
+            blob = self._file.read(end - start)
+        return zlib.decompress(blob).decode('utf-8')
+
+    def store(self, value: GenericStringValue) -> GenericStringValue:
+        """Returns a :class:`.StoredAbstract` for given value,
+        or the value itself if its content is shorter than ``min_size``.
+        """
+        if isinstance(value, StoredAbstract) or (
+            len(value.content) < self.min_size
+        ):
+            return value
+        return StoredAbstract(
+            self,
+            self.put(value.content),
+            format=value.format,
+            script=value.script,
+            language=value.language,
+        )
+
+    def store_document(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Replaces raw abstracts in given item document
+        (including items in relations) with stored ones.
+        Given document is modified in place and returned.
+
+        Abstracts that fail validation are left for item validation
+        to report.
+        """
+        abstract = data.get('abstract')
+        if isinstance(abstract, dict):
+            data['abstract'] = self._store_raw(abstract)
+        elif isinstance(abstract, list):
+            data['abstract'] = [self._store_raw(i) for i in abstract]
+
+        relations = data.get('relation')
+        if isinstance(relations, list):
+            for relation in relations:
+                if isinstance(relation, dict) and isinstance(
+                    bibitem := relation.get('bibitem'), dict
+                ):
+                    self.store_document(bibitem)
+
+        return data
+
+    def _store_raw(self, abstract: Any) -> Any:
+        if not isinstance(abstract, dict) or not isinstance(
+            content := abstract.get('content'), str
+        ) or len(content) < self.min_size:
+            return abstract
+        try:
+            value = GenericStringValue(**abstract)
+        except (TypeError, ValueError):
+            return abstract
+        return self.store(value)
@@ -0,0 +1,416 @@
+"""
+Reading relaton-data corpora straight from archives,
+without extracting them first.
+
+Supported are tarballs (uncompressed, gzip, bzip2, xz,
+and Zstandard—the latter requires the optional ``zstandard`` package),
+ZIP archives, and single gzip-compressed YAML files.
+"""
+
+import bz2
+import gzip
+import json
+import lzma
+import os
+import struct
+import tarfile
+import zipfile
+import zlib
+from itertools import islice
+from typing import (
+    Any, Callable, Collection, Dict, IO, Iterator, NamedTuple, Optional,
+    Tuple, cast,
+)
+
+import yaml
+
+from ..models.bibdata import BibliographicItem
+from .loader import (
+    ErrorHandler,
+    Factory,
+    YAML_EXTENSIONS,
+    YAML_LOADER,
+    _construct_item,
+    _iter_stream_documents,
+    _log_error,
+    _wrap_error,
+)
+
+__all__ = (
+    'ArchiveReader',
+    'MemberLocation',
+    'is_archive',
+    'iter_archive_members',
+    'iter_archive_documents',
+    'ARCHIVE_TYPES',
+)
+
+
+ARCHIVE_TYPES: Tuple[Tuple[str, str], ...] = (
+    ('.tar.gz', 'tar:gz'),
+    ('.tgz', 'tar:gz'),
+    ('.tar.bz2', 'tar:bz2'),
+    ('.tar.xz', 'tar:xz'),
+    ('.tar.zst', 'tar:zst'),
+    ('.tzst', 'tar:zst'),
+    ('.tar', 'tar'),
+    ('.zip', 'zip'),
+    ('.gz', 'gz'),
+)
+"""Recognized archive file name suffixes, mapped to archive kinds.
+Earlier entries take precedence."""
+
+MEMBER_SEPARATOR = '!'
+"""Separates archive path from member name in document source names,
+e.g. ``snapshot.tar.gz!data/RFC0001.yaml``."""
+
+
+class MemberLocation(NamedTuple):
+    """Where a member’s data lives within an archive."""
+
+    name: str
+    """Member name (path within the archive)."""
+
+    offset: int
+    """For tarballs, offset of member data
+    in the *uncompressed* tar stream.
+    For ZIP archives, offset of the member’s local header."""
+
+    size: int
+    """Uncompressed member size in bytes."""
+
+    document: int = 0
+    """Zero-based index of the document within a multi-document member."""
+
+
+def archive_type(path: str) -> Optional[str]:
+    """Returns archive kind as per :data:`.ARCHIVE_TYPES`
+    for given file name, or ``None`` if it’s not an archive."""
+    lower = path.lower()
+    for suffix, kind in ARCHIVE_TYPES:
+        if lower.endswith(suffix):
+            return kind
+    return None
+
+
+def is_archive(path: str) -> bool:
+    """Returns ``True`` if given file name looks like
+    a supported archive."""
+    return archive_type(path) is not None
+
+
+def iter_archive_members(
+    path: str,
+) -> Iterator[Tuple[MemberLocation, IO[bytes]]]:
+    """Streams YAML members of given archive in archive order,
+    yielding their locations and open binary streams.
+
+    Each stream is only valid until the next member is requested.
+    Tarballs are read sequentially in a single pass,
+    so compressed tarballs are decompressed exactly once.
+    Hidden members (any path component starting with a dot)
+    are skipped.
+    """
+    kind = archive_type(path)
+
+    if kind == 'zip':
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if info.is_dir() or not _is_yaml_member(info.filename):
+                    continue
+                location = MemberLocation(
+                    info.filename, info.header_offset, info.file_size)
+                with zf.open(info) as stream:
+                    yield location, stream
+
+    elif kind == 'gz':
+        name = os.path.basename(path)[:-len('.gz')]
+        with gzip.open(path, 'rb') as stream:
+            yield MemberLocation(name, 0, -1), cast(IO[bytes], stream)
+
+    elif kind is not None:
+        with _open_decompressed(path, kind) as raw:
+            with tarfile.open(fileobj=raw, mode='r|') as tf:
+                for member in tf:
+                    if not member.isfile() or not _is_yaml_member(member.name):
+                        continue
+                    member_stream = tf.extractfile(member)
+                    if member_stream is not None:
+                        yield (
+                            MemberLocation(
+                                member.name, member.offset_data, member.size),
+                            member_stream,
+                        )
+
+    else:
+        raise ValueError(f"Not a supported archive: {path}")
+
+
+def iter_archive_documents(
+    path: str,
+    on_error: Optional[ErrorHandler] = None,
+    keys: Optional[Collection[str]] = None,
+) -> Iterator[Tuple[str, int, Dict[str, Any]]]:
+    """Like :func:`relaton.io.loader.iter_documents()`, but for archives.
+
+    Used by :func:`relaton.io.loader.iter_documents()`
+    when given a path to an archive.
+    """
+    report: ErrorHandler = on_error or _log_error
+
+    try:
+        for location, stream in iter_archive_members(path):
+            yield from _iter_stream_documents(
+                _member_source(path, location.name), stream, report, keys)
+    except (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile) as exc:
+        # A corrupt or truncated archive can’t be read any further
+        report(_wrap_error(path, 0, exc))
+
+
+class ArchiveReader:
+    """Random access to items in an archive by document identifier.
+
+    Building the index (:meth:`.build_index()`) takes one pass
+    over the archive. After that, reading an item seeks directly
+    to the member’s data::
+
+        with ArchiveReader('relaton-data-rfcs.zip') as archive:
+            archive.build_index()
+            item = archive.get('RFC 8200')
+
+    Only ZIP archives and uncompressed tarballs have true random access:
+    reading a ZIP member seeks to its local header, without reading
+    the archive’s central directory, and reading a member of
+    an uncompressed tarball seeks to its data.
+
+    Compressed tarballs have no seek points. Reading a member
+    decompresses the stream from the previously read member
+    up to its offset, and from the start of the archive
+    when going backwards, so the cost of a lookup grows with
+    the member’s distance into the archive.
+    This suits reading members in archive order;
+    prefer ZIP snapshots for random access.
+
+    The index can be saved with :meth:`.save_index()`
+    and passed back to the constructor, to avoid rebuilding it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        index: Optional[Dict[str, MemberLocation]] = None,
+    ):
+        kind = archive_type(path)
+        if kind is None or kind == 'gz':
+            raise ValueError(f"Not a supported multi-file archive: {path}")
+
+        self.path = path
+        self.kind: str = kind
+        self.index: Dict[str, MemberLocation] = dict(index or {})
+        """Maps each ``docid.id`` in the archive to member location."""
+
+        self._zipfile: Optional[zipfile.ZipFile] = None
+        self._stream: Optional[IO[bytes]] = None
+
+    def __enter__(self) -> 'ArchiveReader':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Closes any open archive file handles."""
+        if self._zipfile is not None:
+            self._zipfile.close()
+            self._zipfile = None
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def build_index(
+        self,
+        on_error: Optional[ErrorHandler] = None,
+    ) -> Dict[str, MemberLocation]:
+        """Reads the whole archive once, indexing each document
+        (its member, and position within it if the member holds several)
+        under all of its document identifiers.
+
+        Documents are only parsed, not validated.
+        If identifiers collide, the first member wins.
+        """
+        report: ErrorHandler = on_error or _log_error
+
+        for location, stream in iter_archive_members(self.path):
+            source = _member_source(self.path, location.name)
+            documents = _iter_stream_documents(source, stream, report)
+            for _, index, data in documents:
+                if not isinstance(data, dict):
+                    continue
+                document = location._replace(document=index)
+                for docid in (data.get('docid', None) or []):
+                    if isinstance(docid, dict) and 'id' in docid:
+                        self.index.setdefault(str(docid['id']), document)
+
+        return self.index
+
+    def read_member(self, location: MemberLocation) -> bytes:
+        """Returns raw data of the member at given location.
+
+        See class documentation for the cost of this
+        in each kind of archive.
+
+        :raises ValueError: location doesn’t match archive contents
+                            (e.g., the index is stale)
+        """
+        if self.kind == 'zip':
+            return self._read_zip_member(location)
+
+        stream = self._stream
+        if stream is not None and self.kind == 'tar:zst' \
+                and stream.tell() > location.offset:
+            # Zstandard decompression reader can only seek forward
+            stream.close()
+            stream = None
+        if stream is None:
+            stream = self._stream = _open_decompressed(self.path, self.kind)
+
+        stream.seek(location.offset)
+        return stream.read(location.size)
+
+    def _read_zip_member(self, location: MemberLocation) -> bytes:
+        if self._stream is None:
+            self._stream = open(self.path, 'rb')
+        stream = self._stream
+        source = _member_source(self.path, location.name)
+
+        stream.seek(location.offset)
+        header = stream.read(_ZIP_LOCAL_HEADER.size)
+        if len(header) < _ZIP_LOCAL_HEADER.size \
+                or header[:4] != _ZIP_LOCAL_HEADER_SIGNATURE:
+            raise ValueError(
+                f"{source}: no member at offset {location.offset}")
+        (
+            _, _, flags, method, _, _, crc, compressed_size, _,
+            name_length, extra_length,
+        ) = _ZIP_LOCAL_HEADER.unpack(header)
+        name = stream.read(name_length).decode(
+            'utf-8' if flags & _ZIP_FLAG_UTF8 else 'cp437')
+        if name != location.name:
+            raise ValueError(
+                f"{source}: found {name} at offset {location.offset}")
+
+        decompress = _ZIP_DECOMPRESSORS.get(method)
+        if decompress is None \
+                or flags & (_ZIP_FLAG_ENCRYPTED | _ZIP_FLAG_DATA_DESCRIPTOR) \
+                or compressed_size == 0xFFFFFFFF:
+            # Encrypted, unusually compressed, or sizes not in local header
+            # (streamed or ZIP64): fall back to the central directory
+            if self._zipfile is None:
+                self._zipfile = zipfile.ZipFile(self.path)
+            return self._zipfile.read(location.name)
+
+        stream.seek(extra_length, os.SEEK_CUR)
+        data = decompress(stream.read(compressed_size))
+        if zlib.crc32(data) != crc:
+            raise zipfile.BadZipFile(f"{source}: bad CRC")
+        return data
+
+    def read(self, docid: str) -> Dict[str, Any]:
+        """Returns raw (unvalidated) document data for given docid.
+
+        :raises KeyError: docid is not in the index
+        """
+        location = self.index[docid]
+        documents = yaml.load_all(
+            self.read_member(location), Loader=YAML_LOADER)
+        data = next(islice(documents, location.document, None), None)
+        if not isinstance(data, dict):
+            raise ValueError(
+                f"{_member_source(self.path, location.name)}: "
+                "document is not a mapping")
+        return data
+
+    def get(
+        self,
+        docid: str,
+        factory: Optional[Factory] = None,
+    ) -> BibliographicItem:
+        """Returns an item for given docid,
+        constructed the same way :func:`relaton.io.load_items()` would.
+
+        :raises KeyError: docid is not in the index
+        :raises ValueError: document failed validation
+        """
+        construct: Factory = factory or _construct_item
+        return construct(self.read(docid))
+
+    def save_index(self, path: str):
+        """Saves the index as JSON."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                docid: list(location)
+                for docid, location in self.index.items()
+            }, f)
+
+    @staticmethod
+    def load_index(path: str) -> Dict[str, MemberLocation]:
+        """Loads an index previously saved using :meth:`.save_index()`."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return {
+                docid: MemberLocation(*location)
+                for docid, location in json.load(f).items()
+            }
+
+
+_ZIP_LOCAL_HEADER = struct.Struct('<4sHHHHHIIIHH')
+_ZIP_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+_ZIP_FLAG_ENCRYPTED = 0x1
+_ZIP_FLAG_DATA_DESCRIPTOR = 0x8
+_ZIP_FLAG_UTF8 = 0x800
+
+_ZIP_DECOMPRESSORS: Dict[int, Callable[[bytes], bytes]] = {
+    zipfile.ZIP_STORED: bytes,
+    zipfile.ZIP_DEFLATED: lambda data: zlib.decompress(data, -zlib.MAX_WBITS),
+    zipfile.ZIP_BZIP2: bz2.decompress,
+}
+"""Decompressors of ZIP members’ raw data, by compression method."""
+
+
+def _open_decompressed(path: str, kind: str) -> IO[bytes]:
+    match kind:
+        case 'tar':
+            return open(path, 'rb')
+        case 'tar:gz':
+            return cast(IO[bytes], gzip.open(path, 'rb'))
+        case 'tar:bz2':
+            return bz2.open(path, 'rb')
+        case 'tar:xz':
+            return lzma.open(path, 'rb')
+        case 'tar:zst':
+            return _open_zstd(path)
+        case _:
+            raise ValueError(f"Unsupported archive kind: {kind}")
+
+
+def _open_zstd(path: str) -> IO[bytes]:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "Reading Zstandard-compressed archives "
+            "requires the zstandard package")
+    return zstandard.ZstdDecompressor().stream_reader(
+        open(path, 'rb'),
+        closefd=True)
+
+
+def _is_yaml_member(name: str) -> bool:
+    return (
+        name.lower().endswith(YAML_EXTENSIONS)
+        and not any(
+            part.startswith('.') and part not in ('.', '..')
+            for part in name.split('/')))
+
+
+def _member_source(path: str, name: str) -> str:
+    return f'{path}{MEMBER_SEPARATOR}{name}'
@@ -0,0 +1,178 @@
+"""
+Sharing identical contributors between loaded items.
+
+Organizations (and, to a lesser degree, people) repeat across a corpus:
+nearly every RFC is published by the same “RFC Publisher”
+and has the IETF as its author organization. Normally each occurrence
+is validated separately and kept as its own tree of objects.
+
+A :class:`.FlyweightRegistry` passed to :func:`relaton.io.load_items()`
+validates each distinct description once, and puts the resulting
+instance in place of every structurally identical raw description
+before the item is validated (Pydantic accepts model instances as is)::
+
+    flyweights = FlyweightRegistry(persons=True)
+    items = list(load_items(path, flyweights=flyweights))
+    print(f"{flyweights.collapsed} duplicates collapsed")
+
+Shared instances are of immutable subclasses
+(:class:`.SharedOrganization`, etc.), which compare equal
+to regular instances with the same values.
+"""
+
+import dataclasses
+from typing import Any, Dict, Optional, Tuple, Type
+
+from ..models.orgs import Organization
+from ..models.people import Person, PersonAffiliation
+
+__all__ = (
+    'FlyweightRegistry',
+    'SharedOrganization',
+    'SharedPerson',
+    'SharedPersonAffiliation',
+)
+
+
+class _Shared:
+    """Makes a model subclass immutable and comparable with its base."""
+
+    shared_of: Type[Any]
+
+    def __setattr__(self, name, value):
+        raise dataclasses.FrozenInstanceError(
+            f"Cannot assign to field {name!r} of a shared instance")
+
+    def __delattr__(self, name):
+        raise dataclasses.FrozenInstanceError(
+            f"Cannot delete field {name!r} of a shared instance")
+
+    def __eq__(self, other):
+        if not isinstance(other, self.shared_of):
+            return NotImplemented
+        return all(
+            getattr(self, field.name) == getattr(other, field.name)
+            for field in dataclasses.fields(self.shared_of))
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class SharedOrganization(_Shared, Organization):
+    """An immutable :class:`~relaton.models.orgs.Organization`
+    shared between items."""
+
+    shared_of = Organization
+
+
+class SharedPerson(_Shared, Person):
+    """An immutable :class:`~relaton.models.people.Person`
+    shared between items."""
+
+    shared_of = Person
+
+
+class SharedPersonAffiliation(_Shared, PersonAffiliation):
+    """An immutable :class:`~relaton.models.people.PersonAffiliation`
+    shared between items."""
+
+    shared_of = PersonAffiliation
+
+
+class FlyweightRegistry:
+    """Keeps one validated, immutable instance
+    of each distinct contributor description seen in loaded documents.
+
+    Organizations are always shared. Nested objects
+    (such as organization names) are not immutable themselves,
+    and must not be modified either.
+
+    Not thread-safe; use one registry per loading thread.
+
+    :param persons: whether to share people as well.
+    :param affiliations: whether to share affiliations of people
+                         that aren’t shared as a whole.
+    """
+
+    def __init__(self, persons: bool = False, affiliations: bool = False):
+        self.persons = persons
+        self.affiliations = affiliations
+
+        self._instances: Dict[Tuple[type, str], Any] = {}
+
+        self.collapsed = 0
+        """Number of descriptions replaced with an existing instance."""
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def share_document(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Replaces raw contributor descriptions in given item document
+        (including items in relations) with shared instances.
+        Given document is modified in place and returned.
+
+        :raises ValueError: if a description fails validation
+                            (or ``TypeError``, as with model constructors).
+        """
+        for contributor in _dicts(data.get('contributor')):
+            if isinstance(org := contributor.get('organization'), dict):
+                contributor['organization'] = self.share(
+                    SharedOrganization, org)
+            if isinstance(person := contributor.get('person'), dict):
+                if self.persons:
+                    contributor['person'] = self.share(SharedPerson, person)
+                else:
+                    self._share_affiliations(person)
+
+        for relation in _dicts(data.get('relation')):
+            if isinstance(bibitem := relation.get('bibitem'), dict):
+                self.share_document(bibitem)
+
+        return data
+
+    def share(self, cls: Type[Any], data: Dict[str, Any]) -> Any:
+        """Returns the shared instance of given class
+        (one of ``Shared*`` classes) for given raw description,
+        validating it if it wasn’t seen before.
+
+        Descriptions are told apart by their ``repr()``,
+        which is much cheaper than walking them, and tells values
+        of different types apart. Anything that validates
+        (plain data, model instances) has a ``repr()`` reflecting its value.
+        Equal descriptions whose keys are in a different order
+        are shared separately.
+        """
+        key = (cls, repr(data))
+        instance: Optional[Any] = self._instances.get(key)
+        if instance is None:
+            instance = cls.shared_of(**data)
+            # Validated as the regular model, since shared classes
+            # don’t allow assignment in __init__()
+            object.__setattr__(instance, '__class__', cls)
+            self._instances[key] = instance
+        else:
+            self.collapsed += 1
+        return instance
+
+    def _share_affiliations(self, person: Dict[str, Any]):
+        affiliation = person.get('affiliation')
+        if isinstance(affiliation, dict):
+            person['affiliation'] = self._share_affiliation(affiliation)
+        elif isinstance(affiliation, list):
+            person['affiliation'] = [
+                self._share_affiliation(i) if isinstance(i, dict) else i
+                for i in affiliation
+            ]
+
+    def _share_affiliation(self, affiliation: Dict[str, Any]) -> Any:
+        if self.affiliations:
+            return self.share(SharedPersonAffiliation, affiliation)
+        if isinstance(org := affiliation.get('organization'), dict):
+            affiliation['organization'] = self.share(SharedOrganization, org)
+        return affiliation
+
+
+def _dicts(value: Any):
+    if isinstance(value, dict):
+        yield value
+    elif isinstance(value, list):
+        yield from (i for i in value if isinstance(i, dict))
@@ -0,0 +1,130 @@
+"""
+Sharing repeated strings between loaded items.
+
+Across a corpus, vocabulary values (identifier, role, date and link types,
+language and script codes) and organization names
+repeat in nearly every document, but each parsed document
+holds its own copies. A :class:`.StringTable` passed
+to :func:`relaton.io.load_items()` replaces them with shared instances
+before validation, which keeps them as is::
+
+    strings = StringTable()
+    items = list(load_items(path, strings=strings))
+    print(f"{strings.saved_bytes} bytes saved")
+
+Shared strings are also interned with :func:`sys.intern`,
+so they are the same objects as equal identifier-like literals in code
+(such as ``'author'`` or ``'IETF'``), and equality checks against those
+succeed on identity.
+"""
+
+import sys
+from typing import Any, Dict, FrozenSet, Mapping
+
+__all__ = (
+    'StringTable',
+    'INTERNED_KEYS',
+    'INTERNED_SUBTREES',
+)
+
+
+INTERNED_KEYS: FrozenSet[str] = frozenset({
+    'type',
+    'format',
+    'language',
+    'script',
+    'scope',
+    'place',
+})
+"""Keys whose string values (or lists of strings)
+are shared wherever they occur in a document."""
+
+INTERNED_SUBTREES: Mapping[str, FrozenSet[str]] = {
+    'organization': frozenset({'name', 'abbreviation'}),
+}
+"""Keys of mappings (or lists of mappings) whose values,
+under given keys, have every string shared.
+
+Other properties of organizations (addresses, URIs, emails,
+phone numbers) are mostly unique, and are only shared
+as per :data:`.INTERNED_KEYS`."""
+
+
+class StringTable:
+    """Keeps one instance of each low-cardinality string
+    seen in loaded documents, and counts how much memory that saved.
+
+    Not thread-safe; use one table per loading thread.
+    """
+
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+
+        self.hits = 0
+        """Number of strings replaced with a shared instance."""
+
+        self.saved_bytes = 0
+        """Total size of replaced strings, which can be freed
+        once the original documents are discarded."""
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._strings
+
+    def intern(self, value: str) -> str:
+        """Returns the shared instance of given string,
+        making it shared if it wasn’t seen before."""
+        shared = self._strings.get(value)
+        if shared is None:
+            shared = self._strings[value] = sys.intern(value)
+        elif shared is not value:
+            self.hits += 1
+            self.saved_bytes += sys.getsizeof(value)
+        return shared
+
+    def intern_document(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Replaces strings under :data:`.INTERNED_KEYS`
+        and :data:`.INTERNED_SUBTREES`, at any depth,
+        with shared instances. Given document is modified in place
+        and returned, so this can be used as ``preprocess``
+        in :func:`relaton.io.load_items()`.
+        """
+        self._intern_mapping(data)
+        return data
+
+    def _intern_mapping(self, data: Dict[str, Any]):
+        for key, value in data.items():
+            if key in INTERNED_SUBTREES:
+                self._intern_subtree(value, INTERNED_SUBTREES[key])
+            elif isinstance(value, str):
+                if key in INTERNED_KEYS:
+                    data[key] = self.intern(value)
+            elif isinstance(value, dict):
+                self._intern_mapping(value)
+            elif isinstance(value, list):
+                for index, i in enumerate(value):
+                    if isinstance(i, dict):
+                        self._intern_mapping(i)
+                    elif isinstance(i, str) and key in INTERNED_KEYS:
+                        value[index] = self.intern(i)
+
+    def _intern_subtree(self, value: Any, keys: FrozenSet[str]):
+        if isinstance(value, list):
+            for i in value:
+                self._intern_subtree(i, keys)
+        elif isinstance(value, dict):
+            self._intern_mapping(value)
+            for key in keys & value.keys():
+                value[key] = self._intern_all(value[key])
+
+    def _intern_all(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return self.intern(value)
+        if isinstance(value, dict):
+            for key, i in value.items():
+                value[key] = self._intern_all(i)
+        elif isinstance(value, list):
+            value[:] = [self._intern_all(i) for i in value]
+        return value
@@ -0,0 +1,283 @@
+import logging
+import os
+from typing import (
+    Any, Callable, Collection, Dict, IO, Iterator, Optional, Tuple, Union,
+)
+
+import yaml
+
+from ..models.bibdata import BibliographicItem
+from ..models.projection import projection_model
+from .abstracts import AbstractStore
+from .flyweights import FlyweightRegistry
+from .interning import StringTable
+
+__all__ = (
+    'load_items',
+    'iter_documents',
+    'iter_yaml_files',
+    'LoadError',
+    'YAML_LOADER',
+    'YAML_EXTENSIONS',
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+"""Safe YAML loader class to use.
+The libyaml-backed ``CSafeLoader`` if PyYAML was built with it,
+otherwise the pure-Python ``SafeLoader``.
+"""
+
+YAML_EXTENSIONS = ('.yaml', '.yml')
+"""File extensions considered to contain YAML documents
+when walking a directory."""
+
+
+Source = Union[str, os.PathLike, IO[Any]]
+"""A directory, a YAML file path, or an open (text or binary) YAML stream."""
+
+ErrorHandler = Callable[['LoadError'], None]
+
+Factory = Callable[[Dict[str, Any]], Any]
+
+Preprocessor = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class LoadError(ValueError):
+    """Raised (or passed to the ``on_error`` callback)
+    when a document could not be read or turned into an item.
+
+    The original exception is available as ``__cause__``.
+    """
+
+    def __init__(self, source: str, index: int, message: str):
+        super().__init__(f"{source} (document {index}): {message}")
+        self.source = source
+        """Name of the file or stream the document came from."""
+
+        self.index = index
+        """Zero-based index of the document within its source."""
+
+
+def load_items(
+    source: Source,
+    factory: Optional[Factory] = None,
+    on_error: Optional[ErrorHandler] = None,
+    preprocess: Optional[Preprocessor] = None,
+    strings: Optional[StringTable] = None,
+    flyweights: Optional[FlyweightRegistry] = None,
+    fields: Optional[Collection[str]] = None,
+    abstracts: Optional[AbstractStore] = None,
+) -> Iterator[BibliographicItem]:
+    """Lazily yields validated bibliographic items from given source.
+
+    Only one document is held in memory at a time,
+    so this can be used on arbitrarily large corpora::
+
+        for item in load_items('relaton-data-rfcs/data'):
+            xml = serialize(item)
+
+    Documents that fail to parse or validate are reported
+    and skipped, without stopping the iteration.
+
+    :param source: a directory (walked recursively, see
+                   :func:`.iter_yaml_files()`), a path to a YAML file,
+                   a path to an archive (see :mod:`relaton.io.archives`),
+                   or an open stream. Files and streams
+                   may contain multiple YAML documents.
+    :param factory: a callable that turns a document dictionary
+                    into an item. Defaults to validating
+                    :class:`~relaton.models.bibdata.BibliographicItem`
+                    constructor. Must raise a ``ValueError``
+                    or a ``TypeError`` on invalid data.
+    :param on_error: a callable receiving a :class:`.LoadError`
+                     for each skipped document. By default,
+                     errors are logged as warnings.
+    :param preprocess: a callable applied to each document dictionary
+                       before it’s passed to ``factory``, such as
+                       :func:`relaton.models.canonical.canonicalize()`.
+    :param strings: a :class:`~relaton.io.interning.StringTable`
+                    to share repeated vocabulary strings
+                    between items through. Applied before ``preprocess``.
+                    The table keeps statistics on memory saved,
+                    and can be reused across calls.
+    :param flyweights: a :class:`~relaton.io.flyweights.FlyweightRegistry`
+                       to share identical contributors between items
+                       through. Applied after ``strings``
+                       and before ``preprocess``.
+    :param fields: names of top-level properties to read.
+                   Other properties aren’t constructed from YAML at all
+                   (see ``keys`` in :func:`.iter_documents()`),
+                   and unless ``factory`` is given, items are validated
+                   as a projection onto these fields
+                   (see :func:`relaton.models.projection.projection_model()`)
+                   instead of as bibliographic items.
+    :param abstracts: an :class:`~relaton.io.abstracts.AbstractStore`
+                      to keep abstracts compressed in.
+                      Applied after ``flyweights``
+                      and before ``preprocess``.
+    """
+    construct: Factory
+    if factory is not None:
+        construct = factory
+    elif fields is not None:
+        construct = _projection_factory(fields)
+    else:
+        construct = _construct_item
+    report: ErrorHandler = on_error or _log_error
+
+    documents = iter_documents(source, on_error=report, keys=fields)
+    for name, index, data in documents:
+        try:
+            if strings is not None and isinstance(data, dict):
+                data = strings.intern_document(data)
+            if flyweights is not None and isinstance(data, dict):
+                data = flyweights.share_document(data)
+            if abstracts is not None and isinstance(data, dict):
+                data = abstracts.store_document(data)
+            if preprocess is not None:
+                data = preprocess(data)
+            yield construct(data)
+        except (ValueError, TypeError) as exc:
+            report(_wrap_error(name, index, exc))
+
+
+def iter_documents(
+    source: Source,
+    on_error: Optional[ErrorHandler] = None,
+    keys: Optional[Collection[str]] = None,
+) -> Iterator[Tuple[str, int, Dict[str, Any]]]:
+    """Lazily yields raw YAML documents from given source
+    as 3-tuples of source name, document index within the source,
+    and the parsed document.
+
+    Empty documents are skipped. Files that can’t be opened or parsed
+    are reported to ``on_error`` (logged by default), and
+    iteration continues with the next file.
+
+    :param keys: if given, only these keys of top-level mappings
+                 are kept. Values of other keys are still parsed
+                 (the whole document has to be), but are never
+                 constructed into Python objects, which is where
+                 most of loading time goes.
+    """
+    report: ErrorHandler = on_error or _log_error
+
+    if hasattr(source, 'read'):
+        yield from _iter_stream_documents(
+            getattr(source, 'name', '<stream>'),
+            source,  # type: ignore[arg-type]
+            report,
+            keys)
+        return
+
+    path = os.fspath(source)
+
+    # Imported here, since archives module builds upon this one
+    from .archives import is_archive, iter_archive_documents
+    if not os.path.isdir(path) and is_archive(path):
+        yield from iter_archive_documents(path, on_error=report, keys=keys)
+        return
+
+    paths = iter_yaml_files(path) if os.path.isdir(path) else iter([path])
+
+    for file_path in paths:
+        try:
+            stream = open(file_path, 'rb')
+        except OSError as exc:
+            report(_wrap_error(file_path, 0, exc))
+            continue
+        with stream:
+            yield from _iter_stream_documents(file_path, stream, report, keys)
+
+
+def iter_yaml_files(path: str) -> Iterator[str]:
+    """Walks given directory recursively in a stable (sorted) order,
+    yielding paths to files with one of :data:`.YAML_EXTENSIONS`.
+
+    Hidden files and directories (such as ``.git``) are skipped.
+    """
+    with os.scandir(path) as it:
+        entries = sorted(
+            (e for e in it if not e.name.startswith('.')),
+            key=lambda e: e.name)
+
+    for entry in entries:
+        if entry.is_dir():
+            yield from iter_yaml_files(entry.path)
+        elif entry.name.lower().endswith(YAML_EXTENSIONS):
+            yield entry.path
+
+
+def _iter_stream_documents(
+    name: str,
+    stream: IO[Any],
+    report: ErrorHandler,
+    keys: Optional[Collection[str]] = None,
+) -> Iterator[Tuple[str, int, Dict[str, Any]]]:
+    index = 0
+    loader = YAML_LOADER(stream)
+    try:
+        # Same as yaml.load_all(), with a chance to drop nodes
+        while loader.check_node():
+            node = loader.get_node()
+            if keys is not None:
+                node = _project_node(node, keys)
+            data = loader.construct_document(node)
+            if data is not None:
+                yield name, index, data
+            index += 1
+    except yaml.YAMLError as exc:
+        # The rest of the stream can’t be recovered
+        report(_wrap_error(name, index, exc))
+    finally:
+        loader.dispose()
+
+
+def _project_node(node: Any, keys: Collection[str]) -> Any:
+    """Returns a copy of given mapping node without pairs
+    whose keys are plain strings other than given ones."""
+    if not isinstance(node, yaml.MappingNode):
+        return node
+    return yaml.MappingNode(
+        node.tag,
+        [
+            (key, value) for key, value in node.value
+            if not (
+                isinstance(key, yaml.ScalarNode)
+                and key.tag == 'tag:yaml.org,2002:str'
+                and key.value not in keys)
+        ],
+        node.start_mark,
+        node.end_mark,
+        node.flow_style)
+
+
+def _construct_item(data: Dict[str, Any]) -> BibliographicItem:
+    if not isinstance(data, dict):
+        raise TypeError("Document is not a mapping")
+    return BibliographicItem(**data)
+
+
+def _projection_factory(fields: Collection[str]) -> Factory:
+    model = projection_model(fields)
+
+    def construct(data: Dict[str, Any]) -> Any:
+        if not isinstance(data, dict):
+            raise TypeError("Document is not a mapping")
+        return model(**data)
+
+    return construct
+
+
+def _wrap_error(name: str, index: int, exc: Exception) -> LoadError:
+    err = LoadError(name, index, str(exc))
+    err.__cause__ = exc
+    return err
+
+
+def _log_error(err: LoadError):
+    logger.warning("Skipping document: %s", err)
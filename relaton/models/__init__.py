@@ -18,7 +18,7 @@ They are mixed for a few reasons:
 .. important:: Dumping a model as a dictionary using Pydantic
                may not dump members that are dataclass instances.
                To obtain a full dictionary,
-               use :func:`common.pydantic.unpack_dataclasses` utility.
+               use :func:`relaton.models.export.to_dict()`.
 """
 
 from .bibdata import *
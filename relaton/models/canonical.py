@@ -0,0 +1,189 @@
+"""
+Canonical shape of bibliographic data, where properties
+that can hold either a single value or a list always hold a list.
+
+Many properties (such as ``title``, ``date``, ``Organization.name``,
+``Series.title`` or ``GenericStringValue.language``) accept both shapes,
+which leaves callers to coerce values with :func:`relaton.util.as_list`.
+
+:func:`.canonicalize()` rewrites raw data into the list shape
+before validation. The result validates as a regular
+:class:`~relaton.models.bibdata.BibliographicItem`
+whose single-or-list properties, at any depth, all hold lists.
+It can be passed as ``preprocess`` to :func:`relaton.io.load_items()`,
+or :func:`.load_canonical()` as ``factory``::
+
+    for item in load_items(path, factory=load_canonical):
+        ...
+
+Canonicalizing is not a speed-up: validation of canonical data
+takes about as long, and the pre-pass adds to it
+(see ``python -m relaton.benchmarks.canonical``).
+"""
+
+import functools
+import typing
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .bibdata import BibliographicItem
+from .introspection import fits, is_model, model_fields, unwrap_optional
+
+__all__ = (
+    'canonicalize',
+    'load_canonical',
+)
+
+
+Normalizer = Callable[[Any], Any]
+
+
+def load_canonical(data: Dict[str, Any]) -> BibliographicItem:
+    """Canonicalizes and validates given item data.
+
+    Can be used as ``factory`` in :func:`relaton.io.load_items()`.
+    """
+    return BibliographicItem(**canonicalize(data))
+
+
+def canonicalize(data: Dict[str, Any], model: Any = BibliographicItem) -> Any:
+    """Returns a copy of given raw data of given model
+    (by default, :class:`~relaton.models.bibdata.BibliographicItem`)
+    where values of single-or-list properties, at any depth,
+    are wrapped in lists.
+
+    Properties are found based on model annotations
+    (``Union[List[X], X]`` in either order). Given data is not modified,
+    and dictionaries without such properties are not copied.
+    Data that doesn’t match the model is left for validation to reject.
+    """
+    normalize = _normalizer(model)
+    return normalize(data) if normalize is not None else data
+
+
+@functools.lru_cache(maxsize=None)
+def _normalizer(tp: Any) -> Optional[Normalizer]:
+    """Returns a function canonicalizing plain data of given type,
+    or ``None`` if data of given type is always canonical.
+
+    Normalizers are never given ``None``, callers pass it through.
+    """
+    if not _needs_normalizing(tp, set()):
+        return None
+
+    tp, _ = unwrap_optional(tp)
+    origin = typing.get_origin(tp)
+
+    if origin is typing.Union:
+        args = typing.get_args(tp)
+        item_type = _single_or_list_item(args)
+        if item_type is not None:
+            return _list_normalizer(_normalizer(item_type), wrap=True)
+        return _union_normalizer([t for t in args if is_model(t)])
+
+    if origin is list:
+        (item_type, ) = typing.get_args(tp)
+        return _list_normalizer(_normalizer(item_type), wrap=False)
+
+    if typing.is_typeddict(tp) or is_model(tp):
+        return _model_normalizer(tp)
+
+    return None
+
+
+def _needs_normalizing(tp: Any, seen: Set[Any]) -> bool:
+    tp, _ = unwrap_optional(tp)
+    origin = typing.get_origin(tp)
+
+    if origin is typing.Union:
+        args = typing.get_args(tp)
+        return (
+            _single_or_list_item(args) is not None
+            or any(_needs_normalizing(t, seen) for t in args))
+
+    if origin is list:
+        return _needs_normalizing(typing.get_args(tp)[0], seen)
+
+    if typing.is_typeddict(tp) or is_model(tp):
+        if tp in seen:
+            return False
+        seen.add(tp)
+        return any(
+            _needs_normalizing(field_type, seen)
+            for field_type in _field_types(tp).values())
+
+    return False
+
+
+def _single_or_list_item(types: typing.Tuple[Any, ...]) -> Optional[Any]:
+    """If given union members are ``X`` and ``List[X]`` (in any order),
+    returns ``X``."""
+    if len(types) == 2:
+        for a, b in (types, reversed(types)):
+            if typing.get_origin(a) is list and typing.get_args(a) == (b, ):
+                if typing.get_origin(b) is not typing.Union:
+                    return b
+    return None
+
+
+def _field_types(tp: Any) -> Dict[str, Any]:
+    if typing.is_typeddict(tp):
+        return typing.get_type_hints(tp)
+    return {spec.name: spec.type for spec in model_fields(tp)}
+
+
+def _list_normalizer(
+    normalize_item: Optional[Normalizer],
+    wrap: bool,
+) -> Normalizer:
+    def normalize_list(v):
+        if isinstance(v, (list, tuple)):
+            items = v
+        elif wrap:
+            items = [v]
+        else:
+            return v
+        if normalize_item is None:
+            return items
+        return [normalize_item(i) if i is not None else i for i in items]
+
+    return normalize_list
+
+
+def _model_normalizer(tp: Any) -> Normalizer:
+    # Resolved on first use, since models can be recursive
+    # (e.g., through relations)
+    fields: List[typing.Tuple[str, Normalizer]] = []
+    resolved = False
+
+    def normalize_model(v):
+        nonlocal resolved
+        if not isinstance(v, dict):
+            return v
+        if not resolved:
+            for name, field_type in _field_types(tp).items():
+                if (normalize := _normalizer(field_type)) is not None:
+                    fields.append((name, normalize))
+            resolved = True
+
+        result = v
+        for name, normalize in fields:
+            value = v.get(name, None)
+            if value is not None:
+                if result is v:
+                    result = dict(v)
+                result[name] = normalize(value)
+        return result
+
+    return normalize_model
+
+
+def _union_normalizer(candidates: List[Any]) -> Normalizer:
+    def normalize_union(v):
+        if isinstance(v, dict):
+            for cls in candidates:
+                if fits(cls, v):
+                    normalize = _normalizer(cls)
+                    return normalize(v) if normalize is not None else v
+        return v
+
+    return normalize_union
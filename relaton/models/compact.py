@@ -0,0 +1,168 @@
+"""
+Compact representation of loaded items, for processes
+that keep a whole corpus in memory.
+
+Leaf dataclasses (:class:`~relaton.models.bibdata.DocID`,
+:class:`~relaton.models.links.Link`, :class:`~relaton.models.dates.Date`,
+strings and titles, etc.) are Pydantic dataclasses, each instance of which
+carries its own ``__dict__``. Pydantic requires that ``__dict__``,
+so :func:`.compact()` replaces leaf instances in a validated item
+with slotted standard dataclasses (see :data:`.COMPACT_VARIANTS`),
+which take a fraction of the memory::
+
+    for item in load_items(path, factory=load_compact):
+        ...
+
+Compact variants have the same fields and defaults, work
+with :func:`dataclasses.asdict()`, and compare equal
+to the original leaf instances with the same values, so compacted items
+compare equal to, serialize and dump the same as regular ones.
+They are not instances of original classes, however,
+and their values are not validated when set.
+"""
+
+import dataclasses
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import BaseModel
+
+from .bibdata import BibliographicItem, DocID, Role
+from .bibitemlocality import Locality
+from .contacts import Address, Phone
+from .dates import Date
+from .links import Link
+from .strings import FormattedContent, GenericStringValue, Title
+
+__all__ = (
+    'compact',
+    'load_compact',
+    'COMPACT_VARIANTS',
+    'CompactDocID',
+    'CompactLink',
+    'CompactDate',
+    'CompactGenericStringValue',
+    'CompactFormattedContent',
+    'CompactTitle',
+    'CompactRole',
+    'CompactLocality',
+    'CompactPhone',
+    'CompactAddress',
+)
+
+
+T = TypeVar('T')
+
+
+def _compact_eq(self, other):
+    if type(other) is not type(self) and type(other) is not self.compact_of:
+        return NotImplemented
+    return all(
+        getattr(self, name) == getattr(other, name)
+        for name in self.__slots__)
+
+
+def _compact_variant(cls: Type[Any]) -> Type[Any]:
+    """Returns a slotted standard dataclass
+    with the same fields as given dataclass."""
+    fields = []
+    for field in dataclasses.fields(cls):
+        spec: Any = dataclasses.field()
+        if field.default is not dataclasses.MISSING:
+            spec = dataclasses.field(default=field.default)
+        elif field.default_factory is not dataclasses.MISSING:
+            spec = dataclasses.field(default_factory=field.default_factory)
+        fields.append((field.name, field.type, spec))
+
+    variant = dataclasses.make_dataclass(
+        f'Compact{cls.__name__}',
+        fields,
+        namespace={
+            '__doc__': (
+                f"Compact variant of "
+                f":class:`~{cls.__module__}.{cls.__name__}`."),
+            '__eq__': _compact_eq,
+            'compact_of': cls,
+        },
+        eq=False,
+        slots=True,
+    )
+    variant.__module__ = __name__
+    return variant
+
+
+CompactDocID = _compact_variant(DocID)
+CompactLink = _compact_variant(Link)
+CompactDate = _compact_variant(Date)
+CompactGenericStringValue = _compact_variant(GenericStringValue)
+CompactFormattedContent = _compact_variant(FormattedContent)
+CompactTitle = _compact_variant(Title)
+CompactRole = _compact_variant(Role)
+CompactLocality = _compact_variant(Locality)
+CompactPhone = _compact_variant(Phone)
+CompactAddress = _compact_variant(Address)
+
+
+COMPACT_VARIANTS: Dict[Type[Any], Type[Any]] = {
+    variant.compact_of: variant
+    for variant in (
+        CompactDocID,
+        CompactLink,
+        CompactDate,
+        CompactGenericStringValue,
+        CompactFormattedContent,
+        CompactTitle,
+        CompactRole,
+        CompactLocality,
+        CompactPhone,
+        CompactAddress,
+    )
+}
+"""Compact variants keyed by original leaf class.
+Subclasses of original classes are not replaced."""
+
+
+def load_compact(data: Dict[str, Any]) -> BibliographicItem:
+    """Validates given item data and compacts the item.
+
+    Can be used as ``factory`` in :func:`relaton.io.load_items()`.
+    """
+    return compact(BibliographicItem(**data))
+
+
+def compact(obj: T) -> T:
+    """Replaces leaf dataclass instances within given
+    validated model instance (at any depth) with compact variants.
+
+    The instance is modified in place and returned.
+    """
+    _compact_children(obj)
+    return obj
+
+
+def _compact(v: Any) -> Any:
+    variant = COMPACT_VARIANTS.get(type(v))
+    if variant is not None:
+        return variant(**{
+            name: _compact(value)
+            for name, value in v.__dict__.items()
+            if name in variant.__slots__
+        })
+    _compact_children(v)
+    return v
+
+
+def _compact_children(v: Any):
+    if isinstance(v, list):
+        v[:] = [_compact(i) for i in v]
+    elif isinstance(v, dict):
+        for key, value in v.items():
+            v[key] = _compact(value)
+    elif isinstance(v, BaseModel) or dataclasses.is_dataclass(v):
+        # Compact variants have no __dict__ and need no processing
+        values: Dict[str, Any] = getattr(v, '__dict__', {})
+        for name, value in values.items():
+            if isinstance(value, (list, dict, BaseModel)) or (
+                dataclasses.is_dataclass(value)
+            ):
+                values[name] = _compact(value)
+
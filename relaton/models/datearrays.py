@@ -0,0 +1,217 @@
+"""
+Parsing whole columns of relaxed dates at once with NumPy.
+
+Useful for building indexes or statistics over many
+:class:`~relaton.models.dates.Date` values, where calling
+:func:`~relaton.models.dates.parse_relaxed_date()` per value
+would dominate::
+
+    dates, codes = parse_relaxed_dates(values, full_dates=True)
+    years = dates[codes > 0].astype('datetime64[Y]')
+
+Requires NumPy, which can be installed with the ``numpy`` extra.
+"""
+
+from typing import Any, Tuple
+
+from . import dates as _dates
+
+__all__ = (
+    'parse_relaxed_dates',
+    'SPECIFICITIES',
+)
+
+
+SPECIFICITIES: Tuple[str, ...] = ('year', 'month', 'day')
+"""Specificities by code, starting from 1.
+Code 0 means the value could not be parsed."""
+
+
+_MIN_WIDTH = len('YYYY-MM-DD')
+
+
+def parse_relaxed_dates(
+    values: Any,
+    full_dates: bool = False,
+) -> Tuple[Any, Any]:
+    """Parses a sequence (such as a list or a NumPy array)
+    of relaxed date strings.
+
+    Results agree with calling
+    :func:`~relaton.models.dates.parse_relaxed_date()` on each value
+    (or, with ``full_dates``,
+    :func:`~relaton.models.dates.validate_relaxed_date()`,
+    which also accepts full dates).
+    Common shapes of strings are classified and converted
+    with array operations, and only the rest
+    (such as strings with non-ASCII digits) are parsed one by one.
+
+    :param values: strings.
+    :param full_dates: whether to accept full dates, such as ``2000-01-02``.
+    :returns: a 2-tuple of arrays of the same length as ``values``:
+              ``datetime64[D]`` dates (``NaT`` where parsing failed,
+              and the first day of the month or year
+              for less specific dates), and ``int8`` specificity codes
+              (indices into :data:`SPECIFICITIES` plus one,
+              or 0 where parsing failed).
+    :raises TypeError: if values are not strings.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Parsing date arrays requires the numpy package")
+
+    arr: Any = np.asarray(values)
+    if arr.ndim != 1 or (arr.dtype.kind != 'U' and arr.size > 0):
+        raise TypeError("Expected a one-dimensional sequence of strings")
+
+    count = arr.shape[0]
+    result = np.full(count, np.datetime64('NaT'), dtype='datetime64[D]')
+    codes = np.zeros(count, dtype=np.int8)
+    if count == 0:
+        return result, codes
+
+    if _dates.EXTRA_DATE_FORMATS != _dates._DEFAULT_EXTRA_DATE_FORMATS:
+        # Shapes below are only known for default formats
+        _parse_each(arr, np.arange(count), result, codes, full_dates)
+        return result, codes
+
+    # Code points, one row per string, padded with zeros
+    width = max(arr.dtype.itemsize // 4, _MIN_WIDTH)
+    chars = np.zeros((count, width), dtype=np.uint32)
+    chars[:, :arr.dtype.itemsize // 4] = (
+        np.ascontiguousarray(arr).view(np.uint32).reshape(count, -1))
+
+    nonzero = chars != 0
+    length = np.where(
+        nonzero.any(axis=1),
+        width - np.argmax(nonzero[:, ::-1], axis=1),
+        0)
+    # Enough for ISO-like shapes
+    head = chars[:, :_MIN_WIDTH]
+    is_digit = (head >= ord('0')) & (head <= ord('9'))
+    digit = head.astype(np.int64) - ord('0')
+    is_dash = head == ord('-')
+
+    handled = np.zeros(count, dtype=bool)
+    year = np.zeros(count, dtype=np.int64)
+    month = np.ones(count, dtype=np.int64)
+    day = np.ones(count, dtype=np.int64)
+    specificity = np.zeros(count, dtype=np.int8)
+
+    # YYYY, YYYY-M(M) and YYYY-M(M)-D(D)
+    iso_year = is_digit[:, :4].all(axis=1)
+    iso_year_value = digit[:, :4] @ np.array([1000, 100, 10, 1])
+    shapes = (
+        # (length, dash positions, digit runs, specificity)
+        (4, (), (), 1),
+        (6, (4, ), ((5, 1), ), 2),
+        (7, (4, ), ((5, 2), ), 2),
+        (8, (4, 6), ((5, 1), (7, 1)), 3),
+        (9, (4, 6), ((5, 1), (7, 2)), 3),
+        (9, (4, 7), ((5, 2), (8, 1)), 3),
+        (10, (4, 7), ((5, 2), (8, 2)), 3),
+    )
+    for shape_length, dashes, runs, code in shapes:
+        matched = iso_year & (length == shape_length)
+        for position in dashes:
+            matched &= is_dash[:, position]
+        parts = []
+        for start, size in runs:
+            matched &= is_digit[:, start:start + size].all(axis=1)
+            parts.append(
+                digit[:, start:start + size]
+                @ np.array([10, 1][-size:]))
+        if code == 3 and not full_dates:
+            # Rejected by parse_relaxed_date()
+            handled |= matched
+            continue
+        handled |= matched
+        specificity[matched] = code
+        year[matched] = iso_year_value[matched]
+        if parts:
+            month[matched] = parts[0][matched]
+        if len(parts) > 1:
+            day[matched] = parts[1][matched]
+
+    # Month YYYY, with a single space in between
+    rows = np.arange(count)
+    tail = length[:, None] - np.arange(5, 0, -1)  # space and year digits
+    tail_ok = length >= 6
+    tail_cols = np.clip(tail, 0, width - 1)
+    tail_chars = chars[rows[:, None], tail_cols]
+    named = (
+        ~handled & tail_ok
+        & (tail_chars[:, 0] == ord(' '))
+        & ((tail_chars[:, 1:] >= ord('0')) & (tail_chars[:, 1:] <= ord('9')))
+        .all(axis=1))
+    if named.any():
+        prefix = np.where(
+            np.arange(width) < (length - 5)[:, None], chars, 0)[named]
+        # Other case differences are left to the slow path
+        upper = (prefix >= ord('A')) & (prefix <= ord('Z'))
+        lowered = np.where(upper, prefix + 32, prefix).astype(np.uint32)
+        names = np.ascontiguousarray(lowered).view(f'U{width}').ravel()
+
+        month_numbers = _dates._months()[1]
+        sorted_names = sorted(month_numbers)
+        table = np.array(sorted_names)
+        numbers = np.array([month_numbers[n] for n in sorted_names])
+        index = np.clip(np.searchsorted(table, names), 0, len(table) - 1)
+        found = table[index] == names
+
+        named_rows = np.flatnonzero(named)[found]
+        handled[named_rows] = True
+        specificity[named_rows] = 2
+        year[named_rows] = (
+            (tail_chars[named_rows, 1:].astype(np.int64) - ord('0'))
+            @ np.array([1000, 100, 10, 1]))
+        month[named_rows] = numbers[index[found]]
+
+    # Convert and validate what was classified
+    parsed = specificity > 0
+    valid = parsed & (year > 0) & (month >= 1) & (month <= 12) & (day >= 1)
+    months = ((year - 1970) * 12 + month - 1).astype('datetime64[M]')
+    converted = months.astype('datetime64[D]') + (day - 1)
+    valid &= converted.astype('datetime64[M]') == months
+    # Pydantic’s parser fails with the epoch
+    valid &= ~((specificity == 3) & (converted == np.datetime64('1970-01-01')))
+
+    result[valid] = converted[valid]
+    codes[valid] = specificity[valid]
+
+    rest = np.flatnonzero(~handled)
+    if rest.size:
+        _parse_each(arr, rest, result, codes, full_dates)
+    return result, codes
+
+
+def _parse_each(
+    arr: Any,
+    indices: Any,
+    result: Any,
+    codes: Any,
+    full_dates: bool,
+) -> None:
+    """Parses values at given indices one by one,
+    filling in results and codes."""
+    for i in indices.tolist():
+        value = str(arr[i])
+        if full_dates:
+            try:
+                validated = _dates.validate_relaxed_date(value)
+            except ValueError:
+                continue
+            if isinstance(validated, _dates.RelaxedDate):
+                date, specificity = validated.date, validated.specificity
+            else:
+                date, specificity = validated, 'day'
+        else:
+            parsed = _dates.parse_relaxed_date(value)
+            if parsed is None:
+                continue
+            date, _, specificity = parsed
+        if specificity not in SPECIFICITIES:
+            raise ValueError(f"Unknown date specificity: {specificity}")
+        result[i] = date
+        codes[i] = SPECIFICITIES.index(specificity) + 1
@@ -1,5 +1,8 @@
 import datetime
-from typing import List, Tuple, Union, Optional
+import functools
+import locale
+import re
+from typing import Any, Dict, List, Tuple, Union, Optional
 
 from pydantic import validator
 from pydantic.dataclasses import dataclass
@@ -7,10 +10,14 @@ from pydantic.datetime_parse import parse_date
 
 __all__ = (
   'Date',
+  'RelaxedDate',
   'parse_relaxed_date',
   'parse_date_pydantic',
   'validate_relaxed_date',
   'EXTRA_DATE_FORMATS',
+  'RELAXED_DATE_CACHE_SIZE',
+  'relaxed_date_cache_info',
+  'clear_relaxed_date_cache',
 )
 
 
@@ -23,6 +30,7 @@ class Date:
 
     Can either be a fully-formed date,
     or a low-specificity date like YYYY or YYYY-MM.
+    The latter is validated into a :class:`.RelaxedDate`.
     """
 
     type: str
@@ -33,6 +41,63 @@ class Date:
         return validate_relaxed_date(v)
 
 
+class RelaxedDate(str):
+    """A low-specificity date, such as ``"March 1997"`` or ``"1997"``.
+
+    It is the formatted string :func:`.validate_relaxed_date()`
+    has always returned, and can be used as one,
+    but also keeps the parsed date and its specificity,
+    so that they don’t have to be parsed out of the string again.
+
+    Instances are immutable.
+    """
+
+    __slots__ = ('date', 'specificity')
+
+    date: datetime.date
+    """Parsed date. Components beyond given specificity are 1."""
+
+    specificity: str
+    """``"month"`` or ``"year"``
+    (or as set in :data:`EXTRA_DATE_FORMATS`)."""
+
+    def __new__(
+        cls,
+        date: datetime.date,
+        specificity: str,
+        display: Optional[str] = None,
+    ) -> 'RelaxedDate':
+        """
+        :param display: formatted string.
+                        If not given, it is formatted
+                        the way :data:`EXTRA_DATE_FORMATS` would
+                        for given specificity.
+        """
+        if display is None:
+            if specificity not in _OUTPUT_FORMATS:
+                raise ValueError(
+                    f"No default format for specificity {specificity!r}")
+            display = _format_date(date, specificity)
+        obj = super().__new__(cls, display)
+        object.__setattr__(obj, 'date', date)
+        object.__setattr__(obj, 'specificity', specificity)
+        return obj
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return type(self), (self.date, self.specificity, str(self))
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}({self.date!r}, '
+            f'{self.specificity!r}, {str(self)!r})')
+
+
 EXTRA_DATE_FORMATS: List[Tuple[str, str, str]] = [
     ('%Y-%m', '%B %Y', 'month'),
     ('%B %Y', '%B %Y', 'month'),
@@ -49,10 +114,43 @@ Used by :func:`.parse_relaxed_date()`.
 """
 
 
+RELAXED_DATE_CACHE_SIZE = 4096
+"""Maximum number of distinct strings remembered
+by :func:`.parse_relaxed_date()` and :func:`.validate_relaxed_date()`
+each. Least recently used strings are evicted first."""
+
+
 def parse_relaxed_date(v: str) -> Union[None, Tuple[datetime.date, str, str]]:
     """Parses a relaxed date and returns a 3-tuple
     containing date, formatted string, and specificity ("month" or "year").
+
+    Common shapes of strings are recognized in a single pass,
+    others are tried with ``strptime()`` against each of
+    :data:`EXTRA_DATE_FORMATS`.
+
+    Results for strings are cached (see :func:`.relaxed_date_cache_info()`).
+    A :class:`.RelaxedDate` is not parsed again.
     """
+    if isinstance(v, RelaxedDate):
+        return v.date, str(v), v.specificity
+    if type(v) is str:
+        return _parse_relaxed_date_cached(v)
+    return _parse_relaxed_date_strptime(v)
+
+
+def _parse_relaxed_date(v: str) -> Union[None, Tuple[datetime.date, str, str]]:
+    parsed = _classify_date(v)
+    if parsed is _UNCLASSIFIED:
+        return _parse_relaxed_date_strptime(v)
+    if parsed is None or parsed[1] == 'day':
+        return None
+    date, specificity = parsed
+    return date, _format_date(date, specificity), specificity
+
+
+def _parse_relaxed_date_strptime(
+    v: str,
+) -> Union[None, Tuple[datetime.date, str, str]]:
     for in_f, out_f, specificity in EXTRA_DATE_FORMATS:
         try:
             date = datetime.datetime.strptime(v, in_f).date()
@@ -63,6 +161,11 @@ def parse_relaxed_date(v: str) -> Union[None, Tuple[datetime.date, str, str]]:
     return None
 
 
+_parse_relaxed_date_cached = functools.lru_cache(
+    maxsize=RELAXED_DATE_CACHE_SIZE,
+)(_parse_relaxed_date)
+
+
 def parse_date_pydantic(v) -> Union[datetime.date, None]:
     """Parses given date or string using Pydantic’s ``parse_date()``,
     which must return a date or raise a subclass of :class:`ValueError`.
@@ -75,7 +178,7 @@ def parse_date_pydantic(v) -> Union[datetime.date, None]:
     except ValueError:
         return None
     else:
-        return parsed if parsed != datetime.date(1970, 1, 1) else None
+        return parsed if parsed != _EPOCH else None
 
 
 def validate_relaxed_date(v, optional=False):
@@ -86,22 +189,181 @@ def validate_relaxed_date(v, optional=False):
     if returned date is the epoch.
 
     Then tries ``strptime()`` on each of the :data:`EXTRA_DATE_FORMATS`,
-    and returns back a string from ``strftime()``.
+    and returns back a string from ``strftime()``
+    as a :class:`.RelaxedDate`.
+
+    Common shapes of strings (full dates, ``YYYY-MM``, ``Month YYYY``
+    and ``YYYY``) are recognized in a single pass with the same outcome,
+    without going through the above.
+
+    Outcomes for strings, including failures, are cached
+    (see :func:`.relaxed_date_cache_info()`).
     """
 
     if optional and v is None:
         return None
 
-    parsed = parse_date_pydantic(v)
-
-    if not parsed:
-        parsed_relaxed = parse_relaxed_date(v)
+    if isinstance(v, RelaxedDate):
+        return v
 
-        if parsed_relaxed is not None:
-            return parsed_relaxed[1]
+    if type(v) is str:
+        result = _validate_relaxed_date_cached(v)
+    else:
+        result = _validate_relaxed_date(v)
 
+    if result is None:
         raise ValueError(
             "Failed to parse given string "
             "even as an unspecific date")
+    return result
+
+
+def _validate_relaxed_date(v) -> Union[datetime.date, RelaxedDate, None]:
+    if type(v) is str:
+        parsed = _classify_date(v)
+        if parsed is not _UNCLASSIFIED:
+            if parsed is None:
+                return None
+            date, specificity = parsed
+            if specificity == 'day':
+                return date if date != _EPOCH else None
+            return RelaxedDate(date, specificity)
+
+    return _validate_relaxed_date_strptime(v)
+
+
+def _validate_relaxed_date_strptime(
+    v,
+) -> Union[datetime.date, RelaxedDate, None]:
+    parsed_date = parse_date_pydantic(v)
+
+    if not parsed_date:
+        parsed_relaxed = _parse_relaxed_date_strptime(v)
+
+        if parsed_relaxed is not None:
+            date, display, specificity = parsed_relaxed
+            return RelaxedDate(date, specificity, display)
+
+        return None
     else:
-        return parsed
+        return parsed_date
+
+
+_validate_relaxed_date_cached = functools.lru_cache(
+    maxsize=RELAXED_DATE_CACHE_SIZE,
+)(_validate_relaxed_date)
+
+
+def relaxed_date_cache_info() -> Dict[str, functools._CacheInfo]:
+    """Returns hit and miss statistics of relaxed date caches,
+    as :func:`functools.lru_cache` info tuples
+    keyed by function name (``parse_relaxed_date``
+    and ``validate_relaxed_date``).
+
+    Caches are shared by all threads in the process.
+    """
+    return {
+        'parse_relaxed_date': _parse_relaxed_date_cached.cache_info(),
+        'validate_relaxed_date': _validate_relaxed_date_cached.cache_info(),
+    }
+
+
+def clear_relaxed_date_cache():
+    """Empties relaxed date caches and resets their statistics."""
+    _parse_relaxed_date_cached.cache_clear()
+    _validate_relaxed_date_cached.cache_clear()
+
+
+_EPOCH = datetime.date(1970, 1, 1)
+
+_DEFAULT_EXTRA_DATE_FORMATS = list(EXTRA_DATE_FORMATS)
+
+_OUTPUT_FORMATS = {
+    specificity: out_f
+    for _, out_f, specificity in _DEFAULT_EXTRA_DATE_FORMATS
+}
+
+_UNCLASSIFIED = object()
+
+_DATE_RE = re.compile(
+    r'(?P<year>\d{4})(?:-(?P<month>\d{1,2})(?:-(?P<day>\d{1,2}))?)?'
+    r'|(?P<month_name>[^\W\d_]+)\s+(?P<named_year>\d{4})')
+"""Matches a full date, ``YYYY-M(M)``, ``Month YYYY`` or ``YYYY``."""
+
+_month_names: Tuple[str, ...] = ()
+_month_numbers: Dict[str, int] = {}
+_months_locale: Optional[str] = None
+
+
+def _classify_date(v: str) -> Any:
+    """Parses given string in one pass, the way
+    Pydantic’s ``parse_date()`` followed by ``strptime()``
+    with each of default :data:`EXTRA_DATE_FORMATS` would.
+
+    :returns: a 2-tuple of date and specificity
+              (``"day"``, ``"month"`` or ``"year"``),
+              ``None`` if the string is known to be invalid,
+              or ``_UNCLASSIFIED`` if it has to be parsed the slow way
+              (unusual strings, such as numbers Pydantic
+              would take for timestamps, or customized formats).
+    """
+    match = _DATE_RE.fullmatch(v)
+    if match is None or EXTRA_DATE_FORMATS != _DEFAULT_EXTRA_DATE_FORMATS:
+        return _UNCLASSIFIED
+
+    year_s, month_s, day_s, month_name, named_year_s = match.groups()
+
+    if year_s is None:
+        month = _months()[1].get(month_name.lower())
+        if month is None:
+            return _UNCLASSIFIED
+        year = int(named_year_s)
+        return (datetime.date(year, month, 1), 'month') if year else None
+
+    year = int(year_s)
+
+    if day_s is not None:
+        try:
+            return datetime.date(year, int(month_s), int(day_s)), 'day'
+        except ValueError:
+            return None
+
+    if month_s is not None:
+        if not month_s.isascii():
+            # Unlike elsewhere, strptime() only takes ASCII digits here
+            return _UNCLASSIFIED
+        month = int(month_s)
+        if not year or not 1 <= month <= 12:
+            return None
+        return datetime.date(year, month, 1), 'month'
+
+    return (datetime.date(year, 1, 1), 'year') if year else None
+
+
+def _format_date(date: datetime.date, specificity: str) -> str:
+    """Formats given date like ``strftime()`` would
+    with the output format for given specificity."""
+    if date.year < 1000:
+        # Not zero-padded on some platforms
+        return date.strftime(_OUTPUT_FORMATS[specificity])
+    if specificity == 'month':
+        return f'{_months()[0][date.month - 1]} {date.year}'
+    return str(date.year)
+
+
+def _months() -> Tuple[Tuple[str, ...], Dict[str, int]]:
+    """Returns full month names in current locale,
+    and month numbers keyed by lowercase name."""
+    global _month_names, _month_numbers, _months_locale
+
+    current_locale = locale.setlocale(locale.LC_TIME)
+    if current_locale != _months_locale:
+        _month_names = tuple(
+            datetime.date(2000, month, 1).strftime('%B')
+            for month in range(1, 13))
+        _month_numbers = {
+            name.lower(): month
+            for month, name in enumerate(_month_names, 1)
+        }
+        _months_locale = current_locale
+    return _month_names, _month_numbers
@@ -0,0 +1,145 @@
+"""
+Exporting items as plain data.
+
+Pydantic’s ``BaseModel.dict()`` leaves dataclass members
+(which most leaf values are) as they are, and ``BaseModel.json()``
+encodes them through a generic fallback that calls
+:func:`dataclasses.asdict()` on each one.
+
+:func:`.to_dict()` converts a whole item to plain dictionaries,
+lists and scalars in one pass, using field names of each class
+looked up once. :func:`.to_json_bytes()` encodes the result,
+with `orjson <https://github.com/ijl/orjson>`_ if it is installed
+(the ``orjson`` extra)::
+
+    for item in load_items(path):
+        out.write(to_json_bytes(item, exclude_none=True) + b'\\n')
+
+Both work with any model or dataclass instance,
+including lazy, compact, shared and stored variants.
+"""
+
+import dataclasses
+import datetime
+import json
+from typing import Any, Callable, Dict, Tuple
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+__all__ = (
+    'to_dict',
+    'to_json_bytes',
+)
+
+
+_SCALAR_TYPES = frozenset((
+    str, int, float, bool, type(None),
+    datetime.date, datetime.datetime,
+))
+
+
+def to_dict(obj: Any, exclude_none: bool = False) -> Any:
+    """Returns given model or dataclass instance
+    (e.g., a :class:`~relaton.models.bibdata.BibliographicItem`)
+    as nested plain dictionaries and lists.
+
+    Dates are left as they are, as with ``BaseModel.dict()``.
+    Extra properties of models are included.
+
+    :param exclude_none: leave out properties whose value is ``None``.
+    """
+    return _convert(obj, exclude_none)
+
+
+def to_json_bytes(obj: Any, exclude_none: bool = False) -> bytes:
+    """Returns given model or dataclass instance as UTF-8 encoded JSON,
+    which decodes to the same data as ``BaseModel.json()`` output.
+
+    :param exclude_none: leave out properties whose value is ``None``.
+    """
+    data = _convert(obj, exclude_none)
+    if orjson is not None:
+        return orjson.dumps(data)
+    return _dumps(data)
+
+
+def _dumps(data: Any) -> bytes:
+    """Encodes plain data with the standard library."""
+    return json.dumps(
+        data,
+        default=_encode_date,
+        ensure_ascii=False,
+        separators=(',', ':'),
+    ).encode('utf-8')
+
+
+def _convert(value: Any, exclude_none: bool) -> Any:
+    cls = type(value)
+    if cls in _SCALAR_TYPES:
+        return value
+    if cls is list or cls is tuple:
+        return [_convert(i, exclude_none) for i in value]
+    if cls is dict:
+        return {
+            key: _convert(i, exclude_none)
+            for key, i in value.items()
+            if not (exclude_none and i is None)
+        }
+
+    items = _items_getter(cls)
+    if items is None:
+        if isinstance(value, (list, tuple, dict)):
+            return _convert(
+                dict(value) if isinstance(value, dict) else list(value),
+                exclude_none)
+        # Subclasses of scalar types, such as RelaxedDate
+        return value
+    return {
+        key: _convert(i, exclude_none)
+        for key, i in items(value)
+        if not (exclude_none and i is None)
+    }
+
+
+_getters: Dict[type, Any] = {}
+
+
+def _items_getter(cls: type) -> Any:
+    """Returns a function giving (name, value) pairs
+    of an instance of given class, or ``None``
+    if instances are to be returned as they are."""
+    try:
+        return _getters[cls]
+    except KeyError:
+        pass
+
+    getter: Any
+    if issubclass(cls, BaseModel):
+        # Iterating lazy items validates their pending properties
+        getter = iter
+    elif dataclasses.is_dataclass(cls):
+        getter = _dataclass_getter(tuple(
+            field.name for field in dataclasses.fields(cls)))
+    else:
+        getter = None
+    _getters[cls] = getter
+    return getter
+
+
+def _dataclass_getter(
+    names: Tuple[str, ...],
+) -> Callable[[Any], Any]:
+    def items(value: Any):
+        return ((name, getattr(value, name)) for name in names)
+    return items
+
+
+def _encode_date(value: Any) -> str:
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
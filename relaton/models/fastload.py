@@ -0,0 +1,501 @@
+"""
+Fast validating construction of bibliographic items,
+using loader functions generated from model annotations.
+
+On first use, Python source is generated for each model reachable
+from the root model (by default,
+:class:`~relaton.models.bibdata.BibliographicItem`):
+one straight-line function per model, with type checks
+and single-or-list decisions inlined, and with models, validators
+and fields bound as globals instead of being looked up at runtime.
+
+Generated loaders only take the common path on their own.
+Whenever data needs something they can’t decide with certainty—a shape
+Pydantic would coerce in a special way, such as a list passed
+where a dataclass is expected, or a value Pydantic would reject—the whole
+document is handed over to Pydantic instead. This way results,
+including validation errors, are the same as ``BibliographicItem(**data)``.
+
+Fields of types the generator doesn’t handle (such as typed dictionaries)
+are validated by Pydantic’s own field validation from generated code.
+
+Generated source can be inspected with :func:`.loader_source()`.
+"""
+
+import dataclasses
+import datetime
+import functools
+import itertools
+import typing
+from collections import deque
+from decimal import Decimal
+from types import GeneratorType
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, overload
+
+from pydantic import BaseModel, Extra
+from pydantic.datetime_parse import parse_date
+from pydantic.fields import ModelField
+from pydantic.validators import bool_validator, int_validator, str_validator
+
+from .bibdata import BibliographicItem
+from .introspection import is_model, is_pydantic_model, unwrap_optional
+
+__all__ = (
+    'load_fast',
+    'loader_source',
+)
+
+
+T = TypeVar('T')
+
+
+@overload
+def load_fast(data: Dict[str, Any]) -> BibliographicItem: ...
+
+
+@overload
+def load_fast(data: Dict[str, Any], model: Type[T]) -> T: ...
+
+
+def load_fast(data, model=BibliographicItem):
+    """Validates given dictionary into an instance of given model
+    (by default, :class:`~relaton.models.bibdata.BibliographicItem`)
+    using generated loaders, falling back to Pydantic
+    for anything off the common path.
+
+    Gives the same result as instantiating the model
+    with ``data`` as keyword arguments.
+
+    Can be used as ``factory`` in :func:`relaton.io.load_items()`.
+
+    :raises pydantic.ValidationError: data is invalid
+    """
+    load = _compile(model)[0]
+    try:
+        return load(data)
+    except _GIVE_UP:
+        return model(**data)
+
+
+def loader_source(model: Any = BibliographicItem) -> str:
+    """Returns generated loader source for given root model."""
+    return _compile(model)[1]
+
+
+class _Fallback(Exception):
+    """Raised by generated code when it can’t tell
+    how Pydantic would treat given data."""
+
+
+class _Mismatch(_Fallback):
+    """Raised by generated code when Pydantic would certainly
+    reject given value, so a union may try its next member."""
+
+
+class _Unsupported(Exception):
+    """Raised while generating when a type
+    has to be left to Pydantic."""
+
+
+_GIVE_UP = (_Fallback, ValueError, TypeError, AssertionError)
+"""Exceptions after which generated loaders defer to Pydantic.
+Validators signal failure with the latter three."""
+
+_REJECTED = (_Mismatch, ValueError, TypeError, AssertionError)
+"""Exceptions meaning Pydantic would reject a value.
+Generated code only raises the latter three from Pydantic’s
+own validators, so they are as certain as ``_Mismatch``."""
+
+_IMMUTABLE_DEFAULTS = (type(None), str, int, float, bool, bytes)
+
+
+def _fail(v: Any):
+    raise _Fallback
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(model: Any) -> Tuple[Any, str]:
+    generator = _LoaderGenerator()
+    entry = generator.loader_name(model)
+    source = generator.generate()
+    namespace = generator.namespace
+    exec(compile(source, f'<relaton loaders for {model.__name__}>', 'exec'),
+         namespace)
+    return namespace[entry], source
+
+
+class _LoaderGenerator:
+    """Generates loader functions for a model
+    and all models it references."""
+
+    def __init__(self):
+        self.namespace: Dict[str, Any] = {
+            '_Fallback': _Fallback,
+            '_Mismatch': _Mismatch,
+            '_REJECTED': _REJECTED,
+            '_MISSING': dataclasses.MISSING,
+            '_new': object.__new__,
+            '_setattr': object.__setattr__,
+            '_fail': _fail,
+            '_str': str_validator,
+            '_bool': bool_validator,
+            '_int': int_validator,
+            '_parse_date': parse_date,
+            '_date': datetime.date,
+            '_is_dataclass': dataclasses.is_dataclass,
+            # What Pydantic treats as a sequence, string or dataclass input
+            '_SEQUENCE_INPUTS': (
+                list, tuple, set, frozenset, GeneratorType, deque),
+            '_STR_INPUTS': (str, int, float, Decimal, bytes, bytearray),
+            '_DATACLASS_INPUTS': (list, tuple, dict),
+        }
+        self.loaders: Dict[Any, str] = {}
+        self.unions: Dict[str, str] = {}
+        self.pending: List[Any] = []
+        self.chunks: List[List[str]] = []
+        self.counter = itertools.count()
+
+    def generate(self) -> str:
+        while self.pending:
+            self.chunks.append(self.model_source(self.pending.pop(0)))
+        return '\n\n'.join('\n'.join(chunk) for chunk in self.chunks) + '\n'
+
+    def bind(self, name: str, obj: Any) -> str:
+        """Makes given object available to generated code
+        under given name (suffixed if taken) and returns the name."""
+        if name in self.namespace and self.namespace[name] is not obj:
+            name = f'{name}_{next(self.counter)}'
+        self.namespace[name] = obj
+        return name
+
+    def loader_name(self, cls: Any) -> str:
+        if cls not in self.loaders:
+            self.loaders[cls] = self.bind(f'_load_{cls.__name__}', None)
+            self.pending.append(cls)
+        return self.loaders[cls]
+
+    def model_source(self, cls: Any) -> List[str]:
+        name = self.loaders[cls]
+        ref = self.bind(f'_c_{cls.__name__}', cls)
+        is_pydantic = is_pydantic_model(cls)
+        model = cls if is_pydantic else cls.__pydantic_model__
+
+        if not self.is_supported(cls, model):
+            validate = 'validate' if is_pydantic else '__validate__'
+            return [
+                f'def {name}(v):',
+                f'    return {ref}.{validate}(v)',
+            ]
+
+        lines = [f'def {name}(v):', '    if v.__class__ is not dict:']
+        if is_pydantic:
+            lines.extend([
+                f'        if isinstance(v, {ref}):',
+                f'            return {ref}.validate(v)',
+                '        raise _Fallback',
+            ])
+        else:
+            # Pydantic instantiates dataclasses from sequences
+            # using items as positional arguments
+            names = tuple(f.name for f in dataclasses.fields(cls))
+            names_ref = self.bind(f'_names_{cls.__name__}', names)
+            lines.extend([
+                f'        if isinstance(v, {ref}):',
+                '            return v',
+                '        if v.__class__ is list or v.__class__ is tuple:',
+                f'            if len(v) > {len(names)}:',
+                '                raise _Mismatch',
+                f'            return {name}(dict(zip({names_ref}, v)))',
+                '        raise _Fallback',
+            ])
+        lines.extend(['    values = {}', '    n = 0'])
+
+        hints = typing.get_type_hints(cls)
+        defaults = (
+            {} if is_pydantic
+            else {f.name: f for f in dataclasses.fields(cls)})
+        for field_name, field in model.__fields__.items():
+            lines.extend(self.field_source(
+                cls, ref, field, hints[field_name],
+                defaults.get(field_name)))
+
+        if is_pydantic:
+            lines.extend(self.extra_source(cls, model))
+            lines.extend([
+                f'    o = _new({ref})',
+                '    _setattr(o, \'__dict__\', values)',
+                '    _setattr(o, \'__fields_set__\', fields_set)',
+            ])
+            if cls.__private_attributes__:
+                lines.append('    o._init_private_attributes()')
+        else:
+            lines.extend([
+                '    if n != len(v):',
+                '        raise _Mismatch',
+                # Mark the instance as processed by Pydantic’s __post_init__
+                '    values[\'__initialised__\'] = True',
+                f'    o = _new({ref})',
+                '    _setattr(o, \'__dict__\', values)',
+            ])
+        lines.append('    return o')
+        return lines
+
+    def is_supported(self, cls: Any, model: Type[BaseModel]) -> bool:
+        config = model.__config__
+        if (model.__pre_root_validators__
+                or model.__post_root_validators__
+                or config.smart_union
+                or config.anystr_strip_whitespace
+                or config.anystr_lower
+                or config.min_anystr_length
+                or config.max_anystr_length is not None):
+            return False
+        if any(field.alias != name or field.validate_always
+               for name, field in model.__fields__.items()):
+            return False
+        if is_pydantic_model(cls):
+            return config.extra is not Extra.forbid and not config.validate_all
+        return (
+            not hasattr(cls, '__post_init_original__')
+            and not hasattr(cls, '__post_init_post_parse__')
+            and all(f.init for f in dataclasses.fields(cls)))
+
+    def field_source(
+        self,
+        cls: Any,
+        cls_ref: str,
+        field: ModelField,
+        hint: Any,
+        dc_field: Optional[dataclasses.Field[Any]],
+    ) -> List[str]:
+        key = repr(field.name)
+        target = f'values[{key}]'
+        validate_default = False
+
+        if dc_field is None:
+            # Pydantic model: defaults are used as is
+            if field.required:
+                missing = 'raise _Mismatch'
+            else:
+                missing = f'{target} = {self.default_expr(field)}'
+        elif dc_field.default_factory is not dataclasses.MISSING:
+            # Dataclass: defaults are validated along with given values
+            factory = self.bind(
+                f'_factory_{cls.__name__}_{field.name}',
+                dc_field.default_factory)
+            missing, validate_default = f'x = {factory}()', True
+        elif dc_field.default is dataclasses.MISSING:
+            missing = 'raise _Mismatch'
+        elif dc_field.default is None and field.allow_none \
+                and not field.pre_validators:
+            missing = f'{target} = None'
+        else:
+            default = self.bind(
+                f'_default_{cls.__name__}_{field.name}', dc_field.default)
+            missing, validate_default = f'x = {default}', True
+
+        lines = [
+            f'    x = v.get({key}, _MISSING)',
+            '    if x is _MISSING:',
+            f'        {missing}',
+            '    else:',
+            '        n += 1',
+        ]
+        body = self.validation_source(cls, cls_ref, field, hint, target)
+        if validate_default:
+            return lines + body
+        return lines + ['    ' + line for line in body]
+
+    def validation_source(
+        self,
+        cls: Any,
+        cls_ref: str,
+        field: ModelField,
+        hint: Any,
+        target: str,
+    ) -> List[str]:
+        """Returns lines validating ``x`` into ``target``,
+        indented as top-level function statements."""
+        prefix = f'{cls.__name__}_{field.name}'
+        field_ref = self.bind(f'_field_{prefix}', field)
+
+        has_other_validators = field.post_validators or any(
+            not validator.pre
+            for validator in (field.class_validators or {}).values())
+        try:
+            if has_other_validators:
+                raise _Unsupported
+            tp, optional = unwrap_optional(hint)
+            expr = self.expr(tp, 'x', 0)
+        except _Unsupported:
+            return [
+                f'    x, e = {field_ref}.validate('
+                f'x, values, loc={field.name!r}, cls={cls_ref})',
+                '    if e is not None:',
+                '        raise _Mismatch',
+                f'    {target} = x',
+            ]
+
+        lines = []
+        for i, validator in enumerate(field.pre_validators or ()):
+            validator_ref = self.bind(f'_pre_{prefix}_{i}', validator)
+            lines.append(
+                f'    x = {validator_ref}({cls_ref}, x, values, '
+                f'{field_ref}, {field_ref}.model_config)')
+        if optional or field.allow_none:
+            expr = f'None if x is None else {expr}'
+        lines.append(f'    {target} = {expr}')
+        return lines
+
+    def default_expr(self, field: ModelField) -> str:
+        if field.default_factory is None \
+                and isinstance(field.default, _IMMUTABLE_DEFAULTS):
+            return repr(field.default)
+        field_ref = self.bind(f'_field_{field.name}', field)
+        return f'{field_ref}.get_default()'
+
+    def extra_source(self, cls: Any, model: Type[BaseModel]) -> List[str]:
+        names = self.bind(
+            f'_fields_{cls.__name__}', frozenset(model.__fields__))
+        if model.__config__.extra is Extra.allow:
+            return [
+                '    if n != len(v):',
+                '        for k in v:',
+                f'            if k not in {names}:',
+                '                values[k] = v[k]',
+                '    fields_set = set(v)',
+            ]
+        return [
+            '    fields_set = set(v)',
+            '    if n != len(v):',
+            f'        fields_set &= {names}',
+        ]
+
+    def expr(self, tp: Any, var: str, depth: int) -> str:
+        """Returns an expression that validates
+        a non-``None`` value in ``var`` as given type."""
+        origin = typing.get_origin(tp)
+
+        if origin is typing.Union:
+            return f'{self.union_name(tp)}({var})'
+
+        if origin is list:
+            (item_type, ) = typing.get_args(tp)
+            item = f'i{depth}'
+            item_expr = self.optional_expr(item_type, item, depth + 1)
+            return (
+                f'([{item_expr} for {item} in {var}] '
+                f'if {var}.__class__ is list else _fail({var}))')
+
+        if tp is str:
+            return f'({var} if {var}.__class__ is str else _str({var}))'
+        if tp is bool:
+            return (
+                f'({var} if {var} is True or {var} is False '
+                f'else _bool({var}))')
+        if tp is int:
+            return f'({var} if {var}.__class__ is int else _int({var}))'
+        if tp is datetime.date:
+            return (
+                f'({var} if {var}.__class__ is _date '
+                f'else _parse_date({var}))')
+        if is_model(tp):
+            return f'{self.loader_name(tp)}({var})'
+
+        raise _Unsupported
+
+    def optional_expr(self, tp: Any, var: str, depth: int) -> str:
+        tp, optional = unwrap_optional(tp)
+        expr = self.expr(tp, var, depth)
+        if optional:
+            return f'(None if {var} is None else {expr})'
+        return expr
+
+    def union_name(self, tp: Any) -> str:
+        # Unions compare equal regardless of member order,
+        # but order matters here
+        key = repr(tp)
+        if key not in self.unions:
+            # Generate branches first, so that unsupported types
+            # are found before anything is bound
+            branches = [self.branch_source(arg) for arg in typing.get_args(tp)]
+            name = self.bind(f'_union_{len(self.unions)}', None)
+            self.unions[key] = name
+            self.chunks.append(
+                [f'def {name}(v):', '    t = v.__class__']
+                + [line for branch in branches for line in branch]
+                + ['    raise _Mismatch'])
+        return self.unions[key]
+
+    def branch_source(self, tp: Any) -> List[str]:
+        """Returns lines trying a member of a union on ``v``.
+
+        Each branch returns if Pydantic would accept the value
+        as this member, falls through if Pydantic would certainly reject it
+        (so that the next member is tried), and raises ``_Fallback``
+        if it can’t tell.
+        """
+        if typing.get_origin(tp) is list:
+            (item_type, ) = typing.get_args(tp)
+            item_expr = self.optional_expr(item_type, 'i0', 1)
+            return [
+                '    if t is list:',
+                '        try:',
+                f'            return [{item_expr} for i0 in v]',
+                '        except _REJECTED:',
+                '            pass',
+                '    elif isinstance(v, _SEQUENCE_INPUTS):',
+                '        raise _Fallback',
+            ]
+
+        if tp is str:
+            return [
+                '    if t is str:',
+                '        return v',
+                '    if isinstance(v, _STR_INPUTS):',
+                '        return _str(v)',
+            ]
+
+        if tp is datetime.date:
+            return [
+                '    if t is _date:',
+                '        return v',
+                '    if not isinstance(v, (list, dict)):',
+                '        raise _Fallback',
+            ]
+
+        if is_model(tp):
+            loader = self.loader_name(tp)
+            ref = self.bind(f'_c_{tp.__name__}', tp)
+            if is_pydantic_model(tp):
+                return [
+                    '    if t is dict:',
+                    '        try:',
+                    f'            return {loader}(v)',
+                    '        except _REJECTED:',
+                    '            pass',
+                    f'    elif isinstance(v, {ref}):',
+                    f'        return {ref}.validate(v)',
+                    '    else:',
+                    '        raise _Fallback',
+                ]
+            return [
+                '    if t is dict or t is list or t is tuple:',
+                '        try:',
+                f'            return {loader}(v)',
+                '        except _REJECTED:',
+                '            pass',
+                f'    elif isinstance(v, {ref}):',
+                '        return v',
+                '    elif isinstance(v, _DATACLASS_INPUTS) or _is_dataclass(v):',
+                '        raise _Fallback',
+            ]
+
+        if tp in (bool, int):
+            return [
+                f'    if t is {tp.__name__}:',
+                '        return v',
+                '    raise _Fallback',
+            ]
+
+        raise _Unsupported
@@ -0,0 +1,216 @@
+"""
+Content fingerprints of bibliographic items, stable across processes
+and runs, for use as cache keys, ETags or change detectors::
+
+    etag = fingerprint(item)
+
+:func:`.fingerprint()` walks a model tree in declared field order
+(extra properties in key order) and digests property names and values
+with BLAKE2b. Each model and dataclass instance is digested separately,
+and its digest is fed to its parent’s.
+
+Fingerprints reflect content only:
+
+- Instances of different variants of a class (lazy, compact,
+  canonical, frozen, etc.) with the same values have the same fingerprint.
+- Properties whose value is ``None`` are left out, so unset
+  properties and properties set to ``None`` make no difference.
+- A single value and a one-item list of that value have
+  the same fingerprint, since single-or-list properties accept both.
+
+:func:`.field_fingerprints()` returns a fingerprint for each property
+of an item (or of any model or dataclass instance),
+which tells which properties changed between two versions of an item.
+
+Frozen instances (see :mod:`relaton.models.frozen`) keep
+their fingerprint once it is computed, and so do frozen instances
+within them, which makes fingerprinting a frozen item again
+(or an item sharing frozen parts) nearly free.
+
+Other instances are not memoized: they can be modified at any depth
+(e.g., ``item.title[0].content = ...`` or ``item.docid.append(...)``)
+without the item being notified, so no ``__setattr__`` hook
+could tell when a cached fingerprint goes stale.
+Their fingerprint is computed anew each time.
+To fingerprint an item repeatedly, freeze it first::
+
+    item = freeze(item)
+    fingerprint(item)  # Computed
+    fingerprint(item)  # Cached
+
+Fingerprints may change between versions of this package
+if models or the algorithm change.
+"""
+
+import dataclasses
+import datetime
+from hashlib import blake2b
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .frozen import _Frozen
+
+__all__ = (
+    'fingerprint',
+    'field_fingerprints',
+    'DIGEST_SIZE',
+)
+
+
+DIGEST_SIZE = 16
+"""Size of digests in bytes. Fingerprints are twice as long,
+being hexadecimal."""
+
+
+def fingerprint(obj: Any) -> str:
+    """Returns the fingerprint of given item,
+    or of any model or dataclass instance, list or scalar value within one,
+    as a hexadecimal string.
+
+    :raises TypeError: if a value at any depth is of an unsupported type.
+    """
+    cls = type(obj)
+    if issubclass(cls, BaseModel) or _names(cls) is not None:
+        return _node_digest(obj).hex()
+    return _digest(obj).hex()
+
+
+def field_fingerprints(obj: Any) -> Dict[str, str]:
+    """Returns fingerprints of values of given model
+    or dataclass instance’s properties (except those set to ``None``),
+    keyed by property name.
+
+    The instance’s own fingerprint is not derived from these.
+
+    :raises TypeError: if given object is not a model or dataclass instance,
+                       or if a value is of an unsupported type.
+    """
+    return {
+        name: _digest(value).hex()
+        for name, value in _fields(obj)
+    }
+
+
+def _digest(value: Any) -> bytes:
+    tokens: List[str] = []
+    _encode(value, tokens)
+    return _hash(tokens)
+
+
+def _hash(tokens: List[str]) -> bytes:
+    return blake2b(
+        '\0'.join(tokens).encode('utf-8', 'surrogatepass'),
+        digest_size=DIGEST_SIZE,
+    ).digest()
+
+
+def _node_digest(obj: Any) -> bytes:
+    """Returns the digest of given model or dataclass instance,
+    memoized on frozen instances."""
+    frozen = isinstance(obj, _Frozen)
+    if frozen:
+        try:
+            return obj._fingerprint
+        except AttributeError:
+            pass
+    tokens: List[str] = []
+    for name, value in _fields(obj):
+        tokens.append(name)
+        _encode(value, tokens)
+    digest = _hash(tokens)
+    if frozen:
+        object.__setattr__(obj, '_fingerprint', digest)
+    return digest
+
+
+def _fields(obj: Any) -> List[Tuple[str, Any]]:
+    """Returns names and values of given instance’s properties
+    that aren’t ``None``, in a fixed order."""
+    cls = type(obj)
+    if issubclass(cls, BaseModel):
+        # Iterating lazy items validates their pending properties
+        values = dict(obj)
+        fields = [
+            (name, values.pop(name))
+            for name in cls.__fields__
+            if name in values
+        ]
+        fields.extend(sorted(values.items()))
+        return [(name, value) for name, value in fields if value is not None]
+
+    names = _names(cls)
+    if names is None:
+        raise TypeError(
+            f"Can’t fingerprint fields of {cls.__name__!r} objects")
+    return [
+        (name, value)
+        for name in names
+        if (value := getattr(obj, name)) is not None
+    ]
+
+
+def _encode(value: Any, tokens: List[str]):
+    """Appends tokens unambiguously representing given value."""
+    cls = type(value)
+    encode = _SCALAR_ENCODERS.get(cls)
+    if encode is not None:
+        tokens.append(encode(value))
+    elif isinstance(value, (list, tuple)):
+        if len(value) == 1:
+            _encode(value[0], tokens)
+        else:
+            tokens.append(f'[{len(value)}')
+            for i in value:
+                _encode(i, tokens)
+    elif isinstance(value, dict):
+        tokens.append(f'{{{len(value)}')
+        for key in sorted(value):
+            _encode(key, tokens)
+            _encode(value[key], tokens)
+    elif issubclass(cls, BaseModel) or _names(cls) is not None:
+        tokens.append(f'h{_node_digest(value).hex()}')
+    elif isinstance(value, str):
+        # Subclasses, such as RelaxedDate
+        tokens.append(_encode_str(value))
+    elif isinstance(value, datetime.date):
+        tokens.append(_encode_date(value))
+    else:
+        raise TypeError(f"Can’t fingerprint {cls.__name__!r} objects")
+
+
+def _encode_str(value: str) -> str:
+    # Length-prefixed, since strings may contain the separator
+    return f's{len(value)}:{value}'
+
+
+def _encode_date(value: datetime.date) -> str:
+    return f'd{value.isoformat()}'
+
+
+_SCALAR_ENCODERS: Dict[type, Callable[[Any], str]] = {
+    str: _encode_str,
+    type(None): lambda value: 'N',
+    bool: lambda value: 'T' if value else 'F',
+    int: lambda value: f'i{value}',
+    float: lambda value: f'f{value!r}',
+    datetime.date: _encode_date,
+    datetime.datetime: _encode_date,
+}
+
+
+_dataclass_names: Dict[type, Optional[Tuple[str, ...]]] = {}
+
+
+def _names(cls: type) -> Optional[Tuple[str, ...]]:
+    """Returns field names of given dataclass,
+    or ``None`` if it’s not a dataclass."""
+    try:
+        return _dataclass_names[cls]
+    except KeyError:
+        pass
+    names = None
+    if dataclasses.is_dataclass(cls):
+        names = tuple(field.name for field in dataclasses.fields(cls))
+    _dataclass_names[cls] = names
+    return names
@@ -0,0 +1,414 @@
+"""
+Immutable, hashable variants of bibliographic items,
+for processes that key dictionaries or deduplicate sets by items
+(or by their docids, organizations, etc.), or share items
+between threads without copying them.
+
+:func:`.freeze()` returns a copy of a validated item (or any model
+or dataclass instance within one) made of frozen variants
+(see :data:`.FROZEN_VARIANTS`), with lists and dictionaries
+replaced with :class:`.FrozenList` and :class:`.FrozenDict`::
+
+    seen = set()
+    for item in load_items(path, factory=load_frozen):
+        if item not in seen:
+            seen.add(item)
+
+Frozen variants are subclasses of original classes,
+so serializers, :func:`relaton.util.as_list()` and Pydantic
+accept them as they are. They compare equal to original instances
+with the same values, and raise
+:class:`dataclasses.FrozenInstanceError` when their properties are set.
+Their hash is computed from property values on first use and kept.
+Extra properties of items are frozen, but don’t contribute to the hash.
+
+Constructing a frozen variant validates given data
+as the original class would.
+"""
+
+import dataclasses
+import datetime
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from .bibdata import (
+    BiblioNote,
+    BibliographicItem,
+    Contributor,
+    DocID,
+    Doctype,
+    Edition,
+    KeywordType,
+    Relation,
+    Role,
+    Series,
+    VersionInfo,
+)
+from .bibitemlocality import BibItemLocality, Locality, LocalityStack
+from .contacts import Address, ContactMethod, Phone
+from .dates import Date
+from .links import Link
+from .orgs import Organization
+from .people import Forename, FullName, GivenName, Person, PersonAffiliation
+from .strings import (
+    FormattedContent,
+    GenericStringValue,
+    GenericStringValueWithOptionalContent,
+    Title,
+)
+
+__all__ = (
+    'freeze',
+    'load_frozen',
+    'FrozenList',
+    'FrozenDict',
+    'FROZEN_VARIANTS',
+    'FrozenBibliographicItem',
+    'FrozenRelation',
+    'FrozenSeries',
+    'FrozenDocID',
+    'FrozenBiblioNote',
+    'FrozenRole',
+    'FrozenContributor',
+    'FrozenDoctype',
+    'FrozenEdition',
+    'FrozenKeywordType',
+    'FrozenVersionInfo',
+    'FrozenBibItemLocality',
+    'FrozenLocality',
+    'FrozenLocalityStack',
+    'FrozenPhone',
+    'FrozenAddress',
+    'FrozenContactMethod',
+    'FrozenDate',
+    'FrozenLink',
+    'FrozenOrganization',
+    'FrozenForename',
+    'FrozenGivenName',
+    'FrozenFullName',
+    'FrozenPersonAffiliation',
+    'FrozenPerson',
+    'FrozenFormattedContent',
+    'FrozenGenericStringValue',
+    'FrozenGenericStringValueWithOptionalContent',
+    'FrozenTitle',
+)
+
+
+T = TypeVar('T')
+
+
+_SCALAR_TYPES = frozenset((
+    str, int, float, bool, type(None),
+    datetime.date, datetime.datetime,
+))
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__!r} object is immutable")
+
+
+class FrozenList(List[Any]):
+    """An immutable, hashable list.
+
+    Compares equal to lists with the same items.
+    """
+
+    __slots__ = ('_hash',)
+    _hash: int
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = _immutable
+    sort = reverse = _immutable
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        self._hash = hash(tuple(self))
+        return self._hash
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+class FrozenDict(Dict[Any, Any]):
+    """An immutable, hashable dictionary.
+
+    Compares equal to dictionaries with the same items.
+    """
+
+    __slots__ = ('_hash',)
+    _hash: int
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    pop = popitem = clear = update = setdefault = _immutable
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        self._hash = hash(frozenset(self.items()))
+        return self._hash
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+class _Frozen:
+    """Makes a model or dataclass subclass immutable
+    and hashable, and comparable with its base."""
+
+    __slots__ = ()
+
+    frozen_of: ClassVar[Type[Any]]
+    frozen_fields: ClassVar[Tuple[str, ...]]
+
+    def __setattr__(self, name, value):
+        raise dataclasses.FrozenInstanceError(
+            f"Cannot assign to field {name!r} of a frozen instance")
+
+    def __delattr__(self, name):
+        raise dataclasses.FrozenInstanceError(
+            f"Cannot delete field {name!r} of a frozen instance")
+
+    def __hash__(self):
+        # Set by the first call; not copied or pickled,
+        # since hashes of strings differ between processes
+        try:
+            return self._hash  # type: ignore[attr-defined]
+        except AttributeError:
+            pass
+        value = hash((self.frozen_of, *(
+            getattr(self, name) for name in self.frozen_fields
+        )))
+        object.__setattr__(self, '_hash', value)
+        return value
+
+
+class _FrozenModel(_Frozen):
+
+    __slots__ = ()
+
+    def __init__(__pydantic_self__, **data: Any) -> None:
+        self = __pydantic_self__
+        super().__init__(**data)
+        object.__setattr__(self, '__dict__', {
+            name: _freeze(value)
+            for name, value in self.__dict__.items()
+        })
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            # Faster than comparing dumps, as BaseModel does
+            return self is other or self.__dict__ == other.__dict__
+        return super().__eq__(other)
+
+
+class _FrozenDataclass(_Frozen):
+
+    __slots__ = ('_hash', '_fingerprint')
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # Validated as by the original class
+        object.__setattr__(self, '__dict__', _frozen_values(
+            type(self),
+            self.frozen_of(*args, **kwargs)))
+
+    def __eq__(self, other):
+        if not isinstance(other, self.frozen_of):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.frozen_fields)
+
+    __hash__ = _Frozen.__hash__
+
+    def __getstate__(self):
+        # Leaves out the cached hash,
+        # and is restored without calling __setattr__()
+        return self.__dict__
+
+
+def _frozen_variant(cls: Type[Any]) -> Type[Any]:
+    """Returns a frozen subclass of given model or dataclass."""
+    namespace: Dict[str, Any] = {
+        '__doc__': (
+            f"Frozen variant of "
+            f":class:`~{cls.__module__}.{cls.__name__}`."),
+        '__module__': __name__,
+        'frozen_of': cls,
+    }
+    if issubclass(cls, BaseModel):
+        namespace['frozen_fields'] = tuple(cls.__fields__)
+        # Otherwise Pydantic would take it for a field
+        namespace['__annotations__'] = {
+            'frozen_fields': ClassVar[Tuple[str, ...]],
+        }
+        namespace['__slots__'] = ('_hash', '_fingerprint')
+        # Pydantic sets __hash__ of non-frozen models to None
+        namespace['__hash__'] = _Frozen.__hash__
+        bases: Any = (_FrozenModel, cls)
+    else:
+        namespace['frozen_fields'] = tuple(
+            field.name for field in dataclasses.fields(cls))
+        bases = (_FrozenDataclass, cls)
+    metaclass: Any = type(cls)
+    return metaclass(f'Frozen{cls.__name__}', bases, namespace)
+
+
+FrozenBibliographicItem = _frozen_variant(BibliographicItem)
+FrozenRelation = _frozen_variant(Relation)
+FrozenSeries = _frozen_variant(Series)
+FrozenDocID = _frozen_variant(DocID)
+FrozenBiblioNote = _frozen_variant(BiblioNote)
+FrozenRole = _frozen_variant(Role)
+FrozenContributor = _frozen_variant(Contributor)
+FrozenDoctype = _frozen_variant(Doctype)
+FrozenEdition = _frozen_variant(Edition)
+FrozenKeywordType = _frozen_variant(KeywordType)
+FrozenVersionInfo = _frozen_variant(VersionInfo)
+FrozenBibItemLocality = _frozen_variant(BibItemLocality)
+FrozenLocality = _frozen_variant(Locality)
+FrozenLocalityStack = _frozen_variant(LocalityStack)
+FrozenPhone = _frozen_variant(Phone)
+FrozenAddress = _frozen_variant(Address)
+FrozenContactMethod = _frozen_variant(ContactMethod)
+FrozenDate = _frozen_variant(Date)
+FrozenLink = _frozen_variant(Link)
+FrozenOrganization = _frozen_variant(Organization)
+FrozenForename = _frozen_variant(Forename)
+FrozenGivenName = _frozen_variant(GivenName)
+FrozenFullName = _frozen_variant(FullName)
+FrozenPersonAffiliation = _frozen_variant(PersonAffiliation)
+FrozenPerson = _frozen_variant(Person)
+FrozenFormattedContent = _frozen_variant(FormattedContent)
+FrozenGenericStringValue = _frozen_variant(GenericStringValue)
+FrozenGenericStringValueWithOptionalContent = _frozen_variant(
+    GenericStringValueWithOptionalContent)
+FrozenTitle = _frozen_variant(Title)
+
+
+FROZEN_VARIANTS: Dict[Type[Any], Type[Any]] = {
+    variant.frozen_of: variant
+    for variant in (
+        FrozenBibliographicItem,
+        FrozenRelation,
+        FrozenSeries,
+        FrozenDocID,
+        FrozenBiblioNote,
+        FrozenRole,
+        FrozenContributor,
+        FrozenDoctype,
+        FrozenEdition,
+        FrozenKeywordType,
+        FrozenVersionInfo,
+        FrozenBibItemLocality,
+        FrozenLocality,
+        FrozenLocalityStack,
+        FrozenPhone,
+        FrozenAddress,
+        FrozenContactMethod,
+        FrozenDate,
+        FrozenLink,
+        FrozenOrganization,
+        FrozenForename,
+        FrozenGivenName,
+        FrozenFullName,
+        FrozenPersonAffiliation,
+        FrozenPerson,
+        FrozenFormattedContent,
+        FrozenGenericStringValue,
+        FrozenGenericStringValueWithOptionalContent,
+        FrozenTitle,
+    )
+}
+"""Frozen variants keyed by original class.
+Instances of subclasses (such as lazy, shared or canonical variants)
+and of compact variants are frozen as instances
+of the nearest original class."""
+
+
+def load_frozen(data: Dict[str, Any]) -> BibliographicItem:
+    """Validates given item data and returns a frozen item.
+
+    Can be used as ``factory`` in :func:`relaton.io.load_items()`.
+    """
+    return freeze(BibliographicItem(**data))
+
+
+def freeze(obj: T) -> T:
+    """Returns a frozen copy of given validated model
+    or dataclass instance, or given instance if it’s frozen already.
+    Values are not validated again.
+
+    Lists, tuples and dictionaries at any depth are copied
+    as :class:`.FrozenList` and :class:`.FrozenDict`.
+    Other values (such as strings and dates) are shared with given instance.
+    """
+    return _freeze(obj)
+
+
+def _freeze(value: Any) -> Any:
+    cls = type(value)
+    if cls in _SCALAR_TYPES or cls is FrozenList or cls is FrozenDict:
+        return value
+    if isinstance(value, (list, tuple)):
+        return FrozenList(_freeze(i) for i in value)
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze(i)) for key, i in value.items())
+
+    variant = _variant(cls)
+    if variant is None or variant is cls:
+        return value
+    if issubclass(variant, BaseModel):
+        frozen = variant.__new__(variant)
+        object.__setattr__(frozen, '__dict__', {
+            # Iterating lazy items validates their pending properties
+            name: _freeze(i) for name, i in value
+        })
+        object.__setattr__(
+            frozen, '__fields_set__', set(value.__fields_set__))
+        return frozen
+    frozen = object.__new__(variant)
+    object.__setattr__(frozen, '__dict__', _frozen_values(variant, value))
+    return frozen
+
+
+def _frozen_values(variant: Type[Any], value: Any) -> Dict[str, Any]:
+    """Returns ``__dict__`` of a frozen variant instance
+    with values of given dataclass instance."""
+    values = {
+        field.name: _freeze(getattr(value, field.name))
+        for field in dataclasses.fields(variant.frozen_of)
+    }
+    if hasattr(variant, '__pydantic_model__'):
+        # Marks the instance as processed by Pydantic’s __post_init__
+        values['__initialised__'] = True
+    return values
+
+
+_variants: Dict[type, Optional[Type[Any]]] = {}
+
+
+def _variant(cls: type) -> Optional[Type[Any]]:
+    """Returns the frozen variant to copy instances of given class as,
+    which is the class itself if it’s a frozen variant,
+    or ``None`` if instances are to be left as they are."""
+    try:
+        return _variants[cls]
+    except KeyError:
+        pass
+    variant: Optional[Type[Any]] = None
+    if issubclass(cls, _Frozen):
+        variant = cls
+    else:
+        for base in getattr(cls, 'compact_of', cls).__mro__:
+            if base in FROZEN_VARIANTS:
+                variant = FROZEN_VARIANTS[base]
+                break
+    _variants[cls] = variant
+    return variant
@@ -0,0 +1,160 @@
+"""
+Helpers for walking the bibliographic data model
+based on field type annotations.
+
+Used by alternative construction paths
+(such as :mod:`~relaton.models.trusted`),
+which need to know the model structure without going through Pydantic.
+"""
+
+import dataclasses
+import functools
+import typing
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel
+
+__all__ = (
+    'FieldSpec',
+    'model_fields',
+    'is_model',
+    'is_pydantic_model',
+    'allows_extra',
+    'unwrap_optional',
+    'fits',
+)
+
+
+NoneType = type(None)
+
+
+class FieldSpec(NamedTuple):
+    """Describes a field of a model (dataclass or Pydantic model)."""
+
+    name: str
+
+    type: Any
+    """Resolved type annotation."""
+
+    required: bool
+
+    default: Any = None
+    """Default value, unless the field is required
+    or has a default factory."""
+
+    default_factory: Optional[Callable[[], Any]] = None
+
+
+def is_pydantic_model(tp: Any) -> bool:
+    """Returns ``True`` if given type is a Pydantic model class."""
+    return isinstance(tp, type) and issubclass(tp, BaseModel)
+
+
+def is_model(tp: Any) -> bool:
+    """Returns ``True`` if given type is a Pydantic model class
+    or a dataclass."""
+    return isinstance(tp, type) and (
+        issubclass(tp, BaseModel)
+        or dataclasses.is_dataclass(tp))
+
+
+def allows_extra(tp: Any) -> bool:
+    """Returns ``True`` if given model type keeps unknown fields."""
+    return (
+        is_pydantic_model(tp)
+        and tp.__config__.extra == 'allow')
+
+
+@functools.lru_cache(maxsize=None)
+def model_fields(cls: Any) -> Tuple[FieldSpec, ...]:
+    """Returns specifications of given model’s fields,
+    in definition order.
+
+    :param cls: a dataclass or a Pydantic model class.
+                Forward references must already be resolvable.
+    """
+    hints = typing.get_type_hints(cls)
+
+    if is_pydantic_model(cls):
+        return tuple(
+            FieldSpec(
+                name=name,
+                type=hints.get(name, field.outer_type_),
+                required=bool(field.required),
+                default=None if field.required else field.default,
+                default_factory=field.default_factory,
+            )
+            for name, field in cls.__fields__.items()
+        )
+
+    elif dataclasses.is_dataclass(cls):
+        specs = []
+        for field in dataclasses.fields(cls):
+            has_factory = field.default_factory is not dataclasses.MISSING
+            has_default = field.default is not dataclasses.MISSING
+            specs.append(FieldSpec(
+                name=field.name,
+                type=hints[field.name],
+                required=not (has_default or has_factory),
+                default=field.default if has_default else None,
+                default_factory=(
+                    field.default_factory  # type: ignore[arg-type]
+                    if has_factory
+                    else None),
+            ))
+        return tuple(specs)
+
+    raise TypeError(f"{cls!r} is neither a dataclass nor a Pydantic model")
+
+
+def unwrap_optional(tp: Any) -> Tuple[Any, bool]:
+    """Strips ``None`` from a union type.
+
+    :returns: a 2-tuple with the remaining type
+              (which itself may be a union)
+              and a boolean indicating whether ``None`` was allowed.
+    """
+    if typing.get_origin(tp) is typing.Union:
+        args = typing.get_args(tp)
+        if NoneType in args:
+            rest = tuple(a for a in args if a is not NoneType)
+            if len(rest) == 1:
+                return rest[0], True
+            return typing.Union[rest], True
+    return tp, False
+
+
+def fits(tp: Any, v: Any) -> bool:
+    """Cheap structural check whether given plain value
+    could be an instance of given type.
+
+    Meant for telling apart members of a union of models
+    (such as copyright owners, which can be organizations or people)
+    without validating; scalars are not checked, apart from strings.
+    """
+    tp, optional = unwrap_optional(tp)
+    if v is None:
+        return optional
+    origin = typing.get_origin(tp)
+    if origin is typing.Union:
+        return any(fits(t, v) for t in typing.get_args(tp))
+    if origin is list:
+        (item_type, ) = typing.get_args(tp)
+        return isinstance(v, list) and all(fits(item_type, i) for i in v)
+    if is_model(tp):
+        if isinstance(v, tp):
+            return True
+        if not isinstance(v, dict):
+            return False
+        specs = {spec.name: spec for spec in model_fields(tp)}
+        if not allows_extra(tp) and not set(v) <= set(specs):
+            return False
+        return all(
+            (name in v and fits(spec.type, v[name]))
+            if spec.required
+            else (name not in v or fits(spec.type, v[name]))
+            for name, spec in specs.items()
+        )
+    if tp is str:
+        return isinstance(v, str)
+    return True
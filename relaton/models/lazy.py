@@ -0,0 +1,252 @@
+"""
+Lazily validated bibliographic items, for processes
+that read only a few properties of each item
+(such as building an index by docid, title and date).
+
+:class:`.LazyBibliographicItem` validates ``docid`` when constructed,
+and keeps raw values of other given properties until they are first
+read. Each property is then validated as it would be
+by :class:`~relaton.models.bibdata.BibliographicItem`,
+and the result is kept::
+
+    for item in load_items(path, factory=load_lazy):
+        index[item.docid[0].id] = item.title
+
+Lazy items are regular items as far as other code is concerned:
+serializers accept them, and dumping, copying or comparing one
+validates whatever remains pending first. A raw value
+that fails validation raises ``pydantic.ValidationError``
+only when its property is read.
+
+Items related to a lazy item are lazy as well.
+:func:`.defer_relations()` makes items related to a regular item
+lazy beyond given depth, so that loading an item with many relations
+(such as a subseries listing its constituents) only costs
+validating their docids, however large related items are::
+
+    load_items(path, preprocess=functools.partial(defer_relations, depth=1))
+"""
+
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from pydantic import PrivateAttr, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+
+from .bibdata import BibliographicItem
+
+__all__ = (
+    'LazyBibliographicItem',
+    'load_lazy',
+    'defer_relations',
+)
+
+
+EAGER_FIELDS = ('docid',)
+"""Properties validated when a lazy item is constructed."""
+
+STUB_FIELDS = ('docid', 'formattedref')
+"""Properties related items keep when replaced with stubs
+by :func:`.defer_relations()`."""
+
+
+class LazyBibliographicItem(BibliographicItem):
+    """A bibliographic item that validates properties
+    other than ``docid`` on first access.
+
+    :raises pydantic.ValidationError: if ``docid`` is missing or invalid
+                                      (on construction), or if a pending
+                                      property is invalid (on access).
+    """
+
+    _pending: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def __init__(__pydantic_self__, **data: Any) -> None:
+        self = __pydantic_self__
+        cls = type(self)
+
+        values: Dict[str, Any] = {}
+        pending: Dict[str, Any] = {}
+        errors: List[Any] = []
+        for name, field in cls.__fields__.items():
+            if field.alias not in data:
+                if field.required:
+                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
+                else:
+                    values[name] = field.get_default()
+            elif name in EAGER_FIELDS:
+                value, error = field.validate(
+                    data[field.alias], values, loc=field.alias, cls=cls)
+                if error:
+                    errors.append(error)
+                else:
+                    values[name] = value
+            else:
+                pending[name] = data[field.alias]
+        if errors:
+            raise ValidationError(errors, cls)
+
+        # Extra properties, in the order BaseModel would add them
+        names_used = {
+            field.alias for field in cls.__fields__.values()
+            if field.alias in data
+        }
+        for key in data.keys() - names_used:
+            values[key] = data[key]
+
+        object.__setattr__(self, '__dict__', values)
+        object.__setattr__(self, '__fields_set__', set(data))
+        self._init_private_attributes()
+        object.__setattr__(self, '_pending', pending)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names not found otherwise, i.e. pending fields
+        # (and unset private attributes while unpickling)
+        if name in self.__fields__ and name in self._pending:
+            return self._validate_pending(name)
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value: Any):
+        if name in self.__fields__ and name in self._pending:
+            object.__setattr__(self, '_pending', {
+                key: raw for key, raw in self._pending.items()
+                if key != name
+            })
+        super().__setattr__(name, value)
+
+    @property
+    def pending_fields(self) -> FrozenSet[str]:
+        """Names of properties given but not validated yet."""
+        return frozenset(self._pending)
+
+    def materialize(self) -> 'LazyBibliographicItem':
+        """Validates all pending properties and returns the item.
+
+        :raises pydantic.ValidationError: listing all invalid properties.
+        """
+        if not self._pending:
+            return self
+        errors: List[Any] = []
+        for name in list(self._pending):
+            try:
+                self._validate_pending(name)
+            except ValidationError as exc:
+                errors.extend(exc.raw_errors)
+        if errors:
+            raise ValidationError(errors, type(self))
+
+        # Restore field order, which dumps follow
+        values = self.__dict__
+        ordered = {
+            name: values[name]
+            for name in self.__fields__
+            if name in values
+        }
+        ordered.update(values)
+        object.__setattr__(self, '__dict__', ordered)
+        return self
+
+    def _validate_pending(self, name: str) -> Any:
+        field = self.__fields__[name]
+        raw = self._pending[name]
+        if name == 'relation':
+            raw = _defer(raw, 0, stub=False)
+        value, error = field.validate(
+            raw, self.__dict__,
+            loc=field.alias, cls=type(self))
+        if error:
+            raise ValidationError([error], type(self))
+        self.__dict__[name] = value
+        # Replaced rather than modified: shallow copies
+        # made during validation share it
+        object.__setattr__(self, '_pending', {
+            key: raw for key, raw in self._pending.items()
+            if key != name
+        })
+        return value
+
+    def __iter__(self):
+        self.materialize()
+        return super().__iter__()
+
+    def _iter(self, *args, **kwargs):
+        self.materialize()
+        return super()._iter(*args, **kwargs)
+
+    def __repr_args__(self):
+        self.materialize()
+        return super().__repr_args__()
+
+
+def defer_relations(
+    data: Dict[str, Any],
+    depth: int = 0,
+    stub: bool = False,
+) -> Dict[str, Any]:
+    """Replaces raw related items in given item document
+    that are more than ``depth`` relations away from it
+    with :class:`.LazyBibliographicItem`\\ s, which are accepted
+    as they are when the item is validated.
+    With ``depth=0``, all related items are lazy.
+
+    Given document is modified in place and returned
+    (nested documents are copied where they change).
+    Can be used as ``preprocess`` in :func:`relaton.io.load_items()`.
+
+    :param stub: replace distant related items with stubs holding
+                 only :data:`.STUB_FIELDS` instead, dropping the rest.
+                 Stubs are validated as regular items.
+    """
+    if 'relation' in data:
+        data['relation'] = _defer(data['relation'], depth, stub)
+    return data
+
+
+def _defer(relations: Any, depth: int, stub: bool) -> Any:
+    """Returns a copy of given raw relations
+    with related items deferred as per :func:`.defer_relations()`.
+    Data that isn’t shaped as expected is left for validation to reject.
+    """
+    if not isinstance(relations, list):
+        return relations
+    deferred = []
+    for relation in relations:
+        if isinstance(relation, dict) and isinstance(
+            bibitem := relation.get('bibitem'), dict
+        ):
+            replacement = _defer_bibitem(bibitem, depth, stub)
+            if replacement is not None:
+                relation = {**relation, 'bibitem': replacement}
+        deferred.append(relation)
+    return deferred
+
+
+def _defer_bibitem(
+    bibitem: Dict[str, Any],
+    depth: int,
+    stub: bool,
+) -> Optional[Any]:
+    if depth > 0:
+        if 'relation' not in bibitem:
+            return None
+        return {
+            **bibitem,
+            'relation': _defer(bibitem['relation'], depth - 1, stub),
+        }
+    if stub:
+        return {key: bibitem[key] for key in STUB_FIELDS if key in bibitem}
+    try:
+        return LazyBibliographicItem(**bibitem)
+    except ValidationError:
+        # Reported by item validation, with the full location
+        return None
+
+
+def load_lazy(data: Dict[str, Any]) -> LazyBibliographicItem:
+    """Constructs a lazy item from given item data.
+
+    Can be used as ``factory`` in :func:`relaton.io.load_items()`,
+    which then only reports errors in ``docid``.
+    """
+    return LazyBibliographicItem(**data)
@@ -0,0 +1,79 @@
+"""
+Projections of bibliographic items onto a subset of their properties,
+for processes (such as building an index by docid)
+that have no use for the rest of each item.
+
+:func:`.projection_model()` returns a Pydantic model
+with only given fields of :class:`~relaton.models.bibdata.BibliographicItem`,
+declared and validated the same way (other properties are ignored)::
+
+    Projection = projection_model(['docid', 'title', 'date'])
+    projected = Projection(**data)
+
+See also the ``fields`` parameter of :func:`relaton.io.load_items()`,
+which in addition skips constructing unneeded parts of YAML documents.
+
+Projected items are not bibliographic items,
+and can’t be serialized.
+"""
+
+import functools
+from typing import Any, Dict, FrozenSet, Iterable, Type
+
+from pydantic import BaseConfig, BaseModel, Extra, create_model
+
+from .bibdata import BibliographicItem
+from .introspection import model_fields
+
+__all__ = (
+    'projection_model',
+    'project',
+)
+
+
+class _ProjectionConfig(BaseConfig):
+    extra = Extra.ignore
+
+
+def projection_model(fields: Iterable[str]) -> Type[BaseModel]:
+    """Returns a model with given fields
+    of :class:`~relaton.models.bibdata.BibliographicItem`
+    (in their original order). Models are cached by the set of fields.
+
+    :raises ValueError: if a field is not one of bibliographic item’s.
+    """
+    fields = frozenset(fields)
+    unknown = fields - BibliographicItem.__fields__.keys()
+    if unknown:
+        raise ValueError(
+            f"Unknown bibliographic item fields: {', '.join(sorted(unknown))}")
+    return _projection_model(fields)
+
+
+def project(data: Dict[str, Any], fields: Iterable[str]) -> BaseModel:
+    """Validates given fields of given item data.
+
+    :raises pydantic.ValidationError: if projected data is invalid.
+    """
+    return projection_model(fields)(**data)
+
+
+@functools.lru_cache(maxsize=None)
+def _projection_model(fields: FrozenSet[str]) -> Type[BaseModel]:
+    definitions: Dict[str, Any] = {
+        spec.name: (spec.type, BibliographicItem.__fields__[spec.name].field_info)
+        for spec in model_fields(BibliographicItem)
+        if spec.name in fields
+    }
+    validators = {
+        name: method
+        for name, method in vars(BibliographicItem).items()
+        if hasattr(method, '__validator_config__')
+        and fields.issuperset(method.__validator_config__[0])
+    }
+    return create_model(
+        'BibliographicItemProjection',
+        __config__=_ProjectionConfig,
+        __module__=__name__,
+        __validators__=validators,
+        **definitions)
@@ -0,0 +1,241 @@
+"""
+Constructing model instances from trusted data, skipping validation.
+
+Intended for data that was validated before it was stored,
+for example a cache of items dumped with ``BibliographicItem.json()``.
+Such data is turned into the same tree of models
+(:class:`~relaton.models.bibdata.DocID`,
+:class:`~relaton.models.bibdata.Contributor`,
+:class:`~relaton.models.people.Person`,
+:class:`~relaton.models.dates.Date`, etc.)
+that validation would have produced, but no validators are run,
+so the cost is proportional to data size.
+
+.. important:: Invalid data produces invalid items
+               that may fail later in unexpected ways.
+               Use it only on data that passed validation before.
+"""
+
+import datetime
+import functools
+import typing
+from typing import (
+    Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, overload,
+)
+
+from .bibdata import BibliographicItem
+from .dates import RelaxedDate, parse_relaxed_date
+from .introspection import (
+    FieldSpec,
+    allows_extra,
+    fits,
+    is_model,
+    is_pydantic_model,
+    model_fields,
+    unwrap_optional,
+)
+
+__all__ = (
+    'construct_trusted',
+)
+
+
+T = TypeVar('T')
+
+Builder = Callable[[Any], Any]
+
+
+@overload
+def construct_trusted(data: Dict[str, Any]) -> BibliographicItem: ...
+
+
+@overload
+def construct_trusted(data: Dict[str, Any], model: Type[T]) -> T: ...
+
+
+def construct_trusted(data, model=BibliographicItem):
+    """Recursively constructs an instance of given model
+    (by default, :class:`~relaton.models.bibdata.BibliographicItem`)
+    from a dictionary, without validation.
+
+    Values are interpreted based on field annotations.
+    Where a field can hold either a list or a single item,
+    lists become lists; where a field can hold a date,
+    ISO-formatted full date strings become dates
+    and formatted relaxed dates become
+    :class:`~relaton.models.dates.RelaxedDate`\ s (as they would
+    after a JSON round-trip). Unknown keys are kept on models
+    that allow extra fields and ignored elsewhere.
+
+    Can be used as ``factory`` in :func:`relaton.io.load_items()`.
+    """
+    build = _builder(model)
+    assert build is not None
+    return build(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _builder(tp: Any) -> Optional[Builder]:
+    """Returns a function that turns plain data into given type,
+    or ``None`` if plain data can be used as is.
+
+    Builders are never given ``None``, callers pass it through.
+    """
+
+    tp, _ = unwrap_optional(tp)
+    origin = typing.get_origin(tp)
+
+    if origin is typing.Union:
+        return _union_builder(typing.get_args(tp))
+
+    if origin is list:
+        (item_type, ) = typing.get_args(tp)
+        build_item = _builder(item_type)
+        if build_item is None:
+            return None
+        return lambda v: [build_item(i) for i in v]  # type: ignore[misc]
+
+    if tp is datetime.date:
+        return _build_date
+
+    if typing.is_typeddict(tp):
+        return _typeddict_builder(tp)
+
+    if is_model(tp):
+        return _model_builder(tp)
+
+    return None
+
+
+def _model_builder(cls: Any) -> Builder:
+    # Field builders are resolved on first use,
+    # since models can be recursive (e.g., through relations)
+    fields: List[Tuple[str, Optional[Builder], FieldSpec]] = []
+
+    is_pydantic = is_pydantic_model(cls)
+    keep_extra = allows_extra(cls)
+    has_private = is_pydantic and bool(cls.__private_attributes__)
+
+    def build_model(v):
+        if isinstance(v, cls):
+            return v
+        if not fields:
+            fields.extend(
+                (spec.name, _builder(spec.type), spec)
+                for spec in model_fields(cls))
+
+        values = {}
+        for name, build, spec in fields:
+            if name in v:
+                value = v[name]
+                if build is not None and value is not None:
+                    value = build(value)
+                values[name] = value
+            elif spec.default_factory is not None:
+                values[name] = spec.default_factory()
+            else:
+                values[name] = spec.default
+
+        obj = object.__new__(cls)
+        if is_pydantic:
+            fields_set = set(v)
+            if keep_extra:
+                for key, value in v.items():
+                    values.setdefault(key, value)
+            else:
+                fields_set &= values.keys()
+            object.__setattr__(obj, '__dict__', values)
+            object.__setattr__(obj, '__fields_set__', fields_set)
+            if has_private:
+                obj._init_private_attributes()
+        else:
+            # Mark the instance as processed by Pydantic’s __post_init__
+            values['__initialised__'] = True
+            object.__setattr__(obj, '__dict__', values)
+        return obj
+
+    return build_model
+
+
+def _typeddict_builder(tp: Any) -> Builder:
+    builders: Dict[str, Builder] = {}
+
+    def build_typeddict(v):
+        if not builders:
+            for name, field_type in typing.get_type_hints(tp).items():
+                if (build := _builder(field_type)) is not None:
+                    builders[name] = build
+        return {
+            key: (
+                builders[key](value)
+                if key in builders and value is not None
+                else value)
+            for key, value in v.items()
+        }
+
+    return build_typeddict
+
+
+def _union_builder(types: typing.Tuple[Any, ...]) -> Builder:
+    list_types = [t for t in types if typing.get_origin(t) is list]
+    model_types = [t for t in types if is_model(t)]
+    accepts_date = datetime.date in types
+
+    build_list: Builder = (
+        (_builder(list_types[0]) if list_types else None)
+        or _identity)
+    build_model: Dict[Any, Builder] = {
+        model: _model_builder(model)
+        for model in model_types
+    }
+
+    def build_union(v):
+        if isinstance(v, list):
+            return build_list(v)
+        if isinstance(v, dict) and model_types:
+            return build_model[_pick_model(model_types, v)](v)
+        if accepts_date and isinstance(v, str):
+            # A full date would have been parsed into a date
+            # when this value was validated, and a relaxed one
+            # into a RelaxedDate
+            return _parse_iso_date(v) or _parse_relaxed_date(v) or v
+        return v
+
+    return build_union
+
+
+def _pick_model(candidates: List[Type[Any]], v: Dict[str, Any]) -> Type[Any]:
+    """Out of several model types in a union,
+    picks the one that given dictionary fits."""
+    if len(candidates) > 1:
+        for cls in candidates:
+            if fits(cls, v):
+                return cls
+    return candidates[0]
+
+
+def _parse_iso_date(v: str):
+    try:
+        return datetime.date.fromisoformat(v)
+    except ValueError:
+        return None
+
+
+def _parse_relaxed_date(v: str):
+    if isinstance(v, RelaxedDate):
+        return v
+    parsed = parse_relaxed_date(v)
+    if parsed is None or parsed[1] != v:
+        return None
+    date, display, specificity = parsed
+    return RelaxedDate(date, specificity, display)
+
+
+def _build_date(v: Any) -> Any:
+    if isinstance(v, str):
+        return datetime.date.fromisoformat(v)
+    return v
+
+
+def _identity(v: Any) -> Any:
+    return v
@@ -3,6 +3,9 @@ into BibXML (xml2rfc) format roughly per RFC 7991,
 with bias towards existing xml2rfc documents where differs.
 
 Primary API is :func:`.serialize()`.
+For serializing many items in parallel, see :func:`.serialize_many()`.
+For validating serializations of whole corpora,
+see :mod:`~relaton.serializers.bibxml.validation`.
 
 .. seealso:: :mod:`~relaton.serializers.bibxml_string`
 """
@@ -13,6 +16,7 @@ from lxml import objectify, etree
 from lxml.etree import _Element
 
 from .anchor import get_suitable_anchor
+from .bulk import serialize_many
 from .reference import create_reference, create_referencegroup
 from .target import get_suitable_target
 from ...models.bibdata import BibliographicItem, Relation
@@ -20,6 +24,7 @@ from ...util import as_list
 
 __all__ = (
     'serialize',
+    'serialize_many',
 )
 
 
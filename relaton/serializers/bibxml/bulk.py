@@ -0,0 +1,241 @@
+"""Serializing many items at once across a pool of worker processes.
+
+Primary API is :func:`.serialize_many()`.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import (
+    Any, Callable, Deque, Dict, Iterable, Iterator, List, Literal, Optional,
+    Set, Tuple, TypeVar, overload,
+)
+
+from lxml import etree
+
+from ...models.bibdata import BibliographicItem
+
+__all__ = (
+    'serialize_many',
+    'shutdown_pool',
+)
+
+
+SerializedItem = Tuple[Optional[str], bytes]
+"""Root element ``anchor`` (if any) and serialized XML."""
+
+ChunkResult = List[Tuple[int, Optional[SerializedItem], Optional[ValueError]]]
+
+R = TypeVar('R')
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+"""Pool kept around between calls to :func:`.serialize_many()`."""
+
+_pool_workers = 0
+"""Number of workers of :data:`._pool`."""
+
+
+@overload
+def serialize_many(
+    items: Iterable[BibliographicItem],
+    workers: Optional[int] = ...,
+    chunksize: int = ...,
+    ordered: Literal[True] = ...,
+    errors: Optional[List[Tuple[int, ValueError]]] = ...,
+) -> Iterator[SerializedItem]: ...
+
+
+@overload
+def serialize_many(
+    items: Iterable[BibliographicItem],
+    workers: Optional[int] = ...,
+    chunksize: int = ...,
+    *,
+    ordered: Literal[False],
+    errors: Optional[List[Tuple[int, ValueError]]] = ...,
+) -> Iterator[Tuple[int, SerializedItem]]: ...
+
+
+def serialize_many(
+    items,
+    workers=None,
+    chunksize=32,
+    ordered=True,
+    errors=None,
+):
+    """Serializes given items using a persistent pool of worker processes,
+    yielding ``(anchor, xml_bytes)`` tuples
+    (or, if ``ordered`` is ``False``, ``(position, (anchor, xml_bytes))``).
+
+    Items are consumed lazily and sent to workers in chunks,
+    with a bounded number of chunks in flight,
+    so memory use does not depend on the number of items.
+
+    The pool is created on first use and kept around for later calls
+    with the same number of workers (see :func:`.shutdown_pool()`).
+    Its workers are warmed up when they start, so that the first chunks
+    don’t pay for imports and cache population.
+
+    If a worker dies, the pool can’t be used anymore:
+    ``BrokenProcessPool`` is raised, and next call starts a new pool.
+
+    :param workers: number of worker processes.
+                    Defaults to the number of CPUs. If 1 or less,
+                    items are serialized in current process.
+    :param chunksize: number of items sent to a worker at once.
+    :param ordered: if ``True``, results are yielded in input order,
+                    otherwise as soon as their chunk completes,
+                    along with the zero-based position of their item
+                    in ``items``, since items (unlike their serializations)
+                    are not guaranteed to have an anchor.
+    :param errors: if given, ``(position, exception)`` tuples
+                   for items that failed with a ``ValueError``
+                   (see :func:`~relaton.serializers.bibxml.serialize()`)
+                   are appended to this list. Failed items
+                   are skipped either way.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+
+    chunks = _iter_chunks(items, chunksize)
+
+    pool: Optional[ProcessPoolExecutor] = None
+    results: Iterator[ChunkResult]
+    if workers <= 1:
+        results = (_serialize_chunk(chunk) for chunk in chunks)
+    else:
+        pool = _get_pool(workers)
+        results = _run_in_pool(
+            pool, _serialize_chunk, chunks, workers, ordered)
+
+    try:
+        for chunk_result in results:
+            for position, result, error in chunk_result:
+                if result is not None:
+                    yield result if ordered else (position, result)
+                elif errors is not None and error is not None:
+                    errors.append((position, error))
+    except BrokenProcessPool:
+        if pool is not None:
+            _discard_pool(pool)
+        raise
+
+
+def shutdown_pool():
+    """Shuts down the worker pool created by :func:`.serialize_many()`,
+    if any."""
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        pool.shutdown()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    if _pool is not None and _pool_workers != workers:
+        shutdown_pool()
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_warm_up,
+        )
+        _pool_workers = workers
+    return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """Drops a broken pool, so that next call creates a new one."""
+    global _pool
+    if _pool is pool:
+        _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_in_pool(
+    pool: ProcessPoolExecutor,
+    func: Callable[[List[Tuple[int, Any]]], R],
+    chunks: Iterator[List[Tuple[int, Any]]],
+    workers: int,
+    ordered: bool,
+) -> Iterator[R]:
+    """Yields results of calling ``func`` on each chunk in given pool,
+    with a bounded number of chunks in flight."""
+    # Keep every worker busy with one chunk and one queued up
+    max_pending = workers * 2
+
+    if ordered:
+        queue: Deque[Future[R]] = deque(
+            pool.submit(func, chunk)
+            for chunk in islice(chunks, max_pending))
+        while queue:
+            result = queue.popleft().result()
+            for chunk in islice(chunks, 1):
+                queue.append(pool.submit(func, chunk))
+            yield result
+
+    else:
+        pending: Set[Future[R]] = set(
+            pool.submit(func, chunk)
+            for chunk in islice(chunks, max_pending))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for chunk in islice(chunks, len(done)):
+                pending.add(pool.submit(func, chunk))
+            for future in done:
+                yield future.result()
+
+
+def _iter_chunks(
+    items: Iterable[Any],
+    chunksize: int,
+) -> Iterator[List[Tuple[int, Any]]]:
+    numbered = enumerate(items)
+    while chunk := list(islice(numbered, chunksize)):
+        yield chunk
+
+
+def _serialize_chunk(
+    chunk: List[Tuple[int, BibliographicItem]],
+) -> ChunkResult:
+    # Imported here to avoid circular import with package’s __init__
+    from . import serialize
+
+    results: ChunkResult = []
+    for position, item in chunk:
+        try:
+            root = serialize(item)
+        except ValueError as exc:
+            results.append((position, None, exc))
+        else:
+            results.append((
+                position,
+                (root.get('anchor'), etree.tostring(root, encoding='utf-8')),
+                None,
+            ))
+    return results
+
+
+_WARM_UP_ITEM: Dict[str, Any] = {
+    'docid': [{'id': 'RFC 1', 'type': 'IETF', 'primary': True}],
+    'title': [{'content': 'Warm-up'}],
+    'date': [{'type': 'published', 'value': '1969-04'}],
+    'contributor': [{
+        'person': {'name': {'completename': {'content': 'A. Person'}}},
+        'role': [{'type': 'author'}],
+    }],
+    'abstract': [{'content': '<p>Warm-up.</p>', 'format': 'text/html'}],
+}
+
+
+def _warm_up():
+    """Runs in each worker on start, exercising model validation
+    and serialization once so that imports are done
+    and module-level caches are populated."""
+    _serialize_chunk([(0, BibliographicItem(**_WARM_UP_ITEM))])
@@ -10,7 +10,7 @@ from .authors import create_author, filter_contributors
 from .series import DOCID_SERIES_EXTRACTORS
 from ...models.bibdata import BibliographicItem, Contributor, Series, DocID
 from ...models.bibitemlocality import LocalityStack, Locality
-from ...models.dates import Date, parse_relaxed_date
+from ...models.dates import Date, RelaxedDate, parse_relaxed_date
 from ...models.strings import Title, GenericStringValue
 from ...util import as_list
 
@@ -65,7 +65,10 @@ def create_reference(item: BibliographicItem) -> _Element:
             published_date_raw = all_dates[0].value
 
         if published_date_raw:
-            if isinstance(published_date_raw, str):
+            if isinstance(published_date_raw, RelaxedDate):
+                published_date = published_date_raw.date
+                specificity = published_date_raw.specificity
+            elif isinstance(published_date_raw, str):
                 relaxed = parse_relaxed_date(published_date_raw)
                 if relaxed:
                     published_date = relaxed[0]
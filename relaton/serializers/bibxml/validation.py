@@ -0,0 +1,479 @@
+"""Validating whole local corpora: loading every item, serializing it
+and validating the result against the xml2rfc v3 schema,
+across a pool of worker processes.
+
+Primary API is :func:`.validate_corpora()`. It is also available
+as a command taking paths to local relaton-data checkouts
+(or any directories, YAML files or archives)::
+
+    python -m relaton.serializers.bibxml.validation --schema v3.xsd \\
+        ~/src/relaton-data-rfcs ~/src/relaton-data-ids ieee=/data/ieee.tar.gz
+
+Sources are named after their directory (without ``relaton-data-``),
+unless given as ``NAME=PATH``. Items of a checkout are read
+from its ``data`` subdirectory, if there is one.
+Archives are read once, and their members validated in parallel.
+
+Failures are printed as they are found,
+progress and throughput periodically to standard error,
+and a summary of failures grouped by source, stage and error type
+at the end. The command exits with status 1 if any item failed,
+so that it can gate data refreshes.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence,
+    Tuple,
+)
+
+from lxml import etree
+from pydantic import ValidationError
+
+from ...io import (
+    LoadError, is_archive, iter_archive_members, iter_documents,
+    iter_yaml_files,
+)
+from ...io.archives import MEMBER_SEPARATOR
+from ...models.bibdata import BibliographicItem
+from .bulk import _iter_chunks, _run_in_pool
+
+__all__ = (
+    'STAGES',
+    'Failure',
+    'FileResult',
+    'ValidationSummary',
+    'find_sources',
+    'validate_corpora',
+    'main',
+)
+
+
+STAGES = ('load', 'construct', 'serialize', 'schema')
+"""Stages an item can fail at, in order:
+
+- ``load``: reading or parsing YAML
+  (a file that fails to parse fails once, for all its remaining items).
+- ``construct``: validating it as a ``BibliographicItem``.
+- ``serialize``: serializing it to BibXML.
+- ``schema``: validating its serialization against the schema.
+"""
+
+
+class Failure(NamedTuple):
+    """An item that failed validation."""
+
+    source: str
+
+    path: str
+    """File (or archive member) the item came from."""
+
+    document: int
+    """Zero-based index of the document within its file."""
+
+    stage: str
+    """One of :data:`.STAGES`."""
+
+    kind: str
+    """Error type, used for grouping. For example, for ``construct``
+    failures, the first invalid property and Pydantic error type,
+    and for ``schema`` failures, libxml2 error type."""
+
+    message: str
+
+
+class FileResult(NamedTuple):
+    """Results of validating items of one file."""
+
+    source: str
+
+    path: str
+
+    items: int
+    """Number of documents read (including failed ones)."""
+
+    failures: List[Failure]
+
+
+ChunkResult = List[FileResult]
+
+WorkUnit = Tuple[str, str, Optional[bytes]]
+"""Source name, path of a file to validate, and for archive members,
+their data (read by the main process, so that each archive
+is read once)."""
+
+
+_worker_schema: Optional[etree.XMLSchema] = None
+"""Schema compiled once per worker, by :func:`._init_worker()`."""
+
+
+def find_sources(paths: Iterable[str]) -> Dict[str, str]:
+    """Returns a mapping of source names to paths
+    from given ``PATH`` or ``NAME=PATH`` strings,
+    as described in module documentation."""
+    sources: Dict[str, str] = {}
+    for spec in paths:
+        name, sep, path = spec.partition('=')
+        if not sep:
+            path = spec
+            name = os.path.basename(os.path.normpath(path))
+            if name.startswith('relaton-data-'):
+                name = name[len('relaton-data-'):]
+        path = os.path.expanduser(path)
+        if os.path.isdir(os.path.join(path, 'data')):
+            path = os.path.join(path, 'data')
+        sources[name] = path
+    return sources
+
+
+def validate_corpora(
+    sources: Dict[str, str],
+    schema_path: str,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+) -> Iterator[FileResult]:
+    """Loads, serializes and validates every item of given sources
+    (a mapping of names to directories, YAML files or archives),
+    yielding results of each file as soon as it is done.
+
+    The schema (``schema_path``) is not shipped with the package:
+    use the xml2rfc v3 schema, converted to XSD, with any files it imports.
+
+    Each worker compiles the schema once, when it starts,
+    and reads files itself, so that only paths and failures
+    cross process boundaries. Archives are read once,
+    by current process, and their members are sent to workers
+    to be validated separately.
+
+    :param workers: number of worker processes.
+                    Defaults to the number of CPUs. If 1 or less,
+                    items are validated in current process.
+    :param chunksize: number of files (or archive members)
+                      sent to a worker at once.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+
+    # Results for archives that failed to read,
+    # which are not sent to workers
+    unreadable: List[FileResult] = []
+    chunks = _iter_chunks(_iter_work(sources, unreadable), chunksize)
+
+    if workers <= 1:
+        _init_worker(schema_path)
+        yield from _collect(
+            (_validate_chunk(chunk) for chunk in chunks), unreadable)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(schema_path, ),
+    ) as pool:
+        yield from _collect(
+            _run_in_pool(
+                pool, _validate_chunk, chunks, workers, ordered=False),
+            unreadable)
+
+
+class ValidationSummary:
+    """Accumulates results of :func:`.validate_corpora()`."""
+
+    def __init__(self, examples: int = 3):
+        """
+        :param examples: number of failures kept
+                         for each source, stage and error type.
+        """
+        self.started = time.perf_counter()
+        self.examples = examples
+
+        self.items: Dict[str, int] = defaultdict(int)
+        """Number of items read, by source."""
+
+        self.failed: Dict[str, int] = defaultdict(int)
+        """Number of failed items, by source."""
+
+        self.groups: Dict[Tuple[str, str, str], List[Failure]] = {}
+        """Example failures, by source, stage and error type."""
+
+        self.group_counts: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        """Number of failures, by source, stage and error type."""
+
+    def add(self, result: FileResult):
+        self.items[result.source] += result.items
+        self.failed[result.source] += len(result.failures)
+        for failure in result.failures:
+            group = (failure.source, failure.stage, failure.kind)
+            self.group_counts[group] += 1
+            examples = self.groups.setdefault(group, [])
+            if len(examples) < self.examples:
+                examples.append(failure)
+
+    @property
+    def seconds(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def items_per_second(self) -> float:
+        return sum(self.items.values()) / max(self.seconds, 1e-9)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the summary as JSON-serializable data."""
+        return {
+            'items': sum(self.items.values()),
+            'failed': sum(self.failed.values()),
+            'seconds': round(self.seconds, 3),
+            'items_per_second': round(self.items_per_second, 1),
+            'sources': {
+                source: {
+                    'items': items,
+                    'failed': self.failed[source],
+                    'failures': [
+                        {
+                            'stage': stage,
+                            'kind': kind,
+                            'count': self.group_counts[group],
+                            'examples': [
+                                f'{f.path}#{f.document}: {f.message}'
+                                for f in self.groups[group]
+                            ],
+                        }
+                        for group in self._sorted_groups(source)
+                        for _, stage, kind in [group]
+                    ],
+                }
+                for source, items in self.items.items()
+            },
+        }
+
+    def format(self) -> str:
+        """Returns the summary as text."""
+        lines = []
+        for source, items in self.items.items():
+            lines.append(
+                f"{source}: {items} items, {self.failed[source]} failed")
+            for group in self._sorted_groups(source):
+                _, stage, kind = group
+                lines.append(
+                    f"  {self.group_counts[group]:>7}  {stage:<9}  {kind}")
+                for failure in self.groups[group]:
+                    lines.append(
+                        f"{'':>20}{failure.path}#{failure.document}")
+        lines.append(
+            f"{sum(self.items.values())} items, "
+            f"{sum(self.failed.values())} failed, "
+            f"in {self.seconds:.1f} s "
+            f"({self.items_per_second:.0f} items/s)")
+        return '\n'.join(lines)
+
+    def _sorted_groups(self, source: str) -> List[Tuple[str, str, str]]:
+        return sorted(
+            (group for group in self.groups if group[0] == source),
+            key=lambda group: (
+                STAGES.index(group[1]),
+                -self.group_counts[group],
+                group[2]))
+
+
+def _iter_work(
+    sources: Dict[str, str],
+    unreadable: List[FileResult],
+) -> Iterator[WorkUnit]:
+    for source, root in sources.items():
+        if os.path.isdir(root):
+            for path in iter_yaml_files(root):
+                yield source, path, None
+        elif is_archive(root):
+            yield from _iter_members(source, root, unreadable)
+        else:
+            yield source, root, None
+
+
+def _iter_members(
+    source: str,
+    path: str,
+    unreadable: List[FileResult],
+) -> Iterator[WorkUnit]:
+    """Reads members of given archive in one pass.
+    If the archive can’t be read (any further),
+    appends a result with a ``load`` failure to ``unreadable``."""
+    try:
+        for location, stream in iter_archive_members(path):
+            name = f'{path}{MEMBER_SEPARATOR}{location.name}'
+            yield source, name, stream.read()
+    except (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile) as exc:
+        unreadable.append(FileResult(source, path, 1, [Failure(
+            source, path, 0, 'load', type(exc).__name__, str(exc))]))
+
+
+def _collect(
+    results: Iterable[ChunkResult],
+    unreadable: List[FileResult],
+) -> Iterator[FileResult]:
+    for chunk_result in results:
+        yield from chunk_result
+        while unreadable:
+            yield unreadable.pop(0)
+    yield from unreadable
+
+
+def _init_worker(schema_path: str):
+    global _worker_schema
+    _worker_schema = etree.XMLSchema(file=schema_path)
+
+
+def _validate_chunk(chunk: List[Tuple[int, WorkUnit]]) -> ChunkResult:
+    return [
+        _validate_file(source, path, data)
+        for _, (source, path, data) in chunk
+    ]
+
+
+def _validate_file(
+    source: str,
+    path: str,
+    data: Optional[bytes] = None,
+) -> FileResult:
+    failures: List[Failure] = []
+
+    def on_error(err: LoadError):
+        cause = err.__cause__ or err
+        failures.append(Failure(
+            source, err.source, err.index,
+            'load', type(cause).__name__, str(cause)))
+
+    if data is None:
+        documents = iter_documents(path, on_error=on_error)
+    else:
+        stream = io.BytesIO(data)
+        stream.name = path
+        documents = iter_documents(stream, on_error=on_error)
+
+    items = 0
+    for name, index, document in documents:
+        items += 1
+        failure = _validate_document(document)
+        if failure is not None:
+            stage, kind, message = failure
+            failures.append(Failure(source, name, index, stage, kind, message))
+    # Files failing to load count as one item
+    items += sum(1 for failure in failures if failure.stage == 'load')
+    return FileResult(source, path, items, failures)
+
+
+def _validate_document(data: Any) -> Optional[Tuple[str, str, str]]:
+    """Returns stage, error type and message of given document’s
+    first failure, or ``None`` if it is valid."""
+    # Imported here to avoid circular import with package’s __init__
+    from . import serialize
+
+    if not isinstance(data, dict):
+        return 'construct', 'not a mapping', "Document is not a mapping"
+    try:
+        item = BibliographicItem(**data)
+    except ValidationError as exc:
+        errors = exc.errors()
+        loc = '.'.join(
+            str(part) for part in errors[0]['loc']
+            if not isinstance(part, int))
+        message = f"{loc}: {errors[0]['msg']}"
+        if len(errors) > 1:
+            message = f"{message} (and {len(errors) - 1} more)"
+        return 'construct', f"{loc}: {errors[0]['type']}", message
+    except (ValueError, TypeError) as exc:
+        # E.g., non-string keys
+        return 'construct', type(exc).__name__, str(exc)
+
+    try:
+        root = serialize(item)
+    except ValueError as exc:
+        # Serializer messages don’t depend on the item
+        return 'serialize', str(exc).split('\n')[0], str(exc)
+    except Exception as exc:
+        return 'serialize', type(exc).__name__, str(exc)
+
+    assert _worker_schema is not None
+    if not _worker_schema.validate(root):
+        error = _worker_schema.error_log[0]  # type: ignore[index]
+        # Serializations are built in memory, so they have no lines
+        return 'schema', error.type_name, f"{error.path}: {error.message}"
+
+    return None
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m relaton.serializers.bibxml.validation',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'paths', nargs='+', metavar='[NAME=]PATH',
+        help="relaton-data checkouts, directories, YAML files or archives")
+    parser.add_argument(
+        '--workers', type=int,
+        help="Worker processes (default: number of CPUs)")
+    parser.add_argument('--chunksize', type=int, default=16)
+    parser.add_argument(
+        '--schema', required=True, metavar='XSD',
+        help="xml2rfc v3 schema to validate against")
+    parser.add_argument(
+        '--examples', type=int, default=3,
+        help="Failures listed per source, stage and error type in summary")
+    parser.add_argument(
+        '--progress', type=float, default=5, metavar='SECONDS',
+        help="Interval between progress reports (0 to disable)")
+    parser.add_argument(
+        '--quiet', '-q', action='store_true',
+        help="Don’t print failures as they are found")
+    parser.add_argument(
+        '--json', metavar='FILE',
+        help="File to write the summary to as JSON")
+    args = parser.parse_args(argv)
+
+    sources = find_sources(args.paths)
+    summary = ValidationSummary(examples=args.examples)
+    reported = time.perf_counter()
+
+    results = validate_corpora(
+        sources,
+        schema_path=args.schema,
+        workers=args.workers,
+        chunksize=args.chunksize)
+    for result in results:
+        summary.add(result)
+        if not args.quiet:
+            for failure in result.failures:
+                print(
+                    f"{failure.source}\t{failure.stage}\t{failure.kind}\t"
+                    f"{failure.path}#{failure.document}: {failure.message}",
+                    flush=True)
+        if args.progress and time.perf_counter() - reported >= args.progress:
+            reported = time.perf_counter()
+            print(
+                f"{sum(summary.items.values())} items, "
+                f"{sum(summary.failed.values())} failed, "
+                f"{summary.items_per_second:.0f} items/s",
+                file=sys.stderr, flush=True)
+
+    print(summary.format())
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(summary.as_dict(), f, indent=2)
+            f.write('\n')
+
+    return 1 if any(summary.failed.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
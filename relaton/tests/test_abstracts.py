@@ -0,0 +1,113 @@
+import copy
+import io
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Any, Callable, List
+from unittest import TestCase
+
+import yaml
+from lxml import etree
+
+from relaton.io import (
+    AbstractStore,
+    LoadError,
+    StoredAbstract,
+    iter_documents,
+    load_items,
+)
+from relaton.models import GenericStringValue
+from relaton.serializers.bibxml import serialize
+
+from .test_io import FIXTURES_DIR
+
+
+CONTENT = '<p>First paragraph.</p><p>Second paragraph.</p>' * 10
+
+
+class AbstractStoreTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _stores(self):
+        return [
+            AbstractStore(),
+            AbstractStore(os.path.join(self.tmpdir, 'abstracts')),
+        ]
+
+    def test_put_and_get(self):
+        for store in self._stores():
+            with self.subTest(path=store.path), store:
+                keys = [store.put(CONTENT), store.put('Ωmega'), store.put('')]
+                self.assertEqual(len(store), 3)
+                self.assertEqual(
+                    [store.get(key) for key in reversed(keys)],
+                    ['', 'Ωmega', CONTENT])
+                self.assertGreater(store.saved_bytes, 0)
+        self.assertEqual(os.listdir(self.tmpdir), [])
+
+    def test_stored_abstract(self):
+        value = GenericStringValue(content=CONTENT, format='text/html')
+        with AbstractStore() as store:
+            stored = store.store(value)
+            self.assertIsInstance(stored, StoredAbstract)
+            self.assertIsInstance(stored, GenericStringValue)
+            self.assertNotIn(CONTENT, vars(stored).values())
+            self.assertEqual(stored.content, CONTENT)
+            self.assertEqual(stored.format, 'text/html')
+            self.assertEqual(stored, value)
+            self.assertEqual(value, stored)
+            self.assertNotEqual(stored, GenericStringValue(content='Other'))
+
+            copies: List[Callable[[Any], Any]] = [
+                copy.deepcopy,
+                lambda v: pickle.loads(pickle.dumps(v)),
+            ]
+            for make_copy in copies:
+                copied = make_copy(stored)
+                self.assertIs(type(copied), GenericStringValue)
+                self.assertEqual(copied, value)
+
+            short = GenericStringValue(content='Short')
+            self.assertIs(store.store(short), short)
+
+    def test_load_items(self):
+        documents = [data for _, _, data in iter_documents(FIXTURES_DIR)]
+        documents[0]['abstract'] = {'content': CONTENT, 'format': 'text/html'}
+        documents[1]['relation'] = [{
+            'type': 'includes',
+            'bibitem': {
+                'docid': [{'id': 'Included', 'type': 'Other'}],
+                'abstract': [{'content': CONTENT}],
+            },
+        }]
+        # Invalid, left for item validation to reject
+        documents[2]['abstract'] = [{'content': CONTENT, 'format': [1]}]
+        stream = yaml.safe_dump_all(documents)
+
+        errors: List[LoadError] = []
+        items = list(load_items(io.StringIO(stream), on_error=errors.append))
+        self.assertEqual([e.index for e in errors], [2])
+        for store in self._stores():
+            with self.subTest(path=store.path), store:
+                stored: List[Any] = list(load_items(
+                    io.StringIO(stream),
+                    abstracts=store,
+                    on_error=errors.append))
+
+                self.assertEqual(len(stored), len(items))
+                self.assertEqual(len(store), 2)
+                self.assertIsInstance(stored[0].abstract, StoredAbstract)
+                self.assertIsInstance(
+                    stored[1].relation[0].bibitem.abstract[0],
+                    StoredAbstract)
+                for item, stored_item in zip(items, stored):
+                    self.assertEqual(stored_item, item)
+                    self.assertEqual(stored_item.json(), item.json())
+                    self.assertEqual(
+                        etree.tostring(serialize(stored_item)),
+                        etree.tostring(serialize(item)))
@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from relaton.benchmarks.suite import CASES, latency_stats, main, run_suite
+
+
+class BenchmarkSuiteTestCase(TestCase):
+    def test_run_suite(self):
+        results = run_suite(samples=3, warmup=0)
+        self.assertEqual(list(results['results']), list(CASES))
+        serialize = results['results']['serialize']
+        self.assertIn('RFC', serialize)
+        self.assertIn('I-D', serialize)
+        self.assertEqual(serialize['RFC']['samples'], 3)
+        self.assertEqual(serialize['all']['items'], sum(
+            stats['items']
+            for source, stats in serialize.items()
+            if source != 'all'))
+        # Only some items have abstracts
+        self.assertNotIn('IANA', results['results']['create_abstract'])
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.json')
+            main([
+                '--cases', 'construct',
+                '--sources', 'rfcs', 'ids',
+                '--samples', '2',
+                '--output', path,
+            ])
+            with open(path) as f:
+                results = json.load(f)
+        self.assertEqual(
+            set(results['results']['construct']),
+            {'RFC', 'I-D', 'all'})
+
+    def test_unknown(self):
+        with self.assertRaises(KeyError):
+            run_suite(cases=['unknown'], samples=1)
+        with self.assertRaises(KeyError):
+            run_suite(sources=['unknown'], samples=1)
+
+    def test_latency_stats(self):
+        stats = latency_stats(
+            [i * 1000 for i in range(1, 101)],
+            items=4)
+        self.assertEqual(stats['items'], 4)
+        self.assertEqual(stats['samples'], 100)
+        self.assertEqual(stats['latency_us'], {
+            'min': 1,
+            'p50': 50,
+            'p90': 90,
+            'p99': 99,
+            'max': 100,
+        })
+        self.assertAlmostEqual(stats['items_per_second'], 100 / 0.00505, 0)
@@ -0,0 +1,97 @@
+import os
+import signal
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Tuple
+from unittest import TestCase
+
+from lxml import etree
+
+from relaton.io import load_items
+from relaton.models import BibliographicItem
+from relaton.serializers.bibxml import serialize, serialize_many
+from relaton.serializers.bibxml import bulk
+from relaton.serializers.bibxml.bulk import shutdown_pool
+
+from .test_io import FIXTURES_DIR
+
+
+class SerializeManyTestCase(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_pool()
+
+    def setUp(self):
+        self.items = list(load_items(FIXTURES_DIR))
+        self.expected = [
+            (root.get('anchor'), etree.tostring(root, encoding='utf-8'))
+            for root in (serialize(item) for item in self.items)
+        ]
+
+        invalid_data: Dict[str, Any] = {
+            'docid': [{'id': 'invalid', 'type': 'test'}],
+            # An author that’s neither a person nor an organization
+            'contributor': [{'role': [{'type': 'author'}]}],
+        }
+        self.invalid_item = BibliographicItem(**invalid_data)
+
+    def test_serialize_many_in_process(self):
+        self.assertEqual(
+            list(serialize_many(self.items, workers=1)),
+            self.expected)
+
+    def test_serialize_many_ordered(self):
+        self.assertEqual(
+            list(serialize_many(self.items, workers=2, chunksize=3)),
+            self.expected)
+
+    def test_serialize_many_unordered(self):
+        results = list(serialize_many(
+            self.items, workers=2, chunksize=1, ordered=False))
+        self.assertEqual(sorted(results), list(enumerate(self.expected)))
+
+        # Positions are those of input items, skipping failed ones
+        items = [self.invalid_item] + self.items
+        results = list(serialize_many(
+            items, workers=2, chunksize=1, ordered=False))
+        self.assertEqual(
+            sorted(results),
+            list(enumerate(self.expected, start=1)))
+
+    def test_serialize_many_collects_errors(self):
+        items = self.items[:2] + [self.invalid_item] + self.items[2:]
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                errors: List[Tuple[int, ValueError]] = []
+                results = list(serialize_many(
+                    items, workers=workers, chunksize=2, errors=errors))
+
+                self.assertEqual(results, self.expected)
+                self.assertEqual(len(errors), 1)
+                self.assertEqual(errors[0][0], 2)
+                self.assertIsInstance(errors[0][1], ValueError)
+
+    def test_serialize_many_accepts_iterators(self):
+        self.assertEqual(
+            list(serialize_many(iter(self.items), workers=2)),
+            self.expected)
+
+    def test_serialize_many_keeps_one_pool(self):
+        list(serialize_many(self.items, workers=2))
+        pool = bulk._pool
+        list(serialize_many(self.items, workers=2))
+        self.assertIs(bulk._pool, pool)
+        list(serialize_many(self.items, workers=3))
+        self.assertIsNot(bulk._pool, pool)
+
+    def test_serialize_many_replaces_broken_pool(self):
+        list(serialize_many(self.items, workers=2))
+        assert bulk._pool is not None
+        for pid in list(bulk._pool._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        with self.assertRaises(BrokenProcessPool):
+            list(serialize_many(self.items, workers=2))
+        self.assertIsNone(bulk._pool)
+        self.assertEqual(
+            list(serialize_many(self.items, workers=2)),
+            self.expected)
@@ -0,0 +1,144 @@
+import copy
+from typing import Any, Dict
+from unittest import TestCase
+
+from lxml import etree
+
+from relaton.io import iter_documents, load_items
+from relaton.models import BibliographicItem, Organization, Person
+from relaton.models.canonical import canonicalize, load_canonical
+from relaton.serializers.bibxml import serialize
+
+from .test_io import FIXTURES_DIR
+
+
+ITEM: Dict[str, Any] = {
+    'docid': [{'id': 'RFC 1', 'type': 'IETF'}],
+    'title': {'content': 'Title', 'language': 'en'},
+    'language': 'en',
+    'series': [{'title': {'content': 'Series'}}],
+    'revdate': '2000-01',
+    'contributor': [{
+        'role': [{'type': 'author'}],
+        'person': {
+            'name': {'given': {'forename': {'content': 'A'}}},
+            'affiliation': {'organization': {'name': {'content': 'B'}}},
+        },
+    }],
+    'copyright': {
+        'from': 2000,
+        'owner': [
+            {'name': {'content': 'IETF'}},
+            {'name': {'completename': {'content': 'C'}}},
+        ],
+    },
+    'relation': [{
+        'type': 'includes',
+        'bibitem': {
+            'docid': [{'id': 'RFC 2', 'type': 'IETF'}],
+            'abstract': {'content': 'Abstract'},
+        },
+    }],
+}
+
+
+class CanonicalizeTestCase(TestCase):
+    def test_wraps_single_values(self):
+        data = canonicalize(ITEM)
+
+        self.assertEqual(
+            data['title'],
+            [{'content': 'Title', 'language': ['en']}])
+        self.assertEqual(data['series'][0]['title'], [{'content': 'Series'}])
+        self.assertEqual(data['language'], ['en'])
+        person = data['contributor'][0]['person']
+        self.assertEqual(
+            person['name']['given']['forename'],
+            [{'content': 'A'}])
+        self.assertEqual(
+            person['affiliation'],
+            [{'organization': {'name': [{'content': 'B'}]}}])
+        self.assertEqual(data['copyright'], [{
+            'from': 2000,
+            'owner': [
+                {'name': [{'content': 'IETF'}]},
+                {'name': {'completename': {'content': 'C'}}},
+            ],
+        }])
+        self.assertEqual(
+            data['relation'][0]['bibitem']['abstract'],
+            [{'content': 'Abstract'}])
+
+    def test_leaves_other_values(self):
+        data = canonicalize(ITEM)
+
+        # Not a plain single-or-list union
+        self.assertEqual(data['revdate'], '2000-01')
+        self.assertIs(data['docid'], ITEM['docid'])
+
+    def test_does_not_modify_input(self):
+        original = copy.deepcopy(ITEM)
+        canonicalize(ITEM)
+        self.assertEqual(ITEM, original)
+
+    def test_same_items(self):
+        for name, _, data in list(iter_documents(FIXTURES_DIR)) + [
+            ('ITEM', 0, ITEM),
+        ]:
+            with self.subTest(name=name):
+                item = BibliographicItem(**data)
+                canonical = BibliographicItem(**canonicalize(data))
+                self.assertEqual(
+                    etree.tostring(serialize(canonical)),
+                    etree.tostring(serialize(item)))
+
+
+class LoadCanonicalTestCase(TestCase):
+    def test_load(self):
+        item = load_canonical(ITEM)
+
+        self.assertIsInstance(item, BibliographicItem)
+        assert isinstance(item.title, list)
+        self.assertEqual(item.title[0].language, ['en'])
+        self.assertEqual(item.language, ['en'])
+        assert item.series is not None
+        self.assertIsInstance(item.series[0].title, list)
+        assert item.contributor is not None
+        person = item.contributor[0].person
+        assert person is not None
+        assert isinstance(person.affiliation, list)
+        assert person.name.given is not None
+        self.assertIsInstance(person.name.given.forename, list)
+        org = person.affiliation[0].organization
+        self.assertIsInstance(org, Organization)
+        assert isinstance(org.name, list)
+        self.assertEqual(org.name[0].content, 'B')
+        assert isinstance(item.copyright, list)
+        owners: Any = item.copyright[0]['owner']
+        self.assertIsInstance(owners[0], Organization)
+        self.assertIsInstance(owners[0].name, list)
+        self.assertIsInstance(owners[1], Person)
+        assert item.relation is not None
+        self.assertIsInstance(item.relation[0].bibitem.abstract, list)
+
+    def test_same_serialization(self):
+        for name, _, data in iter_documents(FIXTURES_DIR):
+            with self.subTest(name=name):
+                self.assertEqual(
+                    etree.tostring(serialize(load_canonical(data))),
+                    etree.tostring(serialize(BibliographicItem(**data))))
+
+    def test_load_items(self):
+        items = list(load_items(FIXTURES_DIR, factory=load_canonical))
+        self.assertEqual(len(items), len(list(load_items(FIXTURES_DIR))))
+        self.assertTrue(all(
+            isinstance(item.title, list)
+            for item in items
+            if item.title is not None))
+
+    def test_load_items_preprocess(self):
+        items = list(load_items(FIXTURES_DIR, preprocess=canonicalize))
+        self.assertTrue(all(
+            isinstance(item.title, list)
+            for item in items
+            if item.title is not None))
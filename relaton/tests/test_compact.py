@@ -0,0 +1,78 @@
+import dataclasses
+import json
+import pickle
+from unittest import TestCase
+
+from lxml import etree
+
+from relaton.io import load_items
+from relaton.models import Contributor, DocID
+from relaton.models.compact import (
+    COMPACT_VARIANTS,
+    CompactDocID,
+    CompactGenericStringValue,
+    CompactRole,
+    compact,
+    load_compact,
+)
+from relaton.serializers.bibxml import serialize
+
+from .test_io import FIXTURES_DIR
+
+
+class CompactTestCase(TestCase):
+    def setUp(self):
+        self.items = list(load_items(FIXTURES_DIR))
+        self.compacted = list(load_items(FIXTURES_DIR, factory=load_compact))
+
+    def test_matches_regular_items(self):
+        for item, compacted in zip(self.items, self.compacted):
+            with self.subTest(docid=item.docid[0].id):
+                self.assertEqual(compacted, item)
+                self.assertEqual(
+                    json.loads(compacted.json()),
+                    json.loads(item.json()))
+                self.assertEqual(
+                    etree.tostring(serialize(compacted)),
+                    etree.tostring(serialize(item)))
+
+    def test_replaces_leaves(self):
+        for item in self.compacted:
+            self.assertIs(type(item.docid[0]), CompactDocID)
+            for contributor in item.contributor or []:
+                self.assertIs(type(contributor), Contributor)
+                for role in contributor.role:
+                    self.assertIs(type(role), CompactRole)
+                    for description in role.description or []:
+                        self.assertIs(
+                            type(description),
+                            CompactGenericStringValue)
+
+    def test_variants(self):
+        for original, variant in COMPACT_VARIANTS.items():
+            with self.subTest(variant=variant.__name__):
+                self.assertEqual(
+                    [(f.name, f.default) for f in dataclasses.fields(variant)],
+                    [(f.name, f.default) for f in dataclasses.fields(original)])
+                self.assertEqual(
+                    variant.__slots__,
+                    tuple(f.name for f in dataclasses.fields(original)))
+
+    def test_leaf_compatibility(self):
+        docid = DocID(id='RFC 1', type='IETF')
+        compacted = compact([docid])[0]
+
+        self.assertFalse(hasattr(compacted, '__dict__'))
+        self.assertEqual(compacted.id, 'RFC 1')
+        self.assertIsNone(compacted.scope)
+        self.assertEqual(compacted, docid)
+        self.assertEqual(docid, compacted)
+        self.assertNotEqual(compacted, CompactDocID(id='RFC 2', type='IETF'))
+        self.assertEqual(
+            dataclasses.asdict(compacted),
+            dataclasses.asdict(docid))
+        self.assertEqual(pickle.loads(pickle.dumps(compacted)), compacted)
+
+    def test_pickle_item(self):
+        item = self.compacted[0]
+        self.assertEqual(pickle.loads(pickle.dumps(item)), item)
@@ -0,0 +1,95 @@
+import os
+import tempfile
+from collections import Counter
+from unittest import TestCase
+
+from relaton.benchmarks import SCHEMA_PATH
+from relaton.benchmarks.corpus import (
+    GENERATORS,
+    generate_document,
+    generate_documents,
+    write_corpus,
+)
+from relaton.benchmarks.suite import _schema, run_suite
+from relaton.io import load_items
+from relaton.models.bibdata import BibliographicItem
+from relaton.serializers.bibxml import serialize
+from relaton.serializers.bibxml.validation import validate_corpora
+
+
+class CorpusTestCase(TestCase):
+    def test_items_are_valid(self):
+        schema = _schema()
+        for skew in (0, 1, 3):
+            for data in generate_documents(300, seed=skew, skew=skew):
+                item = BibliographicItem(**data)
+                self.assertTrue(
+                    schema.validate(serialize(item)),
+                    f"{data['id']}: {schema.error_log}")
+
+    def test_written_corpus_is_valid(self):
+        # RFC subseries with many constituents, which must not repeat
+        with tempfile.TemporaryDirectory() as directory:
+            write_corpus(
+                directory, 200, weights={'rfcsubseries': 1}, skew=3,
+                per_file=False)
+            failures = [
+                failure
+                for result in validate_corpora(
+                    {'rfcsubseries': directory}, SCHEMA_PATH, workers=1)
+                for failure in result.failures
+            ]
+        self.assertEqual(failures, [])
+
+    def test_every_source(self):
+        for source in GENERATORS:
+            documents = list(generate_documents(20, weights={source: 1}))
+            ids = {data['id'] for data in documents}
+            self.assertEqual(len(ids), 20, source)
+            for data in documents:
+                BibliographicItem(**data)
+
+    def test_deterministic(self):
+        first = list(generate_documents(50, seed=3))
+        self.assertEqual(first, list(generate_documents(50, seed=3)))
+        # Items don’t depend on corpus size
+        self.assertEqual(first[:10], list(generate_documents(10, seed=3)))
+        self.assertEqual(generate_document(7, seed=3)[1], first[7])
+        self.assertNotEqual(first, list(generate_documents(50, seed=4)))
+
+    def test_weights_and_skew(self):
+        sources = Counter(
+            generate_document(i, weights={'ids': 3, 'iana': 1})[0]
+            for i in range(400))
+        self.assertEqual(set(sources), {'ids', 'iana'})
+        self.assertGreater(sources['ids'], sources['iana'] * 2)
+
+        def history(skew):
+            return sum(
+                len(data['relation'])
+                for data in generate_documents(
+                    200, weights={'ids': 1}, skew=skew))
+        self.assertEqual(history(0), 200)
+        self.assertGreater(history(2), history(1))
+
+        with self.assertRaises(KeyError):
+            list(generate_documents(1, weights={'unknown': 1}))
+
+    def test_write_corpus(self):
+        for per_file in (True, False):
+            with tempfile.TemporaryDirectory() as directory:
+                counts = write_corpus(
+                    directory, 40, seed=1, per_file=per_file)
+                self.assertEqual(sum(counts.values()), 40)
+                self.assertEqual(
+                    sorted(os.listdir(directory)), sorted(counts))
+                items = list(load_items(directory))
+                self.assertEqual(len(items), 40)
+
+                results = run_suite(
+                    cases=['construct'],
+                    samples=2,
+                    warmup=0,
+                    corpus=directory)
+                self.assertEqual(
+                    results['results']['construct']['all']['items'], 40)
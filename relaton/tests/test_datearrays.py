@@ -0,0 +1,79 @@
+import datetime
+import importlib.util
+from typing import List
+from unittest import TestCase, mock, skipUnless
+
+from relaton.benchmarks.dates import date_strings
+from relaton.models import dates
+from relaton.models.datearrays import SPECIFICITIES, parse_relaxed_dates
+
+from .test_dates import relaxed_date_inputs
+
+
+numpy_available = importlib.util.find_spec('numpy') is not None
+
+
+@skipUnless(numpy_available, "requires numpy")
+class DateArraysTestCase(TestCase):
+    def inputs(self) -> List[str]:
+        return (
+            list(relaxed_date_inputs())
+            + date_strings(500)
+            + ['2000-02-29', '1900-02-29', '9999-12-31', 'MARCH 1997'])
+
+    def assertParity(self, values: List[str], full_dates: bool):
+        result, codes = parse_relaxed_dates(values, full_dates=full_dates)
+        self.assertEqual(result.dtype.str, '<M8[D]')
+        for v, date, code in zip(values, result, codes):
+            with self.subTest(v=v):
+                if full_dates:
+                    try:
+                        validated = dates.validate_relaxed_date(v)
+                    except ValueError:
+                        expected = None
+                    else:
+                        if isinstance(validated, dates.RelaxedDate):
+                            expected = (
+                                validated.date, validated.specificity)
+                        else:
+                            expected = (validated, 'day')
+                else:
+                    parsed = dates.parse_relaxed_date(v)
+                    expected = (parsed[0], parsed[2]) if parsed else None
+
+                if expected is None:
+                    self.assertEqual(code, 0)
+                    self.assertTrue(str(date) == 'NaT')
+                else:
+                    self.assertEqual(
+                        (date.astype(datetime.date), SPECIFICITIES[code - 1]),
+                        expected)
+
+    def test_parse_parity(self):
+        self.assertParity(self.inputs(), full_dates=False)
+
+    def test_validate_parity(self):
+        self.assertParity(self.inputs(), full_dates=True)
+
+    def test_custom_formats(self):
+        formats = [('%d.%m.%Y', '%B %Y', 'month')]
+        with mock.patch.object(dates, 'EXTRA_DATE_FORMATS', formats):
+            self.assertParity(['01.03.1997', '1997-03'], full_dates=False)
+
+    def test_array_input(self):
+        import numpy as np
+
+        result, codes = parse_relaxed_dates(
+            np.array(['1997-03', 'March 1997', '1997', 'soon']))
+        self.assertEqual(codes.tolist(), [2, 2, 1, 0])
+        self.assertEqual(
+            result[:3].tolist(),
+            [datetime.date(1997, 3, 1)] * 2 + [datetime.date(1997, 1, 1)])
+
+    def test_empty(self):
+        result, codes = parse_relaxed_dates([])
+        self.assertEqual((len(result), len(codes)), (0, 0))
+
+    def test_rejects_non_strings(self):
+        with self.assertRaises(TypeError):
+            parse_relaxed_dates([1997, 1998])
@@ -0,0 +1,175 @@
+import copy
+import datetime
+import itertools
+import json
+import pickle
+from typing import Any, Dict
+from unittest import TestCase, mock
+
+from relaton.models import BibliographicItem, dates
+from relaton.models.dates import (
+    Date,
+    RelaxedDate,
+    clear_relaxed_date_cache,
+    parse_relaxed_date,
+    relaxed_date_cache_info,
+    validate_relaxed_date,
+)
+
+
+def relaxed_date_inputs():
+    """Yields tricky strings for checking relaxed date parser parity."""
+    years = ('0000', '0001', '0999', '1969', '1970', '2000', '١٩٩٧')
+    months = ('0', '00', '1', '01', '09', '12', '13', '001', '٠١')
+    days = ('0', '1', '01', '29', '31', '32', '٠١')
+    names = ('January', 'march', 'MAY', 'Sept', 'Mär')
+    for year in years:
+        yield year
+        for month in months:
+            yield f'{year}-{month}'
+            for day in days:
+                yield f'{year}-{month}-{day}'
+        for name, sep in itertools.product(names, (' ', '  ', '\t', '')):
+            yield f'{name}{sep}{year}'
+    yield from (
+        '', ' 1997', '1997\n', '1970-01-01', '1000000000', '20010101',
+        '-5', '1e3', 'soon', '2000/01/02', '01-2000', 'March',
+    )
+
+
+class RelaxedDateCacheTestCase(TestCase):
+    def setUp(self):
+        clear_relaxed_date_cache()
+
+    def tearDown(self):
+        clear_relaxed_date_cache()
+
+    def test_results(self):
+        for _ in range(2):
+            self.assertEqual(
+                validate_relaxed_date('2000-01-02'),
+                datetime.date(2000, 1, 2))
+            self.assertEqual(validate_relaxed_date('2000-01'), 'January 2000')
+            self.assertEqual(validate_relaxed_date('March 1997'), 'March 1997')
+            self.assertEqual(validate_relaxed_date('1997'), '1997')
+            self.assertEqual(
+                parse_relaxed_date('1997-03'),
+                (datetime.date(1997, 3, 1), 'March 1997', 'month'))
+            self.assertIsNone(parse_relaxed_date('soon'))
+
+    def test_counts_hits_and_misses(self):
+        for _ in range(3):
+            validate_relaxed_date('March 1997')
+        info = relaxed_date_cache_info()['validate_relaxed_date']
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 1, 1))
+
+    def test_caches_failures(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                validate_relaxed_date('soon')
+        info = relaxed_date_cache_info()['validate_relaxed_date']
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_bypasses_other_types(self):
+        date = datetime.date(2000, 1, 2)
+        self.assertEqual(validate_relaxed_date(date), date)
+        self.assertIsNone(validate_relaxed_date(None, optional=True))
+        info = relaxed_date_cache_info()['validate_relaxed_date']
+        self.assertEqual(info.currsize, 0)
+
+    def test_clear(self):
+        validate_relaxed_date('1997')
+        clear_relaxed_date_cache()
+        for info in relaxed_date_cache_info().values():
+            self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+
+class SinglePassParserTestCase(TestCase):
+    """Checks that the single-pass parser agrees
+    with Pydantic’s parser followed by ``strptime()``."""
+
+    def test_validate_parity(self):
+        for v in relaxed_date_inputs():
+            with self.subTest(v=v):
+                expected = dates._validate_relaxed_date_strptime(v)
+                actual = dates._validate_relaxed_date(v)
+                self.assertEqual(actual, expected)
+                self.assertIs(type(actual), type(expected))
+
+    def test_parse_parity(self):
+        for v in relaxed_date_inputs():
+            with self.subTest(v=v):
+                self.assertEqual(
+                    dates._parse_relaxed_date(v),
+                    dates._parse_relaxed_date_strptime(v))
+
+    def test_custom_formats(self):
+        formats = [('%d.%m.%Y', '%B %Y', 'month')]
+        with mock.patch.object(dates, 'EXTRA_DATE_FORMATS', formats):
+            self.assertEqual(
+                dates._validate_relaxed_date('01.03.1997'), 'March 1997')
+            self.assertIsNone(dates._validate_relaxed_date('1997-03'))
+
+
+class RelaxedDateTestCase(TestCase):
+    def test_validated_value(self):
+        value = Date(type='published', value='1997-03').value
+        assert isinstance(value, RelaxedDate)
+        self.assertEqual(value, 'March 1997')
+        self.assertEqual(value.date, datetime.date(1997, 3, 1))
+        self.assertEqual(value.specificity, 'month')
+
+        value = Date(type='published', value='1997').value
+        assert isinstance(value, RelaxedDate)
+        self.assertEqual((value, value.specificity), ('1997', 'year'))
+
+        value = Date(type='published', value='1997-03-04').value
+        self.assertIs(type(value), datetime.date)
+
+    def test_default_display(self):
+        date = datetime.date(1997, 3, 1)
+        self.assertEqual(RelaxedDate(date, 'month'), 'March 1997')
+        self.assertEqual(RelaxedDate(date, 'year'), '1997')
+        self.assertEqual(RelaxedDate(date, 'month', 'Mar 97'), 'Mar 97')
+        with self.assertRaises(ValueError):
+            RelaxedDate(date, 'season')
+
+    def test_behaves_as_string(self):
+        value = RelaxedDate(datetime.date(1997, 3, 1), 'month')
+        self.assertEqual(json.dumps(value), '"March 1997"')
+        self.assertEqual(hash(value), hash('March 1997'))
+        data: Dict[str, Any] = {
+            'docid': [{'id': 'A', 'type': 'T'}],
+            'date': [{'type': 'published', 'value': value}],
+        }
+        item = BibliographicItem(**data)
+        self.assertEqual(
+            json.loads(item.json())['date'],
+            [{'value': 'March 1997', 'type': 'published'}])
+
+    def test_not_parsed_again(self):
+        value = RelaxedDate(datetime.date(1997, 3, 1), 'month')
+        with mock.patch.object(dates, '_classify_date') as classify:
+            self.assertIs(validate_relaxed_date(value), value)
+            self.assertEqual(
+                parse_relaxed_date(value),
+                (value.date, 'March 1997', 'month'))
+        classify.assert_not_called()
+
+    def test_immutable(self):
+        value = RelaxedDate(datetime.date(1997, 3, 1), 'month')
+        with self.assertRaises(AttributeError):
+            value.specificity = 'year'
+        with self.assertRaises(AttributeError):
+            del value.date
+
+    def test_copy_and_pickle(self):
+        value = RelaxedDate(datetime.date(1997, 3, 1), 'month', 'Mar 1997')
+        for restored in (
+            copy.deepcopy(value),
+            pickle.loads(pickle.dumps(value)),
+        ):
+            self.assertIs(type(restored), RelaxedDate)
+            self.assertEqual(
+                (restored, restored.date, restored.specificity),
+                ('Mar 1997', value.date, 'month'))
@@ -0,0 +1,82 @@
+import datetime
+import json
+from typing import Any, List, Tuple
+from unittest import TestCase, mock
+
+from relaton.io import FlyweightRegistry, iter_documents, load_items
+from relaton.models import BibliographicItem, DocID, export
+from relaton.models.compact import load_compact
+from relaton.models.dates import Date, RelaxedDate
+from relaton.models.export import to_dict, to_json_bytes
+from relaton.models.lazy import load_lazy
+
+from .test_io import FIXTURES_DIR
+
+
+def _without_none(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _without_none(i)
+            for key, i in value.items()
+            if i is not None
+        }
+    if isinstance(value, list):
+        return [_without_none(i) for i in value]
+    return value
+
+
+class ExportTestCase(TestCase):
+    def setUp(self):
+        self.items = list(load_items(FIXTURES_DIR))
+
+    def test_to_json_bytes(self):
+        for item in self.items:
+            with self.subTest(docid=item.docid[0].id):
+                expected = json.loads(item.json())
+                self.assertEqual(json.loads(to_json_bytes(item)), expected)
+                self.assertEqual(
+                    json.loads(to_json_bytes(item, exclude_none=True)),
+                    _without_none(expected))
+
+    def test_to_json_bytes_without_orjson(self):
+        with mock.patch.object(export, 'orjson', None):
+            for item in self.items:
+                self.assertEqual(
+                    json.loads(to_json_bytes(item)),
+                    json.loads(item.json()))
+
+    def test_to_dict(self):
+        for item in self.items:
+            with self.subTest(docid=item.docid[0].id):
+                data = to_dict(item)
+                self.assertEqual(BibliographicItem(**data), item)
+                self.assertEqual(
+                    json.loads(json.dumps(data, default=str)),
+                    json.loads(item.json()))
+
+    def test_plain_values(self):
+        date = Date(type='published', value=datetime.date(2000, 1, 2))
+        self.assertEqual(
+            to_dict({'a': [date, (None, 1)], 'b': None}, exclude_none=True),
+            {'a': [{'type': 'published', 'value': datetime.date(2000, 1, 2)},
+                   [None, 1]]})
+
+        relaxed = RelaxedDate(datetime.date(2000, 1, 1), 'month')
+        self.assertIs(to_dict(relaxed), relaxed)
+        self.assertEqual(
+            to_dict(DocID(id='RFC 1', type='IETF')),
+            {'id': 'RFC 1', 'type': 'IETF', 'primary': None, 'scope': None})
+
+    def test_variants(self):
+        documents = [data for _, _, data in iter_documents(FIXTURES_DIR)]
+        flyweights = FlyweightRegistry(persons=True)
+        variants: List[Tuple[str, List[Any]]] = [
+            ('lazy', [load_lazy(data) for data in documents]),
+            ('compact', [load_compact(data) for data in documents]),
+            ('shared', list(load_items(FIXTURES_DIR, flyweights=flyweights))),
+        ]
+        for label, variant in variants:
+            with self.subTest(label):
+                self.assertEqual(
+                    [to_json_bytes(item) for item in variant],
+                    [to_json_bytes(item) for item in self.items])
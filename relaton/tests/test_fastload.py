@@ -0,0 +1,172 @@
+import dataclasses
+import datetime
+from typing import Any, Dict, Tuple
+from unittest import TestCase, mock
+
+from pydantic import BaseModel, ValidationError
+
+from relaton.io import iter_documents
+from relaton.models import BibliographicItem, DocID
+from relaton.models import fastload
+from relaton.models.bibitemlocality import Locality, LocalityStack
+from relaton.models.fastload import load_fast, loader_source
+
+from .test_io import FIXTURES_DIR
+
+
+def _minimal(**kwargs) -> Dict[str, Any]:
+    return dict(docid=[{'id': 'RFC 1', 'type': 'IETF'}], **kwargs)
+
+
+class FastLoaderTestCase(TestCase):
+    def assertIdentical(self, a: Any, b: Any, path: str = 'item'):
+        """Compares two model trees by types and instance dictionaries,
+        which is stricter than model equality."""
+        self.assertIs(type(a), type(b), path)
+        if isinstance(a, BaseModel):
+            self.assertEqual(a.__fields_set__, b.__fields_set__, path)
+            self.assertEqual(set(a.__dict__), set(b.__dict__), path)
+            for key in a.__dict__:
+                self.assertIdentical(
+                    a.__dict__[key], b.__dict__[key], f'{path}.{key}')
+        elif dataclasses.is_dataclass(a):
+            self.assertEqual(list(a.__dict__), list(b.__dict__), path)
+            for key in a.__dict__:
+                self.assertIdentical(
+                    a.__dict__[key], b.__dict__[key], f'{path}.{key}')
+        elif isinstance(a, dict):
+            self.assertEqual(list(a), list(b), path)
+            for key in a:
+                self.assertIdentical(a[key], b[key], f'{path}.{key}')
+        elif isinstance(a, list):
+            self.assertEqual(len(a), len(b), path)
+            for i, (x, y) in enumerate(zip(a, b)):
+                self.assertIdentical(x, y, f'{path}[{i}]')
+        else:
+            self.assertEqual(a, b, path)
+
+    def assertParity(self, data: Dict[str, Any]):
+        self.assertIdentical(load_fast(data), BibliographicItem(**data))
+
+    def test_fixtures_parity(self):
+        for name, _, data in iter_documents(FIXTURES_DIR):
+            with self.subTest(name=name):
+                self.assertParity(data)
+
+    def test_fixtures_take_fast_path(self):
+        with mock.patch.object(fastload, '_GIVE_UP', ()):
+            for name, _, data in iter_documents(FIXTURES_DIR):
+                with self.subTest(name=name):
+                    self.assertIsInstance(load_fast(data), BibliographicItem)
+
+    def test_coercion_parity(self):
+        self.assertParity({
+            'docid': [{'id': 1, 'type': 'IETF', 'primary': 'yes'}],
+            'docnumber': 123,
+            'edition': {'content': 2.5},
+            'language': 'en',
+            'script': ['Latn', 1],
+            'version': [{'draft': 34}],
+        })
+
+    def test_single_or_list_parity(self):
+        for value in (
+            {'content': 'Title'},
+            [{'content': 'Title'}],
+            ['Title'],
+            ('Title', 'text/plain'),
+            [],
+        ):
+            with self.subTest(value=value):
+                self.assertParity(_minimal(title=value, abstract=value))
+
+    def test_series_title_quirk_parity(self):
+        # A list of strings is taken as positional arguments
+        self.assertParity(_minimal(series=[
+            {'title': ['IEEE', 'text/plain']},
+            {'title': [{'content': 'IEEE'}], 'formattedref': 'Series 1'},
+            {'title': {'content': 'Series'}, 'unknown': 'ignored'},
+        ]))
+
+    def test_dates_parity(self):
+        for value in (
+            '1969-04-01',
+            datetime.date(1969, 4, 1),
+            '1969-04',
+            'April 1969',
+            '1969',
+            '1000000000',
+        ):
+            with self.subTest(value=value):
+                self.assertParity(_minimal(
+                    date=[{'type': 'published', 'value': value}],
+                    revdate=value,
+                    fetched=datetime.date(2022, 1, 1),
+                ))
+        self.assertParity(_minimal(revdate=['2020', None, '2021-03-04']))
+        self.assertParity(_minimal(fetched='2022-01-01'))
+
+    def test_extent_parity(self):
+        stack = _minimal(extent={
+            'locality': [{'type': 'page', 'reference_from': '1'}],
+        })
+        single = _minimal(extent={'type': 'page', 'reference_from': '1'})
+
+        self.assertParity(stack)
+        self.assertParity(single)
+        self.assertIsInstance(load_fast(stack).extent, LocalityStack)
+        self.assertIsInstance(load_fast(single).extent, Locality)
+
+    def test_extra_fields_parity(self):
+        self.assertParity(_minimal(
+            custom={'a': 1},
+            relation=[{
+                'type': 'includes',
+                'bibitem': _minimal(note='extra'),
+                'custom': True,
+            }],
+        ))
+
+    def test_instances_parity(self):
+        self.assertParity({
+            'docid': [DocID(id='RFC 1', type='IETF')],
+            'relation': [{
+                'type': 'includes',
+                'bibitem': BibliographicItem(**_minimal()),
+            }],
+        })
+
+    def test_copyright_parity(self):
+        self.assertParity(_minimal(copyright=[{
+            'from': '2000',
+            'owner': [{'name': {'completename': {'content': 'A'}}}],
+        }]))
+
+    def test_validation_errors_match(self):
+        cases: Tuple[Dict[str, Any], ...] = (
+            {},
+            {'docid': {'id': 'RFC 1', 'type': 'IETF'}},
+            {'docid': [{'id': 'RFC 1', 'type': 'IETF', 'unknown': 1}]},
+            _minimal(date=[{'type': 'published', 'value': 'soon'}]),
+            _minimal(title=[{'content': 'A'}, None]),
+            _minimal(fetched='yesterday'),
+            _minimal(contributor=[{'role': 'author'}]),
+        )
+        for data in cases:
+            with self.subTest(data=data):
+                with self.assertRaises(ValidationError) as expected:
+                    BibliographicItem(**data)
+                with self.assertRaises(ValidationError) as actual:
+                    load_fast(data)
+                self.assertEqual(
+                    actual.exception.errors(),
+                    expected.exception.errors())
+
+    def test_other_models(self):
+        docid = load_fast({'id': 'RFC 1', 'type': 'IETF'}, DocID)
+        self.assertEqual(docid, DocID(id='RFC 1', type='IETF'))
+
+    def test_source(self):
+        source = loader_source()
+        self.assertIn('def _load_BibliographicItem(v):', source)
+        self.assertIn('def _load_DocID(v):', source)
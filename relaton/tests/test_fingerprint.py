@@ -0,0 +1,96 @@
+import datetime
+from typing import Any, Dict
+from unittest import TestCase
+
+from relaton.io import load_items
+from relaton.models import BibliographicItem, DocID
+from relaton.models.canonical import load_canonical
+from relaton.models.compact import load_compact
+from relaton.models.fingerprint import (
+    DIGEST_SIZE,
+    field_fingerprints,
+    fingerprint,
+)
+from relaton.models.frozen import freeze, load_frozen
+from relaton.models.lazy import load_lazy
+
+from .test_io import FIXTURES_DIR
+
+
+class FingerprintTestCase(TestCase):
+    def setUp(self):
+        self.items = list(load_items(FIXTURES_DIR))
+        self.fingerprints = [fingerprint(item) for item in self.items]
+
+    def test_distinct(self):
+        self.assertEqual(len(set(self.fingerprints)), len(self.items))
+        for value in self.fingerprints:
+            self.assertEqual(len(value), DIGEST_SIZE * 2)
+
+    def test_stable(self):
+        # Must not depend on the process (e.g., on string hashing)
+        item = BibliographicItem(
+            docid=[DocID(id='RFC 1', type='IETF')],
+            fetched=datetime.date(2022, 1, 1),
+        )
+        self.assertEqual(
+            fingerprint(item),
+            '84b9e9c479202d57d3100f82710784ae')
+
+    def test_variants(self):
+        for factory in (load_frozen, load_lazy, load_compact, load_canonical):
+            with self.subTest(factory=factory.__name__):
+                self.assertEqual(
+                    [fingerprint(item) for item in load_items(
+                        FIXTURES_DIR, factory=factory)],
+                    self.fingerprints)
+
+    def test_content_only(self):
+        data: Dict[str, Any] = {
+            'docid': [{'id': 'RFC 1', 'type': 'IETF'}],
+            'title': {'content': 'Title'},
+        }
+        item = BibliographicItem(**data)
+        self.assertEqual(
+            fingerprint(BibliographicItem(**data, docnumber=None)),
+            fingerprint(item))
+        self.assertEqual(
+            fingerprint(BibliographicItem(**dict(
+                data,
+                title=[data['title']],
+            ))),
+            fingerprint(item))
+        self.assertNotEqual(
+            fingerprint(BibliographicItem(**data, docnumber='1')),
+            fingerprint(item))
+        self.assertNotEqual(
+            fingerprint(BibliographicItem(**dict(data, custom='1'))),
+            fingerprint(item))
+
+    def test_changes(self):
+        item = self.items[0]
+        before = field_fingerprints(item)
+        self.assertEqual(set(before), {
+            name for name, value in item if value is not None
+        })
+
+        item.docid[0].id = 'Changed'
+        self.assertNotEqual(fingerprint(item), self.fingerprints[0])
+        after = field_fingerprints(item)
+        self.assertEqual(
+            {name for name in before if before[name] != after[name]},
+            {'docid'})
+
+    def test_memoized_on_frozen(self):
+        item: Any = freeze(self.items[0])
+        self.assertEqual(fingerprint(item), self.fingerprints[0])
+        self.assertEqual(
+            fingerprint(item.docid[0]),
+            fingerprint(self.items[0].docid[0]))
+        self.assertEqual(item._fingerprint.hex(), self.fingerprints[0])
+
+    def test_unsupported(self):
+        with self.assertRaises(TypeError):
+            fingerprint(object())
+        with self.assertRaises(TypeError):
+            field_fingerprints('RFC 1')
@@ -0,0 +1,141 @@
+import dataclasses
+import io
+import pickle
+from typing import Any, Dict, List
+from unittest import TestCase
+
+import yaml
+
+from relaton.io import FlyweightRegistry, LoadError, load_items
+from relaton.io.flyweights import (
+    SharedOrganization,
+    SharedPerson,
+    SharedPersonAffiliation,
+)
+from relaton.models import BibliographicItem, Organization
+
+from .test_io import FIXTURES_DIR
+
+
+def _document(number: int) -> Dict[str, Any]:
+    return {
+        'docid': [{'id': f'RFC {number}', 'type': 'IETF'}],
+        'contributor': [{
+            'organization': {'name': [{'content': 'RFC Publisher'}]},
+            'role': [{'type': 'publisher'}],
+        }, {
+            'person': {
+                'name': {'completename': {'content': 'J. Postel'}},
+                'affiliation': [{
+                    'organization': {'name': {'content': 'ISI'}},
+                }],
+            },
+            'role': [{'type': 'author'}],
+        }],
+        'relation': [{
+            'type': 'updates',
+            'bibitem': {
+                'docid': [{'id': 'RFC 1', 'type': 'IETF'}],
+                'contributor': [{
+                    'organization': {'name': [{'content': 'RFC Publisher'}]},
+                    'role': [{'type': 'publisher'}],
+                }],
+            },
+        }],
+    }
+
+
+class FlyweightRegistryTestCase(TestCase):
+    def load(self, registry: FlyweightRegistry) -> List[BibliographicItem]:
+        return [
+            BibliographicItem(**registry.share_document(_document(number)))
+            for number in (2, 3)
+        ]
+
+    def test_organizations(self):
+        registry = FlyweightRegistry()
+        a, b = self.load(registry)
+        assert a.contributor and b.contributor and a.relation
+
+        publisher = a.contributor[0].organization
+        self.assertIsInstance(publisher, SharedOrganization)
+        self.assertIs(b.contributor[0].organization, publisher)
+        related = a.relation[0].bibitem.contributor
+        assert related
+        self.assertIs(related[0].organization, publisher)
+
+        person_a, person_b = a.contributor[1].person, b.contributor[1].person
+        assert person_a and person_b
+        self.assertIsNot(person_a, person_b)
+        self.assertIs(
+            person_a.affiliation[0].organization,  # type: ignore[index]
+            person_b.affiliation[0].organization)  # type: ignore[index]
+
+        # Publisher in both items and relations, ISI in both items
+        self.assertEqual((len(registry), registry.collapsed), (2, 4))
+
+    def test_persons(self):
+        registry = FlyweightRegistry(persons=True)
+        a, b = self.load(registry)
+        assert a.contributor and b.contributor
+        self.assertIsInstance(a.contributor[1].person, SharedPerson)
+        self.assertIs(a.contributor[1].person, b.contributor[1].person)
+
+    def test_affiliations(self):
+        registry = FlyweightRegistry(affiliations=True)
+        a, b = self.load(registry)
+        assert a.contributor and b.contributor
+        person_a, person_b = a.contributor[1].person, b.contributor[1].person
+        assert person_a and person_b and person_a.affiliation
+        self.assertIsNot(person_a, person_b)
+        self.assertIsInstance(
+            person_a.affiliation[0],  # type: ignore[index]
+            SharedPersonAffiliation)
+        self.assertIs(
+            person_a.affiliation[0],  # type: ignore[index]
+            person_b.affiliation[0])  # type: ignore[index]
+
+    def test_matches_regular_items(self):
+        registry = FlyweightRegistry(persons=True)
+        regular = list(load_items(FIXTURES_DIR))
+        shared = list(load_items(FIXTURES_DIR, flyweights=registry))
+        self.assertEqual(shared, regular)
+        self.assertGreater(registry.collapsed, 0)
+
+    def test_shared_instances(self):
+        registry = FlyweightRegistry()
+        org = registry.share(
+            SharedOrganization,
+            {'name': {'content': 'IETF'}, 'url': 'https://ietf.org'})
+        regular = Organization(
+            name={'content': 'IETF'},  # type: ignore[arg-type]
+            url='https://ietf.org')
+
+        self.assertEqual(org, regular)
+        self.assertEqual(regular, org)
+        self.assertEqual(pickle.loads(pickle.dumps(org)), org)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            org.url = None
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            del org.url
+
+    def test_distinguishes_types(self):
+        registry = FlyweightRegistry()
+        a = registry.share(SharedOrganization, {'name': {'content': '1'}})
+        b = registry.share(SharedOrganization, {'name': {'content': 1}})
+        self.assertIsNot(a, b)
+
+    def test_invalid_description(self):
+        invalid = _document(2)
+        invalid['contributor'][0]['organization'] = {'url': 'https://ietf.org'}
+        stream = io.StringIO(yaml.safe_dump_all([invalid, _document(3)]))
+        errors: List[LoadError] = []
+
+        items = list(load_items(
+            stream,
+            flyweights=FlyweightRegistry(),
+            on_error=errors.append))
+
+        self.assertEqual(len(items), 1)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].index, 0)
@@ -0,0 +1,139 @@
+import copy
+import dataclasses
+import json
+import pickle
+from typing import Any, Dict
+from unittest import TestCase
+
+from lxml import etree
+
+from relaton.io import AbstractStore, FlyweightRegistry, load_items
+from relaton.models import (
+    BibliographicItem,
+    DocID,
+    GenericStringValue,
+    Organization,
+)
+from relaton.models.compact import load_compact
+from relaton.models.frozen import (
+    FrozenBibliographicItem,
+    FrozenDict,
+    FrozenDocID,
+    FrozenGenericStringValue,
+    FrozenList,
+    FrozenOrganization,
+    freeze,
+    load_frozen,
+)
+from relaton.models.lazy import load_lazy
+from relaton.serializers.bibxml import serialize
+from relaton.util import as_list
+
+from .test_io import FIXTURES_DIR
+
+
+class FrozenTestCase(TestCase):
+    def setUp(self):
+        self.items = list(load_items(FIXTURES_DIR))
+        self.frozen = list(load_items(FIXTURES_DIR, factory=load_frozen))
+
+    def test_matches_regular_items(self):
+        for item, frozen in zip(self.items, self.frozen):
+            with self.subTest(docid=item.docid[0].id):
+                self.assertIsInstance(frozen, FrozenBibliographicItem)
+                self.assertEqual(frozen, item)
+                self.assertEqual(item, frozen)
+                self.assertEqual(
+                    json.loads(frozen.json()),
+                    json.loads(item.json()))
+                self.assertEqual(
+                    etree.tostring(serialize(frozen)),
+                    etree.tostring(serialize(item)))
+
+    def test_hash(self):
+        for item, frozen in zip(self.items, self.frozen):
+            with self.subTest(docid=item.docid[0].id):
+                again = freeze(item)
+                self.assertIsNot(again, frozen)
+                self.assertEqual(hash(again), hash(frozen))
+                self.assertEqual(again, frozen)
+        self.assertEqual(
+            len(set(self.frozen + [freeze(i) for i in self.items])),
+            len(self.items))
+
+    def test_immutable(self):
+        item = self.frozen[0]
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            item.docid = []
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            item.docid[0].id = 'Changed'
+        with self.assertRaises(TypeError):
+            item.docid.append(item.docid[0])
+        with self.assertRaises(TypeError):
+            FrozenDict(a=1)['b'] = 2
+
+    def test_copy_and_pickle(self):
+        for frozen in self.frozen:
+            hash(frozen)
+            for copied in (
+                copy.copy(frozen),
+                copy.deepcopy(frozen),
+                pickle.loads(pickle.dumps(frozen)),
+            ):
+                self.assertIs(type(copied), FrozenBibliographicItem)
+                self.assertEqual(copied, frozen)
+                self.assertEqual(hash(copied), hash(frozen))
+
+    def test_variants(self):
+        for factory in (load_lazy, load_compact):
+            with self.subTest(factory=factory.__name__):
+                items = list(load_items(FIXTURES_DIR, factory=factory))
+                frozen = [freeze(item) for item in items]
+                self.assertEqual(frozen, self.frozen)
+                self.assertIs(type(frozen[0].docid[0]), FrozenDocID)
+
+        flyweights = FlyweightRegistry()
+        with AbstractStore(min_size=0) as abstracts:
+            items = list(load_items(
+                FIXTURES_DIR,
+                flyweights=flyweights,
+                abstracts=abstracts))
+            frozen = [freeze(item) for item in items]
+        self.assertEqual(frozen, self.frozen)
+        for item in frozen:
+            for contributor in item.contributor or []:
+                if contributor.organization:
+                    self.assertIs(
+                        type(contributor.organization),
+                        FrozenOrganization)
+            values: Any = item.abstract
+            for abstract in as_list(values):
+                self.assertIs(type(abstract), FrozenGenericStringValue)
+
+    def test_leaves(self):
+        docid = FrozenDocID(id='RFC 1', type='IETF')
+        self.assertEqual(docid, DocID(id='RFC 1', type='IETF'))
+        self.assertNotEqual(docid, FrozenDocID(id='RFC 2', type='IETF'))
+        self.assertEqual({docid: 1}[freeze(DocID(id='RFC 1', type='IETF'))], 1)
+        self.assertEqual(dataclasses.replace(docid, id='RFC 2').id, 'RFC 2')
+        self.assertIs(freeze(docid), docid)
+
+        name = GenericStringValue(content='IETF')
+        org = FrozenOrganization(name=[name])
+        self.assertIsInstance(org, Organization)
+        self.assertIsInstance(org.name, FrozenList)
+        self.assertEqual(org, Organization(name=[name]))
+
+        with self.assertRaises(ValueError):
+            FrozenDocID(id=['RFC 1'], type='IETF')
+
+    def test_construct(self):
+        data: Dict[str, Any] = {
+            'docid': [{'id': 'RFC 1', 'type': 'IETF'}],
+            'title': {'content': 'Title'},
+            'custom': {'key': ['value']},
+        }
+        item = FrozenBibliographicItem(**data)
+        self.assertEqual(item, BibliographicItem(**data))
+        self.assertIsInstance(item.custom, FrozenDict)
+        self.assertEqual(hash(item), hash(load_frozen(data)))
@@ -0,0 +1,92 @@
+import io
+import sys
+from typing import Any, Dict
+from unittest import TestCase
+
+import yaml
+
+from relaton.io import StringTable, iter_documents, load_items
+
+from .test_io import FIXTURES_DIR
+
+
+def _document(**kwargs) -> Dict[str, Any]:
+    return dict(
+        docid=[{'id': 'RFC 1', 'type': 'IETF'}],
+        language=['en'],
+        contributor=[{
+            'organization': {
+                'name': [{'content': 'Internet Engineering Task Force'}],
+                'abbreviation': {'content': 'IETF'},
+                'uri': [{'content': 'https://www.ietf.org'}],
+                'contact': [{'phone': {'type': 'main', 'content': '+1 1'}}],
+            },
+            'role': [{'type': 'publisher'}],
+        }],
+        **kwargs)
+
+
+class StringTableTestCase(TestCase):
+    def test_intern(self):
+        strings = StringTable()
+        first = ''.join(['Internet', '-Draft'])
+        second = ''.join(['Internet', '-Draft'])
+        self.assertIsNot(first, second)
+
+        self.assertIs(strings.intern(first), strings.intern(second))
+        self.assertIs(strings.intern(second), sys.intern(first))
+        self.assertEqual(len(strings), 1)
+        self.assertEqual(strings.hits, 2)
+        self.assertEqual(strings.saved_bytes, 2 * sys.getsizeof(second))
+
+    def test_intern_document(self):
+        strings = StringTable()
+        documents = [
+            yaml.safe_load(yaml.safe_dump(_document(title='Host Software')))
+            for _ in range(2)
+        ]
+        for data in documents:
+            self.assertIs(strings.intern_document(data), data)
+
+        a, b = documents
+        self.assertIs(a['docid'][0]['type'], b['docid'][0]['type'])
+        self.assertIs(a['language'][0], b['language'][0])
+        self.assertIs(
+            a['contributor'][0]['organization']['name'][0]['content'],
+            b['contributor'][0]['organization']['name'][0]['content'])
+        self.assertIs(
+            a['contributor'][0]['role'][0]['type'],
+            b['contributor'][0]['role'][0]['type'])
+        org_a = a['contributor'][0]['organization']
+        org_b = b['contributor'][0]['organization']
+        self.assertIs(
+            org_a['abbreviation']['content'],
+            org_b['abbreviation']['content'])
+        self.assertIs(
+            org_a['contact'][0]['phone']['type'],
+            org_b['contact'][0]['phone']['type'])
+        # Identifiers, free text and contact details are left alone
+        self.assertIsNot(org_a['uri'][0]['content'], org_b['uri'][0]['content'])
+        self.assertIsNot(
+            org_a['contact'][0]['phone']['content'],
+            org_b['contact'][0]['phone']['content'])
+        self.assertNotIn('https://www.ietf.org', strings)
+        self.assertIsNot(a['docid'][0]['id'], b['docid'][0]['id'])
+        self.assertIsNot(a['title'], b['title'])
+        self.assertNotIn('RFC 1', strings)
+
+    def test_load_items(self):
+        stream = yaml.safe_dump_all(
+            [data for _, _, data in iter_documents(FIXTURES_DIR)] * 2)
+        strings = StringTable()
+
+        plain = list(load_items(io.StringIO(stream)))
+        interned = list(load_items(io.StringIO(stream), strings=strings))
+
+        self.assertEqual(interned, plain)
+        self.assertGreater(strings.hits, 0)
+        self.assertGreater(strings.saved_bytes, 0)
+
+        half = len(interned) // 2
+        for a, b in zip(interned[:half], interned[half:]):
+            self.assertIs(a.docid[0].type, b.docid[0].type)
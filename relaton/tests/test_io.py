@@ -0,0 +1,287 @@
+import gzip
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from types import GeneratorType
+from typing import List
+from unittest import TestCase
+
+import yaml
+
+from relaton.io import (
+    ArchiveReader,
+    is_archive,
+    load_items,
+    iter_documents,
+    iter_yaml_files,
+    LoadError,
+    YAML_LOADER,
+)
+from relaton.models import BibliographicItem
+from relaton.serializers.bibxml import serialize
+
+try:
+    import zstandard  # noqa: F401
+except ImportError:
+    zstandard_available = False
+else:
+    zstandard_available = True
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'static', 'data')
+
+
+class LoaderTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.errors: List[LoadError] = []
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self.tmpdir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_uses_libyaml_when_available(self):
+        if yaml.__with_libyaml__:
+            self.assertIs(YAML_LOADER, yaml.CSafeLoader)
+        else:
+            self.assertIs(YAML_LOADER, yaml.SafeLoader)
+
+    def test_iter_yaml_files(self):
+        self._write('b/2.yaml', '')
+        self._write('a/1.yml', '')
+        self._write('a/ignored.txt', '')
+        self._write('.git/3.yaml', '')
+        self.assertEqual(
+            [os.path.relpath(p, self.tmpdir)
+             for p in iter_yaml_files(self.tmpdir)],
+            [os.path.join('a', '1.yml'), os.path.join('b', '2.yaml')])
+
+    def test_load_items_from_directory(self):
+        loaded = load_items(FIXTURES_DIR, on_error=self.errors.append)
+        self.assertIsInstance(loaded, GeneratorType)
+
+        items = list(loaded)
+        self.assertEqual(self.errors, [])
+        self.assertEqual(
+            len(items),
+            len(list(iter_yaml_files(FIXTURES_DIR))))
+        for item in items:
+            self.assertIsInstance(item, BibliographicItem)
+            serialize(item)
+
+    def test_load_items_from_multidocument_stream(self):
+        stream = io.StringIO(
+            "---\ndocid: [{id: A, type: T}]\n"
+            "---\n"
+            "---\ndocid: [{id: B, type: T}]\n")
+        self.assertEqual(
+            [item.docid[0].id for item in load_items(stream)],
+            ['A', 'B'])
+
+    def test_load_items_reports_errors_and_continues(self):
+        self._write('1.yaml', "docid: [{id: A, type: T}]\n")
+        self._write('2.yaml', "docid: [{id: B}]\n")
+        self._write('3.yaml', "docid: [unclosed\n")
+        self._write('4.yaml', "- not a mapping\n")
+        self._write('5.yaml', "docid: [{id: C, type: T}]\n")
+
+        items = list(load_items(self.tmpdir, on_error=self.errors.append))
+
+        self.assertEqual([i.docid[0].id for i in items], ['A', 'C'])
+        self.assertEqual(
+            [os.path.basename(e.source) for e in self.errors],
+            ['2.yaml', '3.yaml', '4.yaml'])
+        self.assertIsInstance(self.errors[0].__cause__, ValueError)
+        self.assertIsInstance(self.errors[1].__cause__, yaml.YAMLError)
+
+    def test_load_items_logs_errors_by_default(self):
+        self._write('1.yaml', "docid: [{id: B}]\n")
+        with self.assertLogs('relaton.io', level='WARNING'):
+            self.assertEqual(list(load_items(self.tmpdir)), [])
+
+    def test_load_items_with_custom_factory(self):
+        self._write('1.yaml', "docid: [{id: A, type: T}]\n")
+        self.assertEqual(
+            list(load_items(self.tmpdir, factory=lambda d: d['docid'])),
+            [[{'id': 'A', 'type': 'T'}]])
+
+    def test_iter_documents(self):
+        path = self._write('1.yaml', "---\nfoo: 1\n---\nbar: 2\n")
+        self.assertEqual(list(iter_documents(path)), [
+            (path, 0, {'foo': 1}),
+            (path, 1, {'bar': 2}),
+        ])
+
+    def test_iter_documents_with_keys(self):
+        path = self._write('1.yaml', (
+            "---\n"
+            "foo: &a {x: 1}\n"
+            "bar: *a\n"
+            "baz: [!!python/object:object {}]\n"
+            "---\n"
+            "[1, 2]\n"
+        ))
+        # Dropped values aren’t constructed, so an unsafe tag is ignored
+        self.assertEqual(list(iter_documents(path, keys=['bar'])), [
+            (path, 0, {'bar': {'x': 1}}),
+            (path, 1, [1, 2]),
+        ])
+
+
+class ArchiveTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.expected_docids = [
+            item.docid[0].id
+            for item in load_items(FIXTURES_DIR)
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _make_tarball(self, name: str, mode: str) -> str:
+        path = os.path.join(self.tmpdir, name)
+        with tarfile.open(path, mode) as tf:
+            tf.add(FIXTURES_DIR, arcname='data')
+        return path
+
+    def _make_zip(self, name: str) -> str:
+        path = os.path.join(self.tmpdir, name)
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for file_path in iter_yaml_files(FIXTURES_DIR):
+                zf.write(file_path, os.path.join(
+                    'data',
+                    os.path.relpath(file_path, FIXTURES_DIR)))
+        return path
+
+    def _make_zstd_tarball(self, name: str) -> str:
+        import zstandard
+        plain = self._make_tarball('plain.tar', 'w')
+        path = os.path.join(self.tmpdir, name)
+        with open(plain, 'rb') as src, open(path, 'wb') as dst:
+            zstandard.ZstdCompressor().copy_stream(src, dst)
+        return path
+
+    def _archives(self) -> List[str]:
+        archives = [
+            self._make_tarball('data.tar', 'w'),
+            self._make_tarball('data.tar.gz', 'w:gz'),
+            self._make_tarball('data.tar.xz', 'w:xz'),
+            self._make_zip('data.zip'),
+        ]
+        if zstandard_available:
+            archives.append(self._make_zstd_tarball('data.tar.zst'))
+        return archives
+
+    def test_is_archive(self):
+        self.assertTrue(is_archive('data.tar.gz'))
+        self.assertTrue(is_archive('data.tar.zst'))
+        self.assertTrue(is_archive('data.ZIP'))
+        self.assertFalse(is_archive('data.yaml'))
+
+    def test_load_items_from_archives(self):
+        for path in self._archives():
+            with self.subTest(path=path):
+                errors: List[LoadError] = []
+                items = list(load_items(path, on_error=errors.append))
+                self.assertEqual(errors, [])
+                self.assertEqual(
+                    sorted(item.docid[0].id for item in items),
+                    sorted(self.expected_docids))
+
+    def test_archive_document_source_names(self):
+        path = self._make_zip('data.zip')
+        names = [name for name, _, _ in iter_documents(path)]
+        self.assertIn(
+            f'{path}!data/rfcs/RFC8200.yaml',
+            names)
+
+    def test_load_items_from_gzipped_file(self):
+        path = os.path.join(self.tmpdir, 'RFC8200.yaml.gz')
+        with open(os.path.join(FIXTURES_DIR, 'rfcs', 'RFC8200.yaml'), 'rb') as src:
+            with gzip.open(path, 'wb') as dst:
+                dst.write(src.read())
+        self.assertEqual(
+            [item.docid[0].id for item in load_items(path)],
+            ['RFC 8200'])
+
+    def test_corrupt_archive_is_reported(self):
+        path = os.path.join(self.tmpdir, 'data.tar.gz')
+        with open(path, 'wb') as f:
+            f.write(b'not a tarball')
+        errors: List[LoadError] = []
+        self.assertEqual(list(load_items(path, on_error=errors.append)), [])
+        self.assertEqual(len(errors), 1)
+
+    def test_archive_reader_random_access(self):
+        for path in self._archives():
+            with self.subTest(path=path), ArchiveReader(path) as archive:
+                index = archive.build_index()
+                self.assertIn('RFC 8200', index)
+                self.assertIn('10.17487/RFC8200', index)
+
+                # Go backwards, forcing compressed streams to rewind
+                for docid in reversed(self.expected_docids):
+                    item = archive.get(docid)
+                    self.assertIsInstance(item, BibliographicItem)
+                    self.assertEqual(item.docid[0].id, docid)
+
+                with self.assertRaises(KeyError):
+                    archive.get('RFC 0')
+
+    def test_archive_reader_seeks_zip_members(self):
+        path = self._make_zip('data.zip')
+        with ArchiveReader(path) as archive:
+            index = archive.build_index()
+            self.assertEqual(archive.get('RFC 8200').docid[0].id, 'RFC 8200')
+            # Central directory is not read
+            self.assertIsNone(archive._zipfile)
+
+            location = index['RFC 8200']
+            with self.assertRaises(ValueError):
+                archive.read_member(
+                    location._replace(offset=location.offset + 1))
+            with self.assertRaises(ValueError):
+                archive.read_member(location._replace(name='data/other.yaml'))
+
+    def test_archive_reader_multidocument_members(self):
+        stream = yaml.safe_dump_all([
+            data for _, _, data in iter_documents(FIXTURES_DIR)])
+        zip_path = os.path.join(self.tmpdir, 'stream.zip')
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr('data/items.yaml', stream)
+        tar_path = os.path.join(self.tmpdir, 'stream.tar.gz')
+        with tarfile.open(tar_path, 'w:gz') as tf:
+            tf.add(zip_path, arcname='unrelated.zip')
+            info = tarfile.TarInfo('data/items.yaml')
+            info.size = len(stream.encode('utf-8'))
+            tf.addfile(info, io.BytesIO(stream.encode('utf-8')))
+
+        for path in (zip_path, tar_path):
+            with self.subTest(path=path), ArchiveReader(path) as archive:
+                index = archive.build_index()
+                self.assertEqual(
+                    sorted({location.document for location in index.values()}),
+                    list(range(len(self.expected_docids))))
+                for docid in self.expected_docids:
+                    self.assertEqual(archive.get(docid).docid[0].id, docid)
+
+    def test_archive_reader_saved_index(self):
+        path = self._make_tarball('data.tar.gz', 'w:gz')
+        index_path = os.path.join(self.tmpdir, 'index.json')
+        with ArchiveReader(path) as archive:
+            archive.build_index()
+            archive.save_index(index_path)
+
+        index = ArchiveReader.load_index(index_path)
+        with ArchiveReader(path, index=index) as archive:
+            self.assertEqual(archive.get('BCP 3').docid[0].id, 'BCP 3')
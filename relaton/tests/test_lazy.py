@@ -0,0 +1,180 @@
+import copy
+import os
+import pickle
+from typing import Any, Callable, Dict, List
+from unittest import TestCase
+
+from lxml import etree
+from pydantic import ValidationError
+
+from relaton.io import iter_documents, load_items
+from relaton.models import BibliographicItem, Relation, Title
+from relaton.models.lazy import (
+    STUB_FIELDS,
+    LazyBibliographicItem,
+    defer_relations,
+    load_lazy,
+)
+from relaton.serializers.bibxml import serialize
+
+from .test_io import FIXTURES_DIR
+
+
+ITEM: Dict[str, Any] = {
+    'docid': [{'id': 'RFC 1', 'type': 'IETF'}],
+    'title': {'content': 'Title'},
+    'date': 'not a date',
+    'schema-version': 'v1.2.3',
+}
+
+
+class LazyBibliographicItemTestCase(TestCase):
+    def test_matches_regular_items(self):
+        items = list(load_items(FIXTURES_DIR))
+        lazy = [load_lazy(data) for _, _, data in iter_documents(FIXTURES_DIR)]
+        self.assertEqual(len(lazy), len(items))
+
+        for item, lazy_item in zip(items, lazy):
+            with self.subTest(docid=item.docid[0].id):
+                self.assertIsInstance(lazy_item, BibliographicItem)
+                self.assertTrue(lazy_item.pending_fields)
+                self.assertEqual(
+                    etree.tostring(serialize(lazy_item)),
+                    etree.tostring(serialize(item)))
+                self.assertEqual(lazy_item.json(), item.json())
+                self.assertEqual(lazy_item, item)
+                self.assertEqual(item, lazy_item)
+                self.assertEqual(
+                    lazy_item.__fields_set__,
+                    item.__fields_set__)
+
+    def test_validates_on_access(self):
+        item = LazyBibliographicItem(**ITEM)
+        self.assertEqual(item.docid[0].id, 'RFC 1')
+        self.assertEqual(item.pending_fields, {'title', 'date'})
+        self.assertIsNone(item.abstract)
+        self.assertEqual(getattr(item, 'schema-version'), 'v1.2.3')
+
+        title = item.title
+        self.assertEqual(title, Title(content='Title'))
+        self.assertIs(item.title, title)
+        self.assertEqual(item.pending_fields, {'date'})
+
+        with self.assertRaises(AttributeError):
+            item.nonexistent
+
+    def test_invalid_pending_field(self):
+        item = LazyBibliographicItem(**ITEM)
+
+        with self.assertRaises(ValidationError) as cm:
+            item.date
+        self.assertEqual({e['loc'] for e in cm.exception.errors()}, {('date',)})
+        self.assertEqual(item.pending_fields, {'title', 'date'})
+
+        with self.assertRaises(ValidationError):
+            item.dict()
+
+    def test_invalid_docid(self):
+        with self.assertRaises(ValidationError):
+            load_lazy({'title': {'content': 'Title'}})
+        with self.assertRaises(ValidationError):
+            load_lazy({'docid': 'RFC 1'})
+
+    def test_assignment(self):
+        item = LazyBibliographicItem(**ITEM)
+        item.date = None
+        self.assertNotIn('date', item.pending_fields)
+        self.assertIsNone(item.materialize().date)
+
+    def test_copies(self):
+        _, _, data = next(iter_documents(FIXTURES_DIR))
+        item = BibliographicItem(**data)
+        copies: List[Callable[[Any], Any]] = [
+            copy.copy,
+            copy.deepcopy,
+            lambda i: i.copy(),
+            lambda i: pickle.loads(pickle.dumps(i)),
+        ]
+        for make_copy in copies:
+            with self.subTest(make_copy=make_copy):
+                self.assertEqual(make_copy(load_lazy(data)), item)
+
+    def test_relation(self):
+        _, _, data = next(iter_documents(FIXTURES_DIR))
+        lazy_item = load_lazy(data)
+        relation = Relation(type='includes', bibitem=lazy_item)
+
+        # Reading from the copy made by validation, then from the original
+        self.assertEqual(relation.bibitem.title, lazy_item.title)
+        self.assertEqual(relation.bibitem.dict(), lazy_item.dict())
+
+
+SUBSERIES = os.path.join(FIXTURES_DIR, 'rfcsubseries', 'BCP0003.yaml')
+
+
+def _subseries_data() -> Dict[str, Any]:
+    _, _, data = next(iter_documents(SUBSERIES))
+    # A constituent with a relation of its own
+    constituent = data['relation'][0]['bibitem']
+    constituent['relation'] = [{
+        'type': 'obsoletes',
+        'bibitem': {'docid': [{'id': 'RFC 1', 'type': 'IETF'}]},
+    }]
+    return data
+
+
+class DeferRelationsTestCase(TestCase):
+    def test_defer_relations(self):
+        item = BibliographicItem(**_subseries_data())
+        deferred = BibliographicItem(**defer_relations(_subseries_data()))
+
+        self.assertTrue(deferred.relation)
+        for relation in deferred.relation or []:
+            self.assertIsInstance(relation.bibitem, LazyBibliographicItem)
+        self.assertEqual(
+            etree.tostring(serialize(deferred)),
+            etree.tostring(serialize(item)))
+        self.assertEqual(deferred, item)
+
+    def test_depth(self):
+        data = _subseries_data()
+        original = data['relation'][0]['bibitem']
+        data = defer_relations(data, depth=1)
+        constituent = data['relation'][0]['bibitem']
+        self.assertIsInstance(constituent, dict)
+        self.assertIsInstance(
+            constituent['relation'][0]['bibitem'],
+            LazyBibliographicItem)
+        # Nested documents are copied rather than modified
+        self.assertIsInstance(original['relation'][0]['bibitem'], dict)
+        self.assertEqual(
+            BibliographicItem(**data),
+            BibliographicItem(**_subseries_data()))
+
+    def test_stubs(self):
+        data = defer_relations(_subseries_data(), stub=True)
+        for relation in data['relation']:
+            self.assertLessEqual(set(relation['bibitem']), set(STUB_FIELDS))
+        item = BibliographicItem(**data)
+        self.assertEqual(
+            [r.bibitem.docid for r in item.relation or []],
+            [r.bibitem.docid
+             for r in BibliographicItem(**_subseries_data()).relation or []])
+
+    def test_invalid_related_item(self):
+        data = _subseries_data()
+        del data['relation'][0]['bibitem']['docid']
+        with self.assertRaises(ValidationError) as cm:
+            BibliographicItem(**defer_relations(data))
+        self.assertEqual(
+            cm.exception.errors()[0]['loc'],
+            ('relation', 0, 'bibitem', 'docid'))
+
+    def test_lazy_item_relations(self):
+        item = load_lazy(_subseries_data())
+        constituent = (item.relation or [])[0].bibitem
+        self.assertIsInstance(constituent, LazyBibliographicItem)
+        self.assertIsInstance(
+            (constituent.relation or [])[0].bibitem,
+            LazyBibliographicItem)
+        self.assertEqual(item, BibliographicItem(**_subseries_data()))
@@ -0,0 +1,99 @@
+import os
+import platform
+from typing import Dict
+from unittest import SkipTest, TestCase, mock, skipUnless
+
+from relaton.benchmarks import regression
+from relaton.benchmarks.regression import (
+    WORKLOADS,
+    compare,
+    find_regressions,
+    get_tolerance,
+    load_baseline,
+    measure,
+)
+
+
+class BaselineTestCase(TestCase):
+    def test_baseline_covers_workloads(self):
+        self.assertEqual(
+            set(load_baseline()['ratios']),
+            set(WORKLOADS),
+            "Refresh with python -m relaton.benchmarks.regression --update")
+
+    def test_compare(self):
+        baseline = {'construct': 4.0, 'serialize': 2.0}
+        self.assertEqual(compare(
+            {'construct': 4.9, 'serialize': 2.6, 'new': 1.0},
+            baseline,
+            tolerance=0.25,
+        ), {'serialize': (2.0, 2.6)})
+        self.assertEqual(compare({'construct': 3.0}, baseline), {})
+
+    def test_detects_slowdown(self):
+        # Timed with fake durations, in seconds per call
+        durations = {'reference': 0.01, 'serialize': 0.02}
+
+        def fake_time(func, number):
+            return number * durations[
+                'reference' if func is regression._reference_loop
+                else func()]
+
+        with mock.patch.multiple(
+            regression,
+            _time=fake_time,
+            WORKLOADS={'serialize': lambda: lambda: 'serialize'},
+        ):
+            baseline = measure(['serialize'], repeat=3)
+            self.assertEqual(baseline, {'serialize': 2.0})
+
+            durations['serialize'] = 0.04
+            measured, regressions = find_regressions(baseline)
+            self.assertEqual(regressions, {'serialize': (2.0, 4.0)})
+
+            # Slower in first measurement only
+            measurements = iter([{'serialize': 4.0}, {'serialize': 2.1}])
+            with mock.patch.object(
+                regression, 'measure',
+                lambda *args: dict(next(measurements)),
+            ):
+                measured, regressions = find_regressions(baseline)
+            self.assertEqual(measured, {'serialize': 2.1})
+            self.assertEqual(regressions, {})
+
+
+@skipUnless(
+    os.environ.get('RELATON_PERF_TESTS'),
+    "Set RELATON_PERF_TESTS=1 to run performance regression tests")
+class PerformanceRegressionTestCase(TestCase):
+    baseline: Dict[str, float]
+    measured: Dict[str, float]
+    tolerance: float
+
+    @classmethod
+    def setUpClass(cls):
+        baseline = load_baseline()
+        if baseline['python'].rsplit('.', 1)[0] != \
+                platform.python_version().rsplit('.', 1)[0]:
+            raise SkipTest(
+                f"Baseline was measured on Python {baseline['python']}")
+        cls.baseline = baseline['ratios']
+        cls.tolerance = get_tolerance()
+        cls.measured, _ = find_regressions(
+            cls.baseline, tolerance=cls.tolerance)
+
+    def assertNotRegressed(self, workload: str):
+        expected, measured = self.baseline[workload], self.measured[workload]
+        self.assertLessEqual(
+            measured, expected * (1 + self.tolerance),
+            f"{workload} is {(measured / expected - 1) * 100:.0f}% slower "
+            f"than baseline")
+
+    def test_load_items(self):
+        self.assertNotRegressed('load_items')
+
+    def test_construct(self):
+        self.assertNotRegressed('construct')
+
+    def test_serialize(self):
+        self.assertNotRegressed('serialize')
@@ -0,0 +1,73 @@
+import io
+from typing import List
+from unittest import TestCase
+
+import yaml
+from pydantic import ValidationError
+
+from relaton.io import LoadError, iter_documents, load_items
+from relaton.models import BibliographicItem
+from relaton.models.projection import project, projection_model
+
+from .test_io import FIXTURES_DIR
+
+
+FIELDS = ['docid', 'title', 'date']
+
+
+class ProjectionTestCase(TestCase):
+    def test_projection_model(self):
+        model = projection_model(['title', 'docid', 'revdate'])
+        self.assertEqual(list(model.__fields__), ['docid', 'title', 'revdate'])
+        self.assertIs(model, projection_model({'docid', 'revdate', 'title'}))
+        for name, field in model.__fields__.items():
+            original = BibliographicItem.__fields__[name]
+            self.assertEqual(field.outer_type_, original.outer_type_)
+            self.assertEqual(field.required, original.required)
+
+        with self.assertRaises(ValueError):
+            projection_model(['docid', 'nonexistent'])
+
+    def test_project(self):
+        for _, _, data in iter_documents(FIXTURES_DIR):
+            item = BibliographicItem(**data)
+            projected = project(data, FIELDS + ['revdate'])
+            with self.subTest(docid=item.docid[0].id):
+                for name in FIELDS + ['revdate']:
+                    self.assertEqual(
+                        getattr(projected, name),
+                        getattr(item, name))
+                self.assertFalse(hasattr(projected, 'contributor'))
+
+        # Field validators apply
+        projected = project({'revdate': '2000-01'}, ['revdate'])
+        self.assertEqual(getattr(projected, 'revdate'), 'January 2000')
+        with self.assertRaises(ValidationError):
+            project({'title': {'content': 'A'}}, ['docid', 'title'])
+
+    def test_load_items_with_fields(self):
+        documents = [data for _, _, data in iter_documents(FIXTURES_DIR)]
+        documents.append({'docid': 'invalid', 'contributor': 'invalid'})
+        stream = yaml.safe_dump_all(documents)
+        errors: List[LoadError] = []
+
+        items = list(load_items(FIXTURES_DIR))
+        projected = list(load_items(
+            io.StringIO(stream),
+            fields=FIELDS,
+            on_error=errors.append))
+
+        self.assertEqual(len(projected), len(items))
+        for item, projection in zip(items, projected):
+            self.assertEqual(
+                projection.dict(),
+                item.dict(include=set(FIELDS)))
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].index, len(items))
+
+    def test_load_items_with_fields_and_factory(self):
+        self.assertEqual(
+            [data for data in load_items(
+                FIXTURES_DIR, fields=['docid'], factory=lambda d: d)],
+            [{'docid': data['docid']}
+             for _, _, data in iter_documents(FIXTURES_DIR)])
@@ -2,7 +2,7 @@ import os
 from copy import copy
 from io import StringIO
 from typing import Dict, List, Any, cast
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from lxml import etree
 
@@ -282,6 +282,18 @@ class SerializerTestCase(TestCase):
             date.get(date.keys()[0]), data["date"][0]["value"].split("-")[0]
         )
 
+    def test_create_reference_does_not_parse_relaxed_dates(self):
+        data = copy(self.bibitem_reference_data)
+        data["date"] = [{"type": "published", "value": "1996-02"}]
+        new_bibitem = BibliographicItem(**data)
+        with mock.patch(
+            "relaton.serializers.bibxml.reference.parse_relaxed_date",
+        ) as parse:
+            reference = create_reference(new_bibitem)
+        parse.assert_not_called()
+        date = reference.getchildren()[0].getchildren()[2]
+        self.assertEqual(dict(date.attrib), {"year": "1996", "month": "February"})
+
     def test_create_reference_for_IANA_entries_should_not_include_dates(self):
         data = copy(self.bibitem_reference_data)
         data["docid"][0]["type"] = "IANA"
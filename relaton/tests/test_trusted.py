@@ -0,0 +1,120 @@
+import datetime
+import json
+from typing import Any, Dict
+from unittest import TestCase
+
+from relaton.io import load_items
+from relaton.models import (
+    BibliographicItem,
+    Contributor,
+    Date,
+    DocID,
+    GenericStringValue,
+    Organization,
+    Person,
+)
+from relaton.models.dates import RelaxedDate
+from relaton.models.trusted import construct_trusted
+from relaton.serializers.bibxml import serialize
+
+from lxml import etree
+
+from .test_io import FIXTURES_DIR
+
+
+class TrustedConstructionTestCase(TestCase):
+    def setUp(self):
+        self.items = list(load_items(FIXTURES_DIR))
+
+    def test_matches_validated_items(self):
+        for item in self.items:
+            with self.subTest(docid=item.docid[0].id):
+                stored: Dict[str, Any] = json.loads(item.json())
+                constructed: BibliographicItem = construct_trusted(stored)
+
+                self.assertIsInstance(constructed, BibliographicItem)
+                self.assertEqual(constructed, item)
+                self.assertEqual(json.loads(constructed.json()), stored)
+                self.assertEqual(
+                    etree.tostring(serialize(constructed)),
+                    etree.tostring(serialize(item)))
+
+    def test_builds_nested_models(self):
+        item: BibliographicItem = construct_trusted({
+            'docid': [{'id': 'RFC 1', 'type': 'IETF', 'primary': True}],
+            'date': {'type': 'published', 'value': '1969-04-01'},
+            'fetched': '2022-01-01',
+            'contributor': [{
+                'person': {'name': {'completename': {'content': 'A'}}},
+                'role': [{'type': 'author'}],
+            }],
+            'copyright': [{
+                'from': 2000,
+                'owner': [
+                    {'name': {'completename': {'content': 'B'}}},
+                    {'name': [{'content': 'IETF'}]},
+                ],
+            }],
+            'relation': [{
+                'type': 'includes',
+                'bibitem': {'docid': [{'id': 'RFC 2', 'type': 'IETF'}]},
+            }],
+        })
+
+        self.assertIsInstance(item.docid[0], DocID)
+        self.assertIsNone(item.docid[0].scope)
+        assert isinstance(item.date, Date)
+        self.assertEqual(item.date.value, datetime.date(1969, 4, 1))
+        self.assertEqual(item.fetched, datetime.date(2022, 1, 1))
+        assert item.contributor is not None
+        self.assertIsInstance(item.contributor[0], Contributor)
+        self.assertIsInstance(item.contributor[0].person, Person)
+        assert isinstance(item.copyright, list)
+        owners = item.copyright[0]['owner']
+        self.assertIsInstance(owners[0], Person)
+        self.assertIsInstance(owners[1], Organization)
+        assert item.relation is not None
+        self.assertIsInstance(item.relation[0].bibitem, BibliographicItem)
+        self.assertEqual(item.relation[0].bibitem.docid[0].id, 'RFC 2')
+
+    def test_keeps_extra_fields(self):
+        item: BibliographicItem = construct_trusted({
+            'docid': [{'id': 'A', 'type': 'T'}],
+            'schema-version': 'v1',
+        })
+        self.assertEqual(getattr(item, 'schema-version'), 'v1')
+        self.assertEqual(item.dict()['schema-version'], 'v1')
+
+    def test_builds_relaxed_dates(self):
+        item: BibliographicItem = construct_trusted({
+            'docid': [{'id': 'A', 'type': 'T'}],
+            'date': [{'type': 'published', 'value': 'March 1997'}],
+            'revdate': ['1997', '1997-03-04'],
+        })
+        assert isinstance(item.date, list)
+        value = item.date[0].value
+        assert isinstance(value, RelaxedDate)
+        self.assertEqual(value.date, datetime.date(1997, 3, 1))
+        self.assertEqual(value.specificity, 'month')
+        self.assertIsInstance(item.revdate[0], RelaxedDate)  # type: ignore[index]
+        self.assertEqual(
+            item.revdate[1], datetime.date(1997, 3, 4))  # type: ignore[index]
+
+    def test_does_not_validate(self):
+        # Wouldn’t pass validation: date value is unparseable
+        item: BibliographicItem = construct_trusted({
+            'docid': [{'id': 'A', 'type': 'T'}],
+            'date': [{'type': 'published', 'value': 'someday'}],
+        })
+        assert isinstance(item.date, list)
+        self.assertEqual(item.date[0].value, 'someday')
+
+    def test_constructs_other_models(self):
+        org = construct_trusted(
+            {'name': {'content': 'IETF'}, 'url': 'https://ietf.org'},
+            Organization)
+        self.assertIsInstance(org, Organization)
+        self.assertEqual(org, Organization(
+            name=GenericStringValue(content='IETF'),
+            url='https://ietf.org',
+        ))
@@ -0,0 +1,167 @@
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+import yaml
+
+from .test_io import FIXTURES_DIR
+from relaton.benchmarks import SCHEMA_PATH
+from relaton.serializers.bibxml.validation import (
+    ValidationSummary,
+    find_sources,
+    main,
+    validate_corpora,
+)
+
+
+VALID = {
+    'docid': [{'id': 'X 1', 'type': 'X', 'primary': True}],
+    'title': [{'content': 'Title'}],
+    'link': [{'content': 'https://example.com/x1'}],
+}
+
+# Accepts <referencegroup> roots only
+REFERENCEGROUP_SCHEMA = """<?xml version="1.0"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="referencegroup"/>
+</xs:schema>
+"""
+
+
+class ValidationTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        shutil.copytree(
+            os.path.join(FIXTURES_DIR, 'rfcs'),
+            os.path.join(self.directory, 'relaton-data-rfcs', 'data'))
+
+        broken = os.path.join(self.directory, 'broken')
+        os.makedirs(broken)
+        documents = {
+            'valid.yaml': VALID,
+            'not-mapping.yaml': ['a list'],
+            'invalid.yaml': {'title': 'No docid'},
+            'no-author.yaml': dict(VALID, contributor=[{
+                'role': [{'type': 'author'}],
+            }]),
+        }
+        for name, data in documents.items():
+            with open(os.path.join(broken, name), 'w') as f:
+                yaml.safe_dump(data, f)
+        with open(os.path.join(broken, 'non-string-key.yaml'), 'w') as f:
+            yaml.safe_dump(VALID, f)
+            f.write('2020: x\n')
+        with open(os.path.join(broken, 'unparseable.yaml'), 'w') as f:
+            f.write('docid: [unclosed\n')
+
+        self.sources = find_sources([
+            os.path.join(self.directory, 'relaton-data-rfcs'),
+            f'misc={broken}',
+        ])
+
+    def test_find_sources(self):
+        self.assertEqual(self.sources, {
+            'rfcs': os.path.join(self.directory, 'relaton-data-rfcs', 'data'),
+            'misc': os.path.join(self.directory, 'broken'),
+        })
+
+    def test_validate_corpora(self):
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                summary = ValidationSummary()
+                for result in validate_corpora(
+                    self.sources, SCHEMA_PATH,
+                    workers=workers, chunksize=2,
+                ):
+                    summary.add(result)
+                self.assertEqual(dict(summary.items), {'rfcs': 2, 'misc': 6})
+                self.assertEqual(dict(summary.failed), {'rfcs': 0, 'misc': 5})
+                self.assertEqual(
+                    sorted(
+                        (stage, kind)
+                        for _, stage, kind in summary.group_counts),
+                    [
+                        ('construct', 'TypeError'),
+                        ('construct', 'docid: value_error.missing'),
+                        ('construct', 'not a mapping'),
+                        ('load', 'ParserError'),
+                        ('serialize', (
+                            'Unable to construct <author>: '
+                            'neither an organization nor a person')),
+                    ])
+
+    def test_schema_failures(self):
+        schema_path = os.path.join(self.directory, 'schema.xsd')
+        with open(schema_path, 'w') as f:
+            f.write(REFERENCEGROUP_SCHEMA)
+        results = list(validate_corpora(
+            {'rfcs': self.sources['rfcs']},
+            schema_path=schema_path,
+            workers=1))
+        failures = [f for result in results for f in result.failures]
+        self.assertEqual(len(failures), 2)
+        self.assertEqual(
+            {(f.stage, f.kind) for f in failures},
+            {('schema', 'SCHEMAV_CVC_ELT_1')})
+        # Element path rather than line, which serializations don’t have
+        self.assertTrue(failures[0].message.startswith('/reference: '))
+
+    def test_archive_members_are_validated_separately(self):
+        archive = os.path.join(self.directory, 'rfcs.tar.gz')
+        with tarfile.open(archive, 'w:gz') as tf:
+            tf.add(self.sources['rfcs'], arcname='data')
+        corrupt = os.path.join(self.directory, 'corrupt.tar.gz')
+        with open(corrupt, 'wb') as f:
+            f.write(b'not a tarball')
+
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = list(validate_corpora(
+                    {'rfcs': archive, 'corrupt': corrupt}, SCHEMA_PATH,
+                    workers=workers, chunksize=1))
+                self.assertEqual(
+                    sorted(
+                        (result.source, result.path, result.items)
+                        for result in results),
+                    [
+                        ('corrupt', corrupt, 1),
+                        ('rfcs', f'{archive}!data/RFC0001.yaml', 1),
+                        ('rfcs', f'{archive}!data/RFC8200.yaml', 1),
+                    ])
+                self.assertEqual(
+                    [f.stage for result in results for f in result.failures],
+                    ['load'])
+
+    def test_main(self):
+        path = os.path.join(self.directory, 'summary.json')
+        rfcs = os.path.join(self.directory, 'relaton-data-rfcs')
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(
+                main([
+                    rfcs, '--schema', SCHEMA_PATH,
+                    '--workers', '1', '--json', path,
+                ]), 0)
+        with open(path) as f:
+            self.assertEqual(json.load(f)['sources']['rfcs'], {
+                'items': 2,
+                'failed': 0,
+                'failures': [],
+            })
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main([
+                f"misc={self.sources['misc']}",
+                '--schema', SCHEMA_PATH,
+                '--workers', '1',
+            ])
+        self.assertEqual(status, 1)
+        self.assertIn('misc\tconstruct\tnot a mapping\t', output.getvalue())
+        self.assertIn('misc: 6 items, 5 failed', output.getvalue())
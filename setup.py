@@ -44,6 +44,11 @@ setup(
     license='BSD 2-clause',
     include_package_data=True,
     install_requires=requirements,
+    extras_require={
+        'zstd': ['zstandard'],
+        'numpy': ['numpy'],
+        'orjson': ['orjson'],
+    },
     tests_require=dev_requirements,
     packages=find_packages(include=['relaton', 'relaton.*']),
     zip_safe=False,